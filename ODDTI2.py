@@ -41,7 +41,34 @@ import random
 
 VALID = (0,1,2,3,4,5,6)
 
+# ---------- Output ----------
+# Game text goes through out(level, ...) into a buffer that is written
+# with one print() per ball, innings or match (FLUSH_EVERY; "line" prints
+# straight away).  Prompts flush first, so nothing shows up late.
+# VERBOSITY: 2 = every ball, 1 = toss/innings/match lines only,
+#            0 = scorecards and series result only.
+VERBOSITY = 2
+FLUSH_EVERY = "ball"
+_FLUSH_RANK = {"line": 0, "ball": 1, "innings": 2, "match": 3}
+_out = []
+
+def out(level, *args):
+    if level > VERBOSITY:
+        return
+    if FLUSH_EVERY == "line":
+        print(*args)
+    else:
+        _out.append(" ".join([str(a) for a in args]))
+
+def flush(point=None):
+    # point: "ball"/"innings"/"match" (written if FLUSH_EVERY is at or
+    # below it), or None to write now
+    if _out and (point is None or _FLUSH_RANK[point] >= _FLUSH_RANK[FLUSH_EVERY]):
+        print("\n".join(_out))
+        del _out[:]
+
 def prompt_choice(prompt, options):
+    flush()
     opts = [o.lower() for o in options]
     while True:
         r = input(prompt).strip().lower()
@@ -50,6 +77,7 @@ def prompt_choice(prompt, options):
         print("Invalid. try:", "/".join(options))
 
 def prompt_num(prompt):
+    flush()
     while True:
         s = input(prompt).strip()
         try:
@@ -61,113 +89,257 @@ def prompt_num(prompt):
             return v
         print("Enter number 0-6")
 
+# ---------- Event log ----------
+# No files on the calculator, so logging is off by default. On PC:
+#   import ODDTI2, oddti_events
+#   ODDTI2.EVENT_LOG = oddti_events.EventLog("oddti2_events.jsonl")
+EVENT_LOG = None
+
+def log_event(kind, **fields):
+    if EVENT_LOG is not None:
+        EVENT_LOG.emit(kind, **fields)
+
+# ---------- Ball log ----------
+# One byte per ball: batter move in the high nibble, bowler move in the
+# low nibble. Runs are not stored: batter's number, or 0 when out.
+# BallLog(5)  keeps only the last 5 balls (ring), BallLog() keeps all.
+# Indexing, slicing and iteration give (batter, bowler, runs) tuples,
+# the same as the old list of tuples.
+BALL_LOG_SIZE = 5   # balls kept per innings for the summary (None = all)
+
+def _unpack(b):
+    bat = b >> 4
+    bowl = b & 15
+    return (bat, bowl, 0 if bat == bowl else bat)
+
+class BallLog:
+    def __init__(self, size=None):
+        self.size = size
+        self.buf = bytearray(size) if size else bytearray()
+        self.balls = 0   # balls ever added (ring keeps the last `size`)
+
+    def add(self, bat, bowl):
+        if self.size:
+            self.buf[self.balls % self.size] = (bat << 4) | bowl
+        else:
+            self.buf.append((bat << 4) | bowl)
+        self.balls += 1
+
+    def append(self, ball):
+        self.add(ball[0], ball[1])
+
+    def __len__(self):
+        if self.size and self.balls > self.size:
+            return self.size
+        return self.balls
+
+    def _raw(self, i):
+        if self.size and self.balls > self.size:
+            i = (self.balls + i) % self.size
+        return self.buf[i]
+
+    def __getitem__(self, i):
+        n = len(self)
+        if isinstance(i, slice):
+            start, stop, step = i.start, i.stop, i.step or 1
+            if step > 0:
+                start = 0 if start is None else start
+                stop = n if stop is None else stop
+            else:
+                start = n - 1 if start is None else start
+                stop = -n - 1 if stop is None else stop
+            if start < 0:
+                start = max(start + n, -1 if step < 0 else 0)
+            if stop < 0:
+                stop = max(stop + n, -1)
+            start = min(start, n if step > 0 else n - 1)
+            stop = min(stop, n)
+            return [_unpack(self._raw(k)) for k in range(start, stop, step)]
+        if i < 0:
+            i += n
+        if i < 0 or i >= n:
+            raise IndexError("ball log index out of range")
+        return _unpack(self._raw(i))
+
+    def __iter__(self):
+        for k in range(len(self)):
+            yield _unpack(self._raw(k))
+
+    def __repr__(self):
+        return repr(self[:])
+
+# ---------- Players ----------
+# Either side is any object with these methods (same as the PC edition
+# and oddti_strategy.py):
+#   call_toss() -> "odd"/"even"     toss_number() -> 0-6
+#   elect() -> "bat"/"bowl"         play(role, runs_left) -> 0-6
+#   observe(role, own, other)       told both numbers after each ball
+# role is "bat" or "bowl"; runs_left is None outside a chase.
+class Human:
+    def call_toss(self):
+        return prompt_choice("Toss call (odd/even): ", ("odd","even"))
+    def toss_number(self):
+        return prompt_num("Your toss num 0-6: ")
+    def elect(self):
+        return prompt_choice("You choose bat or bowl? (bat/bowl): ", ("bat","bowl"))
+    def play(self, role, runs_left):
+        if role == "bat":
+            return prompt_num("Bat num 0-6: ")
+        return prompt_num("Bowl num 0-6: ")
+    def observe(self, role, own, other):
+        pass
+
+class RandomCPU:
+    def call_toss(self):
+        return random.choice(("odd","even"))
+    def toss_number(self):
+        return random.choice(VALID)
+    def elect(self):
+        return random.choice(("bat","bowl"))
+    def play(self, role, runs_left):
+        return random.choice(VALID)
+    def observe(self, role, own, other):
+        pass
+
+HUMAN = Human()
+CPU = RandomCPU()
+
 # ---------- Toss ----------
-def do_toss():
-    call = prompt_choice("Toss call (odd/even): ", ("odd","even"))
-    p = prompt_num("Your toss num 0-6: ")
-    c = random.choice(VALID)
+def do_toss(player=None, cpu=None):
+    player = player or HUMAN
+    cpu = cpu or CPU
+    call = player.call_toss()
+    p = player.toss_number()
+    c = cpu.toss_number()
     s = p + c
     parity = "even" if s%2==0 else "odd"
-    print("You",p,"CPU",c,"Sum:",s,parity)
+    out(1, "You",p,"CPU",c,"Sum:",s,parity)
     if parity == call:
-        print("You win toss")
+        out(1, "You win toss")
         who = "player"
+        pick = player.elect()
     else:
-        print("CPU wins toss")
+        out(1, "CPU wins toss")
         who = "cpu"
-    return who
+        pick = cpu.elect()
+        out(1, "CPU chooses to", pick)
+    # winner's bat/bowl goes in the toss event so a log replays in full
+    log_event("toss", call=call, player=p, cpu=c, winner=who, elect=pick)
+    return who, pick
 
 # ---------- Innings (interactive) ----------
-def play_innings(batting, target=None):
-    # returns (score, ball_log_list)
+def play_innings(batting, target=None, player=None, cpu=None):
+    # returns (score, ball_log)
+    player = player or HUMAN
+    cpu = cpu or CPU
     score = 0
-    ball_log = []  # list of tuples (batter_num, bowler_num, runs_added)
-    print("\n--- {} INNINGS ---".format("PLAYER" if batting=="player" else "CPU"))
+    ball_log = BallLog(BALL_LOG_SIZE)  # (batter_num, bowler_num, runs_added)
+    out(1, "\n--- {} INNINGS ---".format("PLAYER" if batting=="player" else "CPU"))
     while True:
+        need = None if target is None else target + 1 - score
         if batting == "player":
-            b = prompt_num("Bat num 0-6: ")
-            bowl = random.choice(VALID)
-            print("CPU bowls", bowl)
+            b = player.play("bat", need)
+            bowl = cpu.play("bowl", need)
+            out(2, "CPU bowls", bowl)
+            player.observe("bat", b, bowl)
+            cpu.observe("bowl", bowl, b)
+            log_event("ball", batting=batting, player=b, cpu=bowl,
+                      runs=0 if b == bowl else b, score=score + (0 if b == bowl else b))
             if b == bowl:
-                print("OUT! (you) Last ball:", b, "vs", bowl)
-                ball_log.append((b, bowl, 0))
+                out(2, "OUT! (you) Last ball:", b, "vs", bowl)
+                ball_log.add(b, bowl)
+                log_event("wicket", batting=batting, score=score)
+                flush("ball")
                 break
             score += b
-            ball_log.append((b, bowl, b))
-            print("Runs+", b, "Total:", score)
+            ball_log.add(b, bowl)
+            out(2, "Runs+", b, "Total:", score)
             if target is not None:
                 need = target + 1 - score
                 if need <= 0:
-                    print("Target achieved! 🎯")
+                    out(2, "Target achieved! 🎯")
+                    flush("ball")
                     break
-                print("Need", need, "more")
+                out(2, "Need", need, "more")
+            flush("ball")
         else:
-            bat = random.choice(VALID)
-            bowl = prompt_num("Bowl num 0-6: ")
-            print("CPU bats", bat)
+            bat = cpu.play("bat", need)
+            bowl = player.play("bowl", need)
+            out(2, "CPU bats", bat)
+            cpu.observe("bat", bat, bowl)
+            player.observe("bowl", bowl, bat)
+            log_event("ball", batting=batting, player=bowl, cpu=bat,
+                      runs=0 if bat == bowl else bat, score=score + (0 if bat == bowl else bat))
             if bat == bowl:
-                print("CPU OUT! Last ball:", bat, "vs", bowl)
-                ball_log.append((bat, bowl, 0))
+                out(2, "CPU OUT! Last ball:", bat, "vs", bowl)
+                ball_log.add(bat, bowl)
+                log_event("wicket", batting=batting, score=score)
+                flush("ball")
                 break
             score += bat
-            ball_log.append((bat, bowl, bat))
-            print("CPU +", bat, "Total:", score)
+            ball_log.add(bat, bowl)
+            out(2, "CPU +", bat, "Total:", score)
             if target is not None:
                 need = target + 1 - score
                 if need <= 0:
-                    print("CPU reached target")
+                    out(2, "CPU reached target")
+                    flush("ball")
                     break
-                print("CPU needs", need, "more")
-    print("--- innings end. Score:", score, "---\n")
+                out(2, "CPU needs", need, "more")
+            flush("ball")
+    log_event("innings_end", batting=batting, score=score, target=target)
+    out(1, "--- innings end. Score:", score, "---\n")
+    flush("innings")
     return score, ball_log
 
 # ---------- display helpers ----------
 def print_match_summary(player_score, cpu_score, player_batted_first, log_first=None, log_second=None):
     # show last-ball logs if available (short)
     if log_first or log_second:
-        print("\nBall logs (last few balls):")
+        out(1, "\nBall logs (last few balls):")
         if log_first:
-            print("Innings 1 last balls:", log_first[-5:])
+            out(1, "Innings 1 last balls:", log_first[-5:])
         if log_second:
-            print("Innings 2 last balls:", log_second[-5:])
-    print()
-    print("\n" + "="*28)
+            out(1, "Innings 2 last balls:", log_second[-5:])
+    out(0)
+    out(0, "\n" + "="*28)
     ord_text = "Player batted 1st" if player_batted_first else "CPU batted 1st"
-    print(ord_text)
-    print("-"*28)
-    print("Player :", player_score)
-    print("CPU    :", cpu_score)
+    out(0, ord_text)
+    out(0, "-"*28)
+    out(0, "Player :", player_score)
+    out(0, "CPU    :", cpu_score)
     if player_score > cpu_score:
-        print("Result : Player wins by", player_score - cpu_score, "runs")
+        out(0, "Result : Player wins by", player_score - cpu_score, "runs")
     elif cpu_score > player_score:
-        print("Result : CPU wins by", cpu_score - player_score, "runs")
+        out(0, "Result : CPU wins by", cpu_score - player_score, "runs")
     else:
-        print("Result : Match tied")
-    print("="*28)
+        out(0, "Result : Match tied")
+    out(0, "="*28)
 
 # ---------- Single match ----------
-def single_match():
-    toss_winner = do_toss()
+def single_match(player=None, cpu=None):
+    player = player or HUMAN
+    cpu = cpu or CPU
+    toss_winner, pick = do_toss(player, cpu)
     if toss_winner == "player":
-        pick = prompt_choice("You choose bat or bowl? (bat/bowl): ", ("bat","bowl"))
         player_first = (pick == "bat")
     else:
-        comp_choice = random.choice(("bat","bowl"))
-        print("CPU chooses to", comp_choice)
-        player_first = (comp_choice != "bat")
+        player_first = (pick != "bat")
 
     if player_first:
-        print("You bat first")
-        p_score, log1 = play_innings("player")
-        print("CPU needs", p_score + 1)
-        c_score, log2 = play_innings("computer", target=p_score)
+        out(1, "You bat first")
+        p_score, log1 = play_innings("player", None, player, cpu)
+        out(1, "CPU needs", p_score + 1)
+        c_score, log2 = play_innings("computer", p_score, player, cpu)
     else:
-        print("CPU bats first")
-        c_score, log1 = play_innings("computer")
-        print("You need", c_score + 1)
-        p_score, log2 = play_innings("player", target=c_score)
+        out(1, "CPU bats first")
+        c_score, log1 = play_innings("computer", None, player, cpu)
+        out(1, "You need", c_score + 1)
+        p_score, log2 = play_innings("player", c_score, player, cpu)
 
     print_match_summary(p_score, c_score, player_first, log1, log2)
+    flush("match")
+    log_event("match_end", player=p_score, cpu=c_score, player_batted_first=player_first)
     # return winner string for series bookkeeping
     if p_score > c_score:
         return "player", p_score, c_score
@@ -177,34 +349,36 @@ def single_match():
         return "tie", p_score, c_score
 
 # ---------- Best-of-3 ----------
-def best_of_three():
+def best_of_three(player=None, cpu=None):
     p_wins = 0
     c_wins = 0
     matches = []
     for i in range(1,4):
-        print("\n=== Match", i, "===")
-        winner, p_score, c_score = single_match()
+        out(1, "\n=== Match", i, "===")
+        winner, p_score, c_score = single_match(player, cpu)
         matches.append((winner, p_score, c_score))
         if winner == "player":
             p_wins += 1
         elif winner == "cpu":
             c_wins += 1
-        print("Series:", p_wins, "-", c_wins)
+        out(1, "Series:", p_wins, "-", c_wins)
         if p_wins == 2 or c_wins == 2:
             break
 
-    print("\n=== Series summary ===")
+    log_event("series_end", player_wins=p_wins, cpu_wins=c_wins, matches=len(matches))
+    out(0, "\n=== Series summary ===")
     for idx, m in enumerate(matches, start=1):
         w, ps, cs = m
         label = "Player" if w=="player" else "CPU" if w=="cpu" else "Tie"
-        print("M{}: {}  {}-{}".format(idx, label, ps, cs))
+        out(0, "M{}: {}  {}-{}".format(idx, label, ps, cs))
     if p_wins > c_wins:
-        print("Series winner: Player", p_wins, "to", c_wins)
+        out(0, "Series winner: Player", p_wins, "to", c_wins)
     elif c_wins > p_wins:
-        print("Series winner: CPU", c_wins, "to", p_wins)
+        out(0, "Series winner: CPU", c_wins, "to", p_wins)
     else:
-        print("Series ended tied", p_wins, "-", c_wins)
-    print()
+        out(0, "Series ended tied", p_wins, "-", c_wins)
+    out(0)
+    flush()
 
 # ---------- Main UI ----------
 def main():
@@ -0,0 +1,186 @@
+# ==========================================================
+# ⚡ ODDTI™ v2.3 — Batched multi-session predictor
+# Frequency + 1-step Markov tables for many sessions stacked in one
+# NumPy array, so a whole batch of predictions is one argmax and a
+# whole batch of updates is one scatter-add.
+# Platform: Python 3.8+ with NumPy (PC only)
+# ==========================================================
+#
+#   store = BatchPredictorStore()
+#   sid = store.add()                          # new session slot
+#   moves = store.predict(sids, prevs)         # prevs -1 = use last move
+#   store.update(sids, prevs, actuals)
+#   store.remove(sid)                          # slot goes back on the free list
+# Each slot has the ArrayPredictor layout: rows 0-6 are Markov rows,
+# row 7 the overall frequency, all starting at 1 (Laplace).
+# tests/test_batch.py checks it against ArrayPredictor under pytest.
+# ==========================================================
+
+import sys
+import time
+
+import numpy as np
+
+N = 7
+FREQ_ROW = N
+NO_MOVE = -1
+
+
+class BatchPredictorStore:
+    def __init__(self, capacity=1024, seed=None):
+        self.counts = np.ones((capacity, N + 1, N), dtype=np.int32)
+        self.last = np.full(capacity, NO_MOVE, dtype=np.int8)
+        self.active = np.zeros(capacity, dtype=bool)
+        # stack of free slots, lowest index on top so live slots stay packed
+        self.free = list(range(capacity - 1, -1, -1))
+        self.rng = np.random.default_rng(seed)
+
+    @property
+    def capacity(self):
+        return self.counts.shape[0]
+
+    def __len__(self):
+        return self.capacity - len(self.free)
+
+    # ---- sessions ----
+    def add(self):
+        """Claim a slot for a new session and return its id."""
+        if not self.free:
+            self._grow()
+        sid = self.free.pop()
+        self.counts[sid] = 1
+        self.last[sid] = NO_MOVE
+        self.active[sid] = True
+        return sid
+
+    def remove(self, sid):
+        if not self.active[sid]:
+            raise KeyError(f"session {sid} is not active")
+        self.active[sid] = False
+        self.free.append(sid)
+
+    def _grow(self):
+        old = self.capacity
+        new = max(1, old * 2)
+        counts = np.ones((new, N + 1, N), dtype=np.int32)
+        counts[:old] = self.counts
+        self.counts = counts
+        self.last = np.concatenate([self.last, np.full(new - old, NO_MOVE, dtype=np.int8)])
+        self.active = np.concatenate([self.active, np.zeros(new - old, dtype=bool)])
+        self.free.extend(range(new - 1, old - 1, -1))
+
+    # ---- batched predict / update ----
+    def _rows(self, sids, prevs):
+        if prevs is None:
+            rows = self.last[sids].astype(np.intp)
+        else:
+            prevs = np.asarray(prevs, dtype=np.intp)
+            rows = np.where(prevs < 0, self.last[sids], prevs)
+        rows[(rows < 0) | (rows >= N)] = FREQ_ROW
+        return rows
+
+    def predict(self, sids, prevs=None):
+        """
+        Most likely next move for every session in sids, ties broken
+        uniformly at random.  prevs (optional) gives each session's
+        previous move; -1 or omitted means its own last move.
+        """
+        sids = np.asarray(sids, dtype=np.intp)
+        table = self.counts[sids, self._rows(sids, prevs)]
+        # counts are integers, so noise < 1 only reorders tied maxima
+        noise = self.rng.random(table.shape)
+        return np.argmax(table + noise * 0.5, axis=1)
+
+    def update(self, sids, prevs, actuals):
+        """
+        Count actual moves for a batch of sessions (one ball each).
+        prevs of -1 skip the Markov update, like update(None, actual).
+        """
+        sids = np.asarray(sids, dtype=np.intp)
+        prevs = np.asarray(prevs, dtype=np.intp)
+        actuals = np.asarray(actuals, dtype=np.intp)
+        np.add.at(self.counts, (sids, FREQ_ROW, actuals), 1)
+        seen = (prevs >= 0) & (prevs < N)
+        np.add.at(self.counts, (sids[seen], prevs[seen], actuals[seen]), 1)
+        self.last[sids] = actuals
+
+    # ---- single-session helpers ----
+    def to_predictor(self, sid, pred=None):
+        """Copy one session into an ArrayPredictor."""
+        from oddti_predictors import ArrayPredictor
+        pred = pred or ArrayPredictor()
+        last = int(self.last[sid])
+        pred.load_counts(self.counts[sid].ravel().tolist(), None if last < 0 else last)
+        return pred
+
+    def add_from(self, pred):
+        """New session initialised from an ArrayPredictor's counts."""
+        sid = self.add()
+        self.counts[sid] = np.asarray(pred.counts, dtype=np.int32).reshape(N + 1, N)
+        last = pred.last_player_move
+        self.last[sid] = NO_MOVE if last is None else last
+        return sid
+
+# -----------------------------
+# Check + benchmark (python oddti_batch.py [sessions])
+# -----------------------------
+
+def check(sessions=500, balls=60, seed=1):
+    """Batch predictions must be among the per-session ArrayPredictor's ties."""
+    from oddti_predictors import ArrayPredictor
+    rng = np.random.default_rng(seed)
+    store = BatchPredictorStore(capacity=8, seed=seed)
+    sids = np.array([store.add() for _ in range(sessions)])
+    preds = [ArrayPredictor() for _ in range(sessions)]
+    prevs = np.full(sessions, NO_MOVE)
+    for _ in range(balls):
+        got = store.predict(sids)
+        for k, p in enumerate(preds):
+            row = p.last_player_move if p.last_player_move is not None else FREQ_ROW
+            if got[k] not in p.row_ties[row]:
+                raise AssertionError(f"session {k}: {got[k]} not in {p.row_ties[row]}")
+        actual = np.where(rng.random(sessions) < 0.5, (prevs + 1) % N,
+                          rng.integers(0, N, sessions))
+        store.update(sids, prevs, actual)
+        for k, p in enumerate(preds):
+            p.update(None if prevs[k] < 0 else int(prevs[k]), int(actual[k]))
+        prevs = actual
+    for sid in sids[::2]:
+        store.remove(sid)
+    again = [store.add() for _ in range(len(sids[::2]))]
+    if sorted(again) != sorted(sids[::2].tolist()) or store.capacity != 512:
+        raise AssertionError("free slots were not reused")
+    print(f"batch store agrees with ArrayPredictor on {sessions} sessions x {balls} balls")
+
+
+def benchmark(sessions=10000, rounds=50, seed=2):
+    from oddti_predictors import ArrayPredictor
+    rng = np.random.default_rng(seed)
+    store = BatchPredictorStore(capacity=sessions, seed=seed)
+    sids = np.array([store.add() for _ in range(sessions)])
+    moves = rng.integers(0, N, (rounds, sessions))
+    prevs = np.full(sessions, NO_MOVE)
+    t0 = time.perf_counter()
+    for r in range(rounds):
+        store.predict(sids)
+        store.update(sids, prevs, moves[r])
+        prevs = moves[r]
+    batch = time.perf_counter() - t0
+
+    preds = [ArrayPredictor() for _ in range(sessions)]
+    rows = moves.tolist()
+    t0 = time.perf_counter()
+    for r in range(rounds):
+        row = rows[r]
+        for k, p in enumerate(preds):
+            p.predict(p.last_player_move)
+            p.update(p.last_player_move, row[k])
+    loop = time.perf_counter() - t0
+    balls = sessions * rounds
+    print(f"{sessions} sessions: batch {balls / batch:,.0f} balls/sec, "
+          f"per-session loop {balls / loop:,.0f} balls/sec (x{loop / batch:.1f})")
+
+
+if __name__ == "__main__":
+    check()
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,476 @@
+# ==========================================================
+# ⚡ ODDTI™ v2.3 — Benchmark + regression suite
+# Fixed-seed, scripted benchmarks for the predictor, the CPU's move
+# choice, whole innings and matches in both editions, game output in
+# each FLUSH_EVERY/VERBOSITY mode, memory per session and module import
+# time, compared against a JSON baseline.
+# No external libs (stdlib only, PC only).
+# ==========================================================
+#
+#   python oddti_bench.py --save                 write oddti_bench_baseline.json
+#   python oddti_bench.py                        run, compare, exit 1 on regression
+#   python oddti_bench.py [--only predictor,match,render] [--threshold 0.25]
+#                         [--repeat 5] [--baseline FILE] [--out FILE]
+#
+# Every timing is the best of `repeat` runs (the machine is only ever
+# slower than its best, never faster).  A result regresses when it is
+# more than `threshold` (a fraction) worse than the baseline in its own
+# direction: rates must not drop, seconds and bytes must not grow.
+# Baselines are per machine; save one before and compare after a change.
+# ==========================================================
+
+import gc
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+
+from oddti_strategy import Discard, RandomStrategy, run_matches
+
+DEFAULT_BASELINE = "oddti_bench_baseline.json"
+SEED = 2025
+HERE = os.path.dirname(os.path.abspath(__file__))
+BENCHES = []
+
+
+def bench(name, unit, better="higher", group=None):
+    """Register fn() -> value.  better is "higher" (rates) or "lower"."""
+    def register(fn):
+        BENCHES.append((name, unit, better, group or name.split(".")[0], fn))
+        return fn
+    return register
+
+
+def _moves(n, seed=SEED):
+    """Scripted player moves: mostly habits with some noise, like a person."""
+    rng = random.Random(seed)
+    out, last = [], 3
+    for _ in range(n):
+        r = rng.random()
+        last = last if r < 0.3 else (last + 2) % 7 if r < 0.5 else rng.randrange(7)
+        out.append(last)
+    return out
+
+
+def _edition():
+    from oddti_edition import load_edition
+    game = load_edition()
+    game.LOG_EVENTS = False
+    game.TRACK_STATS = False
+    return game
+
+# -----------------------------
+# Predictor throughput
+# -----------------------------
+
+def _predictor_rate(make, balls=100000):
+    moves = _moves(balls)
+    random.seed(SEED)
+    pred = make()
+    predict, update = pred.predict, pred.update
+    prev = None
+    t0 = time.perf_counter()
+    for m in moves:
+        predict(prev)
+        update(prev, m)
+        prev = m
+    return balls / (time.perf_counter() - t0)
+
+
+@bench("predictor.Predictor", "balls/s")
+def bench_predictor_predictor():
+    return _predictor_rate(_edition().Predictor)
+
+
+@bench("predictor.ArrayPredictor", "balls/s")
+def bench_predictor_arraypredictor():
+    from oddti_predictors import ArrayPredictor
+    return _predictor_rate(ArrayPredictor)
+
+
+@bench("predictor.EnsemblePredictor", "balls/s")
+def bench_predictor_ensemblepredictor():
+    from oddti_predictors import EnsemblePredictor
+    return _predictor_rate(EnsemblePredictor)
+
+# -----------------------------
+# CPU move selection (predictor edition)
+# -----------------------------
+
+def _cpu_rate(choose, calls=100000):
+    game = _edition()
+    game.predictor.reset()
+    moves = _moves(200)
+    for prev, m in zip(moves, moves[1:]):
+        game.predictor.update(prev, m)
+    random.seed(SEED)
+    prev = game.predictor.last_player_move
+    t0 = time.perf_counter()
+    for k in range(calls):
+        choose(prev, (k & 31) + 1 if k & 1 else None, k & 63)
+    return calls / (time.perf_counter() - t0)
+
+
+@bench("cpu.bowl", "calls/s")
+def bench_cpu_bowl():
+    return _cpu_rate(_edition().cpu_choose_when_bowling)
+
+
+@bench("cpu.bat", "calls/s")
+def bench_cpu_bat():
+    return _cpu_rate(_edition().cpu_choose_when_batting)
+
+# -----------------------------
+# Whole innings and matches (scripted players, output discarded)
+# -----------------------------
+
+def _engine(label):
+    if label == "ODDTI2":
+        import ODDTI2
+        return ODDTI2
+    game = _edition()
+    game.predictor.reset()
+    return game
+
+
+def _innings_rate(label, innings=5000):
+    engine = _engine(label)
+    random.seed(SEED)
+    player = RandomStrategy(random.Random(SEED))
+    cpu = RandomStrategy(random.Random(SEED + 1)) if label == "ODDTI2" else None
+    t0 = time.perf_counter()
+    with redirect_stdout(Discard()):
+        for k in range(innings):
+            engine.play_innings("player" if k & 1 else "computer", None, player, cpu)
+    return innings / (time.perf_counter() - t0)
+
+
+def _match_rate(label, matches=3000):
+    engine = _engine(label)
+    random.seed(SEED)
+    player = RandomStrategy(random.Random(SEED))
+    cpu = RandomStrategy(random.Random(SEED + 1)) if label == "ODDTI2" else None
+    return matches / run_matches(engine, matches, player, cpu)[3]
+
+
+@bench("innings.ODDTI2", "innings/s")
+def bench_innings_oddti2():
+    return _innings_rate("ODDTI2")
+
+
+@bench("innings.edition", "innings/s")
+def bench_innings_edition():
+    return _innings_rate("edition")
+
+
+@bench("match.ODDTI2", "matches/s")
+def bench_match_oddti2():
+    return _match_rate("ODDTI2")
+
+
+@bench("match.edition", "matches/s")
+def bench_match_edition():
+    return _match_rate("edition")
+
+# -----------------------------
+# Game output per FLUSH_EVERY / VERBOSITY mode, timed over a pipe
+# -----------------------------
+# stdout is a line-buffered pipe into a reader process (like a terminal
+# or a piped log: every newline is a write).
+
+RENDER_MODES = (("line", 2), ("ball", 2), ("innings", 2), ("match", 2), ("match", 1), ("match", 0))
+RENDER_BALLS = 20000
+
+
+class _CountingStrategy(RandomStrategy):
+    def __init__(self, rng):
+        super().__init__(rng=rng)
+        self.balls = 0
+
+    def observe(self, role, own, other):
+        self.balls += 1
+
+
+def scripted_run(engine, balls, seed=SEED):
+    """Random v random single matches until `balls` balls; same balls every call."""
+    player = _CountingStrategy(random.Random(seed))
+    cpu = RandomStrategy(random.Random(seed + 1))
+    while player.balls < balls:
+        engine.single_match(player, cpu)
+    return player.balls
+
+
+def set_output(engine, flush_every, verbosity):
+    """Set the engine's output mode; returns the old (flush_every, verbosity)."""
+    old = engine.FLUSH_EVERY, engine.VERBOSITY
+    engine.FLUSH_EVERY, engine.VERBOSITY = flush_every, verbosity
+    return old
+
+
+def scripted_output(engine, flush_every, verbosity=2, balls=2000, seed=SEED):
+    """Everything a scripted run prints in one output mode."""
+    old = set_output(engine, flush_every, verbosity)
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            scripted_run(engine, balls, seed)
+    finally:
+        set_output(engine, *old)
+    return buf.getvalue()
+
+
+def _render_rate(label, flush_every, verbosity, balls=RENDER_BALLS):
+    engine = _engine(label)
+    sink = subprocess.Popen([sys.executable, "-c",
+                             "import sys\nwhile sys.stdin.buffer.read(65536): pass"],
+                            stdin=subprocess.PIPE)
+    pipe = io.TextIOWrapper(sink.stdin, encoding="utf-8", line_buffering=True)
+    old = set_output(engine, flush_every, verbosity)
+    try:
+        t0 = time.perf_counter()
+        with redirect_stdout(pipe):
+            n = scripted_run(engine, balls)
+        return n / (time.perf_counter() - t0)
+    finally:
+        set_output(engine, *old)
+        pipe.close()
+        sink.wait()
+
+
+for _label in ("ODDTI2", "edition"):
+    for _flush, _verbosity in RENDER_MODES:
+        bench(f"render.{_label}.{_flush}{_verbosity}", "balls/s")(
+            lambda label=_label, flush=_flush, verbosity=_verbosity:
+            _render_rate(label, flush, verbosity))
+
+# -----------------------------
+# Memory per session
+# -----------------------------
+
+def _bytes_each(make, count=300):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        keep = [make() for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del keep
+    return (after - before) / count
+
+
+@bench("memory.server_session", "bytes", "lower")
+def bench_memory_server_session():
+    """A server Session (own rng + ArrayPredictor) after a scripted series."""
+    from oddti_checkpoint import transcript
+    from oddti_server import Session
+    lines = [line for line, _ in transcript(SEED)]
+
+    def make():
+        s = Session(rng=random.Random(SEED))
+        s.start()
+        for line in lines:
+            s.feed(line)
+        return s
+    return _bytes_each(make)
+
+
+def _trained(make):
+    moves = _moves(500)
+
+    def build():
+        pred = make()
+        prev = None
+        for m in moves:
+            pred.update(prev, m)
+            prev = m
+        return pred
+    return build
+
+
+@bench("memory.Predictor", "bytes", "lower")
+def bench_memory_predictor():
+    return _bytes_each(_trained(_edition().Predictor))
+
+
+@bench("memory.ArrayPredictor", "bytes", "lower")
+def bench_memory_arraypredictor():
+    from oddti_predictors import ArrayPredictor
+    return _bytes_each(_trained(ArrayPredictor))
+
+
+@bench("memory.EnsemblePredictor", "bytes", "lower")
+def bench_memory_ensemblepredictor():
+    from oddti_predictors import EnsemblePredictor
+    return _bytes_each(_trained(EnsemblePredictor))
+
+
+def _ball_log(make, balls=1000):
+    """ODDTI2's innings log after `balls` balls (the old list of tuples or BallLog)."""
+    def build():
+        log = make()
+        for k in range(balls):
+            bat = (k * 5 + 3) % 7
+            bowl = (k * 3) % 7
+            log.append((bat, bowl, 0 if bat == bowl else bat))
+        return log
+    return build
+
+
+@bench("memory.ball_log_list", "bytes", "lower")
+def bench_memory_ball_log_list():
+    """Bytes per 1,000 balls as a list of (batter, bowler, runs) tuples."""
+    return _bytes_each(_ball_log(list), count=50)
+
+
+@bench("memory.BallLog_full", "bytes", "lower")
+def bench_memory_ball_log_full():
+    import ODDTI2
+    return _bytes_each(_ball_log(ODDTI2.BallLog), count=50)
+
+
+@bench("memory.BallLog_ring", "bytes", "lower")
+def bench_memory_ball_log_ring():
+    import ODDTI2
+    return _bytes_each(_ball_log(lambda: ODDTI2.BallLog(ODDTI2.BALL_LOG_SIZE)), count=50)
+
+# -----------------------------
+# Import / startup time (fresh interpreter per module)
+# -----------------------------
+
+IMPORT_SNIPPET = ("import sys, time; sys.path.insert(0, {here!r}); t = time.perf_counter(); "
+                  "{stmt}; print(time.perf_counter() - t)")
+
+
+def _import_seconds(stmt):
+    code = IMPORT_SNIPPET.format(here=HERE, stmt=stmt)
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                          cwd=HERE)
+    if proc.returncode:
+        return None     # optional dependency missing (NumPy modules)
+    return float(proc.stdout.split()[-1])
+
+
+def _import_modules():
+    mods = [("ODDTI2", "import ODDTI2"),
+            ("edition", "from oddti_edition import load_edition; load_edition()")]
+    for name in sorted(os.listdir(HERE)):
+        if name.startswith("oddti_") and name.endswith(".py") and name != "oddti_bench.py":
+            mod = name[:-3]
+            mods.append((mod, f"import {mod}"))
+    return mods
+
+
+for _mod, _stmt in _import_modules():
+    bench(f"import.{_mod}", "s", "lower", "import")(lambda stmt=_stmt: _import_seconds(stmt))
+
+# -----------------------------
+# Runner, baseline, comparison
+# -----------------------------
+
+def run(only=None, repeat=5, log=print):
+    """Run the (selected) benchmarks; returns {name: {value, unit, better}}."""
+    results = {}
+    for name, unit, better, group, fn in BENCHES:
+        if only and group not in only and name not in only:
+            continue
+        values = [v for v in (fn() for _ in range(1 if unit == "bytes" else repeat))
+                  if v is not None]
+        if not values:
+            log(f"{name:30} skipped (import failed)")
+            continue
+        value = max(values) if better == "higher" else min(values)
+        results[name] = {"value": value, "unit": unit, "better": better}
+        log(f"{name:30} {_fmt(value, unit)}")
+    return results
+
+
+def _fmt(value, unit):
+    if unit == "s":
+        return f"{value * 1e3:12.1f} ms"
+    return f"{value:14,.0f} {unit}"
+
+
+def save(results, path, repeat):
+    doc = {"meta": {"python": platform.python_version(), "machine": platform.machine(),
+                    "platform": platform.platform(), "seed": SEED, "repeat": repeat,
+                    "time": time.strftime("%Y-%m-%d %H:%M:%S")},
+           "results": results}
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=1, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def compare(results, baseline, threshold=0.25, log=print):
+    """Print the change per result; returns the names that regressed."""
+    regressed = []
+    log(f"{'':30} {'baseline':>20} {'now':>20} {'change':>8}")
+    for name, cur in results.items():
+        base = baseline.get(name)
+        if base is None or not base["value"]:
+            continue
+        change = cur["value"] / base["value"] - 1.0
+        worse = -change if cur["better"] == "higher" else change
+        flag = "  REGRESSION" if worse > threshold else ""
+        if flag:
+            regressed.append(name)
+        log(f"{name:30} {_fmt(base['value'], cur['unit']):>20} "
+            f"{_fmt(cur['value'], cur['unit']):>20} {change:+8.1%}{flag}")
+    return regressed
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    opts = {"--only": "", "--threshold": "0.25", "--repeat": "5",
+            "--baseline": DEFAULT_BASELINE, "--out": ""}
+    do_save = False
+    while argv:
+        flag = argv.pop(0)
+        if flag == "--save":
+            do_save = True
+            continue
+        if flag not in opts or not argv:
+            print("usage: python oddti_bench.py [--save] [--only GROUP,NAME] [--threshold F] "
+                  "[--repeat N] [--baseline FILE] [--out FILE]")
+            return 2
+        opts[flag] = argv.pop(0)
+    only = set(filter(None, opts["--only"].split(",")))
+    repeat = int(opts["--repeat"])
+    results = run(only, repeat)
+    if opts["--out"]:
+        save(results, opts["--out"], repeat)
+    if do_save:
+        save(results, opts["--baseline"], repeat)
+        print(f"baseline written to {opts['--baseline']}")
+        return 0
+    try:
+        baseline = load(opts["--baseline"])
+    except OSError:
+        print(f"no baseline at {opts['--baseline']}; run with --save first")
+        return 0
+    print()
+    regressed = compare(results, baseline, float(opts["--threshold"]))
+    if regressed:
+        print(f"{len(regressed)} regression(s) over {float(opts['--threshold']):.0%}: "
+              + ", ".join(regressed))
+        return 1
+    print(f"no regressions over {float(opts['--threshold']):.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,321 @@
+# ==========================================================
+# ⚡ ODDTI™ v2.3 — Session checkpoints
+# Fixed-size binary snapshot of a whole oddti_server.Session: series
+# and innings state, the ArrayPredictor counts and the random stream,
+# so a session resumes at the exact ball, in this process or another.
+# No external libs (stdlib only, PC only).
+# ==========================================================
+#
+#   data = dumps(session)            # bytes, for handing to another worker
+#   session = loads(data)
+#   with Checkpoint("s1.ckpt") as ck:
+#       ck.save(session)             # after every ball
+#   session = Checkpoint("s1.ckpt").restore()
+#
+# A checkpoint file holds two record slots.  Saves alternate between
+# them, each record carries a sequence number and a CRC32, and restore()
+# takes the newest slot whose CRC checks out, so a save torn by a crash
+# falls back to the ball before.  Slots are read and written with
+# seek + read/write on the file, so this works on any platform.
+#
+#   python oddti_checkpoint.py            crash/restore check + timings
+# ==========================================================
+
+import os
+import random
+import signal
+import struct
+import subprocess
+import sys
+import time
+import zlib
+
+from oddti_predictors import ArrayPredictor
+from oddti_server import Session
+
+MAGIC = b"OCKP"
+VERSION = 1
+N = 7
+PHASES = ("mode", "call", "toss", "elect", "ball", "done")
+PARITIES = (None, "odd", "even")
+SIDES = (None, "player", "computer")
+
+HEAD = struct.Struct("<4sHQ")                 # magic, version, sequence
+# phase series match_no player_wins comp_wins parity player_first innings
+# batting use_predictor | cpu_move prev_player_move pred_last |
+# score first_score target balls | epsilon | batting scheme
+STATE = struct.Struct("<10B3b2IiId16s")
+COUNTS = struct.Struct(f"<{(N + 1) * N}I")
+WORDS = struct.Struct("<624I")               # Mersenne Twister state
+RNG_TAIL = struct.Struct("<IBd")              # position in it, gauss_next
+CRC = struct.Struct("<I")
+RECORD_SIZE = HEAD.size + STATE.size + COUNTS.size + WORDS.size + RNG_TAIL.size + CRC.size
+# how the check's child process dies: SIGKILL where there is one (POSIX),
+# else an immediate _exit, which skips cleanup just the same
+KILL = getattr(signal, "SIGKILL", None)
+
+
+def _opt(v):
+    return -1 if v is None else v
+
+
+def _unopt(v):
+    return None if v < 0 else v
+
+
+def pack_into(buf, session, seq=0, last_words=None):
+    """
+    Write one record for session into buf (a bytearray of RECORD_SIZE).
+    The twister words only change every 624 draws: pass the words returned
+    by the previous call on the same buf to skip re-packing them.
+    """
+    s = session
+    pred = s.predictor
+    if not isinstance(pred, ArrayPredictor):
+        raise TypeError("checkpoints store ArrayPredictor tables only")
+    HEAD.pack_into(buf, 0, MAGIC, VERSION, seq)
+    off = HEAD.size
+    STATE.pack_into(buf, off, PHASES.index(s.phase), s.series, s.match_no, s.player_wins,
+                    s.comp_wins, PARITIES.index(s.player_parity), s.player_first,
+                    s.innings, SIDES.index(s.batting), s.use_predictor,
+                    _opt(s.cpu_move), _opt(s.prev_player_move), _opt(pred.last_player_move),
+                    s.score, s.first_score, _opt(s.target), s.balls,
+                    s.epsilon, s.batting_scheme.encode())
+    off += STATE.size
+    COUNTS.pack_into(buf, off, *pred.counts)
+    off += COUNTS.size
+    _, state, gauss = s.rng.getstate()
+    words = state[:-1]
+    if words != last_words:
+        WORDS.pack_into(buf, off, *words)
+    off += WORDS.size
+    RNG_TAIL.pack_into(buf, off, state[-1], gauss is not None, gauss or 0.0)
+    off += RNG_TAIL.size
+    CRC.pack_into(buf, off, zlib.crc32(memoryview(buf)[:off]))
+    return words
+
+
+def unpack(data):
+    """Session from one record; returns (session, seq). ValueError if damaged."""
+    if len(data) < RECORD_SIZE:
+        raise ValueError("checkpoint record is truncated")
+    magic, version, seq = HEAD.unpack_from(data, 0)
+    end = RECORD_SIZE - CRC.size
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not an ODDTI session checkpoint")
+    if CRC.unpack_from(data, end)[0] != zlib.crc32(memoryview(data)[:end]):
+        raise ValueError("checkpoint record failed its CRC check")
+    off = HEAD.size
+    (phase, series, match_no, player_wins, comp_wins, parity, player_first, innings,
+     batting, use_predictor, cpu_move, prev_move, pred_last, score, first_score,
+     target, balls, epsilon, scheme) = STATE.unpack_from(data, off)
+    off += STATE.size
+    counts = COUNTS.unpack_from(data, off)
+    off += COUNTS.size
+    words = WORDS.unpack_from(data, off)
+    index, has_gauss, gauss = RNG_TAIL.unpack_from(data, off + WORDS.size)
+    rng = random.Random()
+    rng.setstate((3, words + (index,), gauss if has_gauss else None))
+
+    pred = ArrayPredictor(rng)
+    pred.load_counts(counts, _unopt(pred_last))
+    s = Session(rng=rng, predictor=pred, epsilon=epsilon, use_predictor=bool(use_predictor),
+                batting_scheme=scheme.rstrip(b"\0").decode())
+    s.phase = PHASES[phase]
+    s.series = bool(series)
+    s.match_no = match_no
+    s.player_wins = player_wins
+    s.comp_wins = comp_wins
+    s.player_parity = PARITIES[parity]
+    s.player_first = bool(player_first)
+    s.innings = innings
+    s.batting = SIDES[batting]
+    s.cpu_move = _unopt(cpu_move)
+    s.prev_player_move = _unopt(prev_move)
+    s.score = score
+    s.first_score = first_score
+    s.target = _unopt(target)
+    s.balls = balls
+    s.prompt = s.current_prompt()
+    return s, seq
+
+
+def dumps(session):
+    buf = bytearray(RECORD_SIZE)
+    pack_into(buf, session)
+    return bytes(buf)
+
+
+def loads(data):
+    return unpack(data)[0]
+
+
+class Checkpoint:
+    """Two-slot checkpoint file for one session."""
+
+    def __init__(self, path, sync=False):
+        self.path = path
+        self.sync = sync            # fsync every save (survives power loss, not just a crash)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+        self.file = os.fdopen(fd, "r+b", buffering=0)
+        self.seq = self._newest()[1]
+        self.buf = bytearray(RECORD_SIZE)
+        self.words = None
+
+    def _slots(self):
+        for slot in (0, 1):
+            self.file.seek(slot * RECORD_SIZE)
+            data = self.file.read(RECORD_SIZE)
+            try:
+                yield unpack(data)
+            except ValueError:
+                continue
+
+    def _newest(self):
+        best = (None, 0)
+        for session, seq in self._slots():
+            if seq > best[1]:
+                best = (session, seq)
+        return best
+
+    def save(self, session):
+        self.seq += 1
+        self.words = pack_into(self.buf, session, self.seq, self.words)
+        self.file.seek((self.seq & 1) * RECORD_SIZE)
+        self.file.write(self.buf)
+        if self.sync:
+            os.fsync(self.file.fileno())
+
+    def restore(self):
+        """The most recently saved session, or None if there is none."""
+        return self._newest()[0]
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def remove(self):
+        self.close()
+        os.remove(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# -----------------------------
+# Crash/restore check + timings (python oddti_checkpoint.py)
+# -----------------------------
+
+def _answer(prompt, rng):
+    kind = prompt.split()[1]
+    if kind == "mode":
+        return "series"
+    if kind == "call":
+        return rng.choice(("odd", "even"))
+    if kind == "elect":
+        return rng.choice(("bat", "bowl"))
+    return str(rng.choice((0, 1, 2, 3, 4, 5, 6)))
+
+
+def transcript(seed):
+    """Play a full series with a seeded random client: [(line, output lines)]."""
+    session = Session(rng=random.Random(seed))
+    client = random.Random(seed + 1)
+    session.start()
+    steps = []
+    while session.phase != "done":
+        line = _answer(session.prompt, client)
+        steps.append((line, session.feed(line)))
+    return steps
+
+
+def _child(path, seed, k):
+    """Play the first k lines of transcript(seed), checkpointing each, then die."""
+    steps = transcript(seed)
+    session = Session(rng=random.Random(seed))
+    session.start()
+    ck = Checkpoint(path)
+    for line, _ in steps[:k]:
+        session.feed(line)
+        ck.save(session)
+    if KILL is not None:
+        os.kill(os.getpid(), KILL)
+    os._exit(9)
+
+
+def _play_on(data, lines):
+    """Worker side of a hand-off: continue a session and send it back."""
+    session = loads(data)
+    out = [session.feed(line) for line in lines]
+    return dumps(session), out
+
+
+def check(seeds=(1, 2, 3), path="oddti_checkpoint_check.ckpt"):
+    from concurrent.futures import ProcessPoolExecutor
+    for seed in seeds:
+        steps = transcript(seed)
+        k = random.Random(seed).randrange(3, len(steps) - 1)
+        if os.path.exists(path):
+            os.remove(path)
+        proc = subprocess.run([sys.executable, __file__, "--child", path, str(seed), str(k)])
+        if proc.returncode != (-KILL if KILL is not None else 9):
+            raise AssertionError(f"child exited with {proc.returncode}, expected to be killed")
+        ck = Checkpoint(path)
+        session = ck.restore()
+        ck.remove()
+        if session is None:
+            raise AssertionError("no checkpoint after crash")
+        for i, (line, expected) in enumerate(steps[k:], start=k):
+            got = session.feed(line)
+            if got != expected:
+                raise AssertionError(f"seed {seed}: line {i} differs after restore\n"
+                                     f"{got}\n{expected}")
+        print(f"seed {seed}: killed after {k}/{len(steps)} lines, restored, "
+              f"remaining {len(steps) - k} lines identical")
+
+    # hand a live session to a worker process and take it back
+    steps = transcript(seeds[0])
+    half = len(steps) // 2
+    session = Session(rng=random.Random(seeds[0]))
+    session.start()
+    for line, _ in steps[:half]:
+        session.feed(line)
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        data, out = pool.submit(_play_on, dumps(session), [l for l, _ in steps[half:]]).result()
+    if out != [o for _, o in steps[half:]] or loads(data).phase != "done":
+        raise AssertionError("session moved to a worker did not play on identically")
+    print("session handed to a worker process and back: identical")
+
+
+def bench(balls=20000, path="oddti_checkpoint_bench.ckpt"):
+    session = Session(rng=random.Random(5))
+    for sync in (False, True):
+        n = balls if not sync else max(1, balls // 100)
+        ck = Checkpoint(path)
+        t0 = time.perf_counter()
+        for _ in range(n):
+            # about one ball's worth of draws, so the twister wraps now and then
+            session.rng.random()
+            session.rng.random()
+            ck.save(session)
+        dt = time.perf_counter() - t0
+        ck.remove()
+        print(f"save{' + fsync' if sync else ''}: {dt / n * 1e6:8.1f} us per ball")
+    data = dumps(session)
+    t0 = time.perf_counter()
+    for _ in range(1000):
+        loads(data)
+    dt = time.perf_counter() - t0
+    print(f"snapshot {len(data)} bytes ({RECORD_SIZE * 2} byte file), "
+          f"restore {dt / 1000 * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        _child(sys.argv[2], int(sys.argv[3]), int(sys.argv[4]))
+    else:
+        check()
+        bench()
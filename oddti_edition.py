@@ -0,0 +1,29 @@
+# ==========================================================
+# ⚡ ODDTI™ v2.3 — Predictor edition loader
+# The predictor edition's file name is not a valid module name,
+# so tools load it from its path with this helper.
+# ==========================================================
+
+import importlib.util
+import os
+import sys
+
+EDITION_FILE = "⚡ ODDTI™ v2.3 predictor edition.py"
+MODULE_NAME = "oddti_predictor_edition"
+
+
+def load_edition():
+    """Import the predictor edition once and return the module."""
+    mod = sys.modules.get(MODULE_NAME)
+    if mod is not None:
+        return mod
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), EDITION_FILE)
+    spec = importlib.util.spec_from_file_location(MODULE_NAME, path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[MODULE_NAME] = mod
+    try:
+        spec.loader.exec_module(mod)
+    except BaseException:
+        del sys.modules[MODULE_NAME]
+        raise
+    return mod
@@ -0,0 +1,135 @@
+# ==========================================================
+# ⚡ ODDTI™ v2.3 — Ball-by-ball event log
+# Append-only JSON-lines log of tosses, balls, wickets, innings,
+# matches and series.  Writes are batched, files rotate by size, and
+# the reader streams events back one at a time.
+# No external libs (stdlib only, PC only).
+# ==========================================================
+#
+#   log = EventLog("oddti_events.jsonl")
+#   log.emit("ball", batting="player", player=4, cpu=2, runs=4, score=10)
+#   log.close()
+#   for ev in read_events("oddti_events.jsonl"):
+#       ...
+# Rotated files are oddti_events.jsonl.1 (newest) ... .N (oldest).
+# A "toss" event carries call, both numbers, winner and the winner's
+# bat/bowl election (elect), so the log replays a match from the start.
+# ==========================================================
+
+import atexit
+import json
+import os
+import sys
+import time
+
+DEFAULT_PATH = "oddti_events.jsonl"
+
+
+class EventLog:
+    """
+    Buffered, size-rotated event writer.  Memory stays bounded by
+    batch_size events no matter how long the session runs.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, max_bytes=4 << 20, backups=5, batch_size=256):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.batch_size = batch_size
+        self.seq = 0
+        self._buffer = []
+        self._file = open(path, "a", encoding="utf-8")
+        self._size = self._file.tell()
+        atexit.register(self.close)
+
+    def emit(self, kind, **fields):
+        fields["kind"] = kind
+        fields["seq"] = self.seq
+        fields["t"] = round(time.time(), 3)
+        self.seq += 1
+        self._buffer.append(json.dumps(fields, separators=(",", ":"), ensure_ascii=False))
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer or self._file is None:
+            return
+        data = "\n".join(self._buffer) + "\n"
+        self._buffer.clear()
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data.encode("utf-8"))
+        if self.max_bytes and self._size >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self):
+        self._file.close()
+        if self.backups > 0:
+            for k in range(self.backups - 1, 0, -1):
+                src = f"{self.path}.{k}"
+                if os.path.exists(src):
+                    os.replace(src, f"{self.path}.{k + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._size = 0
+
+    def close(self):
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+            atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def log_files(path=DEFAULT_PATH):
+    """Existing log files for path, oldest first."""
+    files = []
+    k = 1
+    while os.path.exists(f"{path}.{k}"):
+        files.append(f"{path}.{k}")
+        k += 1
+    files.reverse()
+    if os.path.exists(path):
+        files.append(path)
+    return files
+
+
+def read_events(path=DEFAULT_PATH, kinds=None, rotated=True):
+    """
+    Yield events (dicts) oldest first, one line at a time.
+    kinds: optional set of event kinds to keep.
+    """
+    for name in (log_files(path) if rotated else [path]):
+        with open(name, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                ev = json.loads(line)
+                if kinds is None or ev["kind"] in kinds:
+                    yield ev
+
+
+def player_moves(path=DEFAULT_PATH):
+    """Yield the player's numbers in order, from "ball" events."""
+    for ev in read_events(path, kinds={"ball"}):
+        yield ev["player"]
+
+
+def summary(path=DEFAULT_PATH):
+    counts = {}
+    for ev in read_events(path):
+        counts[ev["kind"]] = counts.get(ev["kind"], 0) + 1
+    for kind, n in sorted(counts.items()):
+        print(f"{kind:12} {n}")
+
+
+if __name__ == "__main__":
+    summary(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH)
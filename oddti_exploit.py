@@ -0,0 +1,302 @@
+# ==========================================================
+# ⚡ ODDTI™ v2.3 — Exploit analyzer
+# Best-response batting against the predictor edition's CPU bowler:
+# which move sequence scores the most expected runs before the
+# predictor catches it, from a given predictor state.
+# No external libs (stdlib only, PC only).
+# ==========================================================
+#
+# The CPU bowls predictor.predict(last move) (a uniform pick among the
+# tied top counts) with probability 1 - epsilon, else a uniform 0-6.
+# The predictor only learns from the player's numbers, so the state after
+# a move does not depend on what was bowled: each ball is a max node
+# (the batter's move) over one chance node (caught or not), and the best
+# response is a fixed move sequence.
+#   V(state, d) = max_a (1 - p_out(a)) * (a + V(state + a, d - 1))
+# Values are memoized on an incremental hash of the count table (plus the
+# last move and depth).  Every ball keeps at least epsilon/7 catch chance,
+# so U(d) = s * (6 + U(d-1)) with s = 1 - epsilon/7 bounds d balls; a move
+# with (1 - p_out) * (a + U(d-1)) no better than the best sibling (or the
+# threshold handed down from the parent) is skipped.  Root moves are
+# searched on a process pool.
+#
+#   report = analyze(predictor, depth=12, epsilon=0.12)
+#   python oddti_exploit.py [--depth D] [--eps E] [--workers N]
+#                           [--moves 3,5,3,5] [--player NAME] [--check]
+# ==========================================================
+
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+VALID_NUMS = (0, 1, 2, 3, 4, 5, 6)
+N = 7
+FREQ_ROW = N
+MAX_RUNS = 6
+MASK = (1 << 64) - 1
+# one random 64-bit key per count cell: hash = sum(key * count) mod 2**64
+_rng = random.Random(0x0DD7)
+_KEYS = [_rng.getrandbits(64) for _ in range((N + 1) * N)]
+del _rng
+
+
+def table_from(pred):
+    """56 counts (Markov rows 0-6, then frequency) and last move of any
+    predictor with .markov/.freq views (Predictor, ArrayPredictor)."""
+    markov, freq = pred.markov, pred.freq
+    counts = [markov[p][n] for p in VALID_NUMS for n in VALID_NUMS]
+    counts += [freq[n] for n in VALID_NUMS]
+    return counts, pred.last_player_move
+
+
+class ExploitSearch:
+    """Depth-limited expectimax over a private copy of the count table."""
+
+    def __init__(self, counts, last, epsilon):
+        self.counts = list(counts)
+        self.last = last
+        self.epsilon = epsilon
+        self.hash = sum(k * c for k, c in zip(_KEYS, self.counts)) & MASK
+        self.memo = {}              # (hash, last, depth) -> (value, best move, exact)
+        self.nodes = self.hits = self.pruned = 0
+        self._undo = []
+        self._stay = 1.0 - epsilon / N
+        self._bounds = [0.0]        # [d]: most expected runs in d balls
+
+    def _bound(self, depth):
+        b = self._bounds
+        while len(b) <= depth:
+            b.append(self._stay * (MAX_RUNS + b[-1]))
+        return b[depth]
+
+    def out_probs(self):
+        """Chance the CPU bowls each number next (= batter out on it)."""
+        row = FREQ_ROW if self.last is None else self.last
+        cells = self.counts[row * N:row * N + N]
+        top = max(cells)
+        caught = (1.0 - self.epsilon) / cells.count(top)
+        base = self.epsilon / N
+        return [base + caught if c == top else base for c in cells]
+
+    def play(self, a):
+        c, prev = self.counts, self.last
+        c[FREQ_ROW * N + a] += 1
+        h = self.hash + _KEYS[FREQ_ROW * N + a]
+        if prev is not None:
+            c[prev * N + a] += 1
+            h += _KEYS[prev * N + a]
+        self._undo.append((self.hash, prev))
+        self.hash = h & MASK
+        self.last = a
+
+    def unplay(self):
+        a = self.last
+        self.hash, prev = self._undo.pop()
+        self.counts[FREQ_ROW * N + a] -= 1
+        if prev is not None:
+            self.counts[prev * N + a] -= 1
+        self.last = prev
+
+    def value(self, depth, alpha=-1.0):
+        """
+        Best expected runs over the next `depth` balls (0 once out).  If the
+        best is no more than alpha, some upper bound <= alpha comes back
+        instead: the caller only needed to know it cannot win.
+        """
+        if depth == 0:
+            return 0.0
+        key = (self.hash, self.last, depth)
+        hit = self.memo.get(key)
+        if hit is not None and (hit[2] or hit[0] <= alpha):
+            self.hits += 1
+            return hit[0]
+        self.nodes += 1
+        p = self.out_probs()
+        rest = self._bound(depth - 1)
+        best, move = -1.0, None
+        # likely-good moves first so the bound cuts more
+        for a in sorted(VALID_NUMS, key=lambda a: (p[a] - 1.0) * (a + rest)):
+            stay = 1.0 - p[a]
+            floor = best if best > alpha else alpha
+            if stay * (a + rest) <= floor:
+                self.pruned += 1
+                continue
+            self.play(a)
+            v = stay * (a + self.value(depth - 1, floor / stay - a))
+            self.unplay()
+            if v > best:
+                best, move = v, a
+        exact = best > alpha
+        if not exact:
+            # every move failed low: the node is worth at most alpha
+            best = alpha
+        self.memo[key] = (best, move, exact)
+        return best
+
+    def line(self, depth):
+        """The best move sequence (principal variation) after value(depth)."""
+        moves = []
+        for d in range(depth, 0, -1):
+            self.value(d)
+            a = self.memo[(self.hash, self.last, d)][1]
+            moves.append(a)
+            self.play(a)
+        for _ in moves:
+            self.unplay()
+        return moves
+
+    def survival(self, moves):
+        """Per-ball chance of not being caught along `moves`."""
+        out = []
+        for a in moves:
+            out.append(1.0 - self.out_probs()[a])
+            self.play(a)
+        for _ in moves:
+            self.unplay()
+        return out
+
+# -----------------------------
+# Root-parallel analysis
+# -----------------------------
+
+def search_root(task):
+    """One root move: (move, value, line, nodes, memo hits, pruned, seconds)."""
+    counts, last, epsilon, depth, a = task
+    t0 = time.perf_counter()
+    s = ExploitSearch(counts, last, epsilon)
+    stay = 1.0 - s.out_probs()[a]
+    s.play(a)
+    v = stay * (a + s.value(depth - 1))
+    line = [a] + s.line(depth - 1)
+    return a, v, line, s.nodes + 1, s.hits, s.pruned, time.perf_counter() - t0
+
+
+def analyze(pred=None, depth=12, epsilon=0.12, workers=None, counts=None, last=None):
+    """
+    Search every root move from the predictor's current state (or an explicit
+    counts/last table).  Returns a dict: ranked root lines with expected runs
+    and per-ball survival, plus node counts and nodes/sec.
+    """
+    if counts is None:
+        counts, last = table_from(pred)
+    tasks = [(counts, last, epsilon, depth, a) for a in VALID_NUMS]
+    t0 = time.perf_counter()
+    if workers == 1:
+        results = list(map(search_root, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(search_root, tasks))
+    wall = time.perf_counter() - t0
+    s = ExploitSearch(counts, last, epsilon)
+    lines = []
+    for a, v, line, nodes, hits, pruned, dt in sorted(results, key=lambda r: -r[1]):
+        lines.append({"move": a, "expected_runs": v, "line": line,
+                      "survival": s.survival(line)})
+    nodes = sum(r[3] for r in results)
+    return {"depth": depth, "epsilon": epsilon, "lines": lines,
+            "nodes": nodes, "memo_hits": sum(r[4] for r in results),
+            "pruned": sum(r[5] for r in results), "seconds": wall,
+            "cpu_seconds": sum(r[6] for r in results),
+            "nodes_per_sec": nodes / wall if wall else 0.0}
+
+
+def print_report(rep, top=7):
+    print(f"depth {rep['depth']}, epsilon {rep['epsilon']:.2f}: "
+          f"{rep['nodes']:,} nodes, {rep['memo_hits']:,} memo hits, "
+          f"{rep['pruned']:,} moves pruned")
+    print(f"{rep['seconds']:.2f}s wall ({rep['cpu_seconds']:.2f}s in workers), "
+          f"{rep['nodes_per_sec']:,.0f} nodes/sec")
+    print(f"{'first':>5} {'E[runs]':>8}  line (survival per ball)")
+    for entry in rep["lines"][:top]:
+        balls = " ".join(f"{a}({p:.2f})" for a, p in zip(entry["line"], entry["survival"]))
+        print(f"{entry['move']:>5} {entry['expected_runs']:8.3f}  {balls}")
+
+# -----------------------------
+# Check: play the best line against the real CPU logic
+# -----------------------------
+
+def playout(counts, last, epsilon, moves, trials=20000, seed=4):
+    """Mean runs of a fixed move sequence against a fresh ArrayPredictor copy
+    bowling like cpu_choose_when_bowling (out ends the sequence)."""
+    from oddti_predictors import ArrayPredictor
+    rng = random.Random(seed)
+    total = 0
+    for _ in range(trials):
+        pred = ArrayPredictor(rng)
+        pred.load_counts(counts, last)
+        for a in moves:
+            if rng.random() > epsilon:
+                bowl = pred.predict(pred.last_player_move)
+            else:
+                bowl = rng.choice(VALID_NUMS)
+            if bowl == a:
+                break
+            total += a
+            pred.update(pred.last_player_move, a)
+    return total / trials
+
+
+def check(depth=6, epsilon=0.12, seed=9):
+    """Search agrees with brute force, and its best line holds up in play."""
+    from itertools import product
+    rng = random.Random(seed)
+    counts = [rng.randint(1, 4) for _ in range((N + 1) * N)]
+    last = rng.choice(VALID_NUMS)
+    s = ExploitSearch(counts, last, epsilon)
+    small = 4
+    brute = 0.0
+    for seq in product(VALID_NUMS, repeat=small):
+        v, alive = 0.0, 1.0
+        for a in seq:
+            alive *= 1.0 - s.out_probs()[a]
+            v += alive * a
+            s.play(a)
+        for _ in seq:
+            s.unplay()
+        brute = max(brute, v)
+    got = ExploitSearch(counts, last, epsilon).value(small)
+    if abs(got - brute) > 1e-9:
+        raise AssertionError(f"search {got} != brute force {brute}")
+    print(f"depth {small}: search {got:.4f} == brute force over {N ** small} sequences")
+
+    rep = analyze(counts=counts, last=last, depth=depth, epsilon=epsilon, workers=1)
+    best = rep["lines"][0]
+    played = playout(counts, last, epsilon, best["line"])
+    rand = sum(playout(counts, last, epsilon, [rng.choice(VALID_NUMS) for _ in range(depth)],
+                       trials=200, seed=k) for k in range(100)) / 100
+    print(f"best line {best['line']}: expected {best['expected_runs']:.3f}, "
+          f"played {played:.3f}; random batting {rand:.3f}")
+    if abs(played - best["expected_runs"]) > 0.15 or played <= rand:
+        raise AssertionError("best line does not hold up against the real CPU")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    opts = {"--depth": "12", "--eps": "0.12", "--workers": "", "--moves": "", "--player": ""}
+    if "--check" in argv:
+        check()
+        return
+    while argv:
+        flag = argv.pop(0)
+        if flag not in opts or not argv:
+            print("usage: python oddti_exploit.py [--depth D] [--eps E] [--workers N] "
+                  "[--moves 3,5,3] [--player NAME] [--check]")
+            return
+        opts[flag] = argv.pop(0)
+    from oddti_predictors import ArrayPredictor
+    pred = ArrayPredictor()
+    if opts["--player"]:
+        import oddti_store
+        with oddti_store.ModelStore() as store:
+            if not store.load_into(opts["--player"], pred):
+                print(f"No saved model for {opts['--player']}; using a fresh one.")
+    for m in filter(None, opts["--moves"].split(",")):
+        pred.update(pred.last_player_move, int(m))
+    rep = analyze(pred, depth=int(opts["--depth"]), epsilon=float(opts["--eps"]),
+                  workers=int(opts["--workers"]) if opts["--workers"] else None)
+    print_report(rep)
+
+
+if __name__ == "__main__":
+    main()
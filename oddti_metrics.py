@@ -0,0 +1,272 @@
+# ==========================================================
+# ⚡ ODDTI™ v2.3 — Hot-path instrumentation
+# Latency histograms, call counts, predictor hit rate and wickets per
+# prediction for the predictor edition.
+# No external libs (stdlib only, PC only).
+# ==========================================================
+#
+#   metrics = install(game)      # game = the loaded predictor edition
+#   ... play ...
+#   print(report(metrics))
+#   dump(metrics, "oddti_metrics.json")
+#   uninstall(game)
+# install() swaps play_innings, cpu_choose_when_bowling,
+# cpu_choose_when_batting and the module predictor for timed wrappers;
+# uninstall() puts the original objects back, so with stats off the game
+# runs exactly the code it always did.
+#
+#   python oddti_metrics.py [matches]      overhead benchmark
+# ==========================================================
+
+import json
+import sys
+import time
+
+perf_ns = time.perf_counter_ns
+TIMED = ("play_innings", "cpu_choose_when_bowling", "cpu_choose_when_batting")
+
+
+class LatencyHistogram:
+    """Power-of-two nanosecond buckets: bucket k holds [2**(k-1), 2**k)."""
+
+    def __init__(self):
+        self.buckets = [0] * 64
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+
+    def add(self, ns):
+        self.buckets[ns.bit_length()] += 1
+        self.count += 1
+        self.total_ns += ns
+        if self.min_ns is None or ns < self.min_ns:
+            self.min_ns = ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def percentile(self, q):
+        """Upper bound (ns) of the bucket holding the q-th percentile."""
+        if not self.count:
+            return 0
+        rank = q / 100.0 * self.count
+        seen = 0
+        for k, n in enumerate(self.buckets):
+            seen += n
+            if n and seen >= rank:
+                return min(1 << k, self.max_ns)
+        return self.max_ns
+
+    def mean(self):
+        return self.total_ns / self.count if self.count else 0.0
+
+    def to_dict(self):
+        return {"count": self.count, "total_ns": self.total_ns,
+                "min_ns": self.min_ns or 0, "max_ns": self.max_ns,
+                "mean_ns": round(self.mean(), 1),
+                "p50_ns": self.percentile(50), "p99_ns": self.percentile(99),
+                "buckets": {str(1 << k): n for k, n in enumerate(self.buckets) if n}}
+
+
+class Metrics:
+    def __init__(self):
+        self.originals = {}
+        self.timers = {name: LatencyHistogram()
+                       for name in TIMED + ("predictor.predict", "predictor.update")}
+        self.reset()
+
+    def reset(self):
+        # clear in place: the installed wrappers hold on to these histograms
+        for h in self.timers.values():
+            h.__init__()
+        self.predictions = 0       # predictions later checked against a real move
+        self.hits = 0              # ... that matched it
+        self.predicted_bowls = 0   # balls the CPU bowled its prediction
+        self.wickets = 0           # ... that took a wicket
+        self._pending = None       # last prediction, waiting for update()
+        self._bowl = None          # CPU's predicted bowl, waiting for update()
+
+    def hit_rate(self):
+        return self.hits / self.predictions if self.predictions else 0.0
+
+    def wickets_per_prediction(self):
+        return self.wickets / self.predicted_bowls if self.predicted_bowls else 0.0
+
+    def to_dict(self):
+        return {"timers": {k: h.to_dict() for k, h in self.timers.items()},
+                "predictions": self.predictions, "hits": self.hits,
+                "hit_rate": round(self.hit_rate(), 4),
+                "predicted_bowls": self.predicted_bowls, "wickets": self.wickets,
+                "wickets_per_prediction": round(self.wickets_per_prediction(), 4)}
+
+
+class _TimedPredictor:
+    """Stands in for the module predictor; everything else is passed through."""
+
+    def __init__(self, inner, metrics):
+        object.__setattr__(self, "inner", inner)
+        object.__setattr__(self, "metrics", metrics)
+
+    def predict(self, prev=None):
+        m = self.metrics
+        t0 = perf_ns()
+        pred = self.inner.predict(prev)
+        m.timers["predictor.predict"].add(perf_ns() - t0)
+        m._pending = pred
+        return pred
+
+    def update(self, prev, actual):
+        m = self.metrics
+        t0 = perf_ns()
+        self.inner.update(prev, actual)
+        m.timers["predictor.update"].add(perf_ns() - t0)
+        if m._pending is not None:
+            m.predictions += 1
+            m.hits += m._pending == actual
+            m._pending = None
+        if m._bowl is not None:
+            m.predicted_bowls += 1
+            m.wickets += m._bowl == actual
+            m._bowl = None
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.inner, name, value)
+
+# -----------------------------
+# Install / uninstall
+# -----------------------------
+
+def _timed(func, hist):
+    def wrapper(*args, **kw):
+        t0 = perf_ns()
+        try:
+            return func(*args, **kw)
+        finally:
+            hist.add(perf_ns() - t0)
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def install(game, metrics=None):
+    """Start collecting stats for `game`; returns its Metrics."""
+    if getattr(game, "METRICS", None) is not None:
+        return game.METRICS
+    m = metrics or Metrics()
+    m.originals = {name: getattr(game, name) for name in TIMED}
+    m.originals["predictor"] = game.predictor
+
+    innings = _timed(m.originals["play_innings"], m.timers["play_innings"])
+    batting = _timed(m.originals["cpu_choose_when_batting"], m.timers["cpu_choose_when_batting"])
+    bowling_hist = m.timers["cpu_choose_when_bowling"]
+    bowling_func = m.originals["cpu_choose_when_bowling"]
+
+    def play_innings(*args, **kw):
+        # the menu may have swapped in a new model since the last innings
+        if not isinstance(game.predictor, _TimedPredictor):
+            game.predictor = _TimedPredictor(game.predictor, m)
+        return innings(*args, **kw)
+
+    def cpu_choose_when_bowling(*args, **kw):
+        m._pending = None
+        t0 = perf_ns()
+        c = bowling_func(*args, **kw)
+        bowling_hist.add(perf_ns() - t0)
+        if m._pending is not None and c == m._pending:
+            m._bowl = c
+        return c
+
+    cpu_choose_when_bowling.__wrapped__ = bowling_func
+    game.play_innings = play_innings
+    game.cpu_choose_when_bowling = cpu_choose_when_bowling
+    game.cpu_choose_when_batting = batting
+    game.predictor = _TimedPredictor(game.predictor, m)
+    game.METRICS = m
+    return m
+
+
+def uninstall(game):
+    """Put the original functions and predictor back."""
+    m = getattr(game, "METRICS", None)
+    if m is None:
+        return None
+    for name in TIMED:
+        setattr(game, name, m.originals[name])
+    if isinstance(game.predictor, _TimedPredictor):
+        game.predictor = game.predictor.inner
+    game.METRICS = None
+    return m
+
+# -----------------------------
+# Output
+# -----------------------------
+
+def report(m):
+    lines = [f"{'':26} {'calls':>9} {'mean':>9} {'p50':>9} {'p99':>9} {'max':>9}"]
+    for name, h in m.timers.items():
+        if h.count:
+            lines.append(f"{name:26} {h.count:9} {h.mean() / 1000:8.1f}u "
+                         f"{h.percentile(50) / 1000:8.1f}u {h.percentile(99) / 1000:8.1f}u "
+                         f"{h.max_ns / 1000:8.1f}u")
+    lines.append(f"Predictor hit rate : {m.hit_rate():.1%} ({m.hits}/{m.predictions})")
+    lines.append(f"Wickets/prediction : {m.wickets_per_prediction():.3f} "
+                 f"({m.wickets}/{m.predicted_bowls} predicted bowls)")
+    return "\n".join(lines)
+
+
+def dump(m, path=None):
+    """Write the stats as JSON to path (or return the JSON string)."""
+    text = json.dumps(m.to_dict(), indent=1)
+    if path is None:
+        return text
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text + "\n")
+    return text
+
+# -----------------------------
+# Overhead benchmark
+# -----------------------------
+
+def benchmark(matches=3000, seed=11, rounds=5):
+    """
+    Matches/sec of the real edition loop (random player, predictor CPU)
+    with stats off and on, interleaved round by round; best round wins.
+    Also checks that uninstall() leaves the original objects in place.
+    """
+    import random
+    from oddti_edition import load_edition
+    from oddti_strategy import RandomStrategy, run_matches
+    game = load_edition()
+    game.LOG_EVENTS = False
+    game.TRACK_STATS = False
+    before = [getattr(game, name) for name in TIMED + ("predictor",)]
+    install(game)
+    uninstall(game)
+    after = [getattr(game, name) for name in TIMED + ("predictor",)]
+    if any(a is not b for a, b in zip(before, after)):
+        raise AssertionError("uninstall() did not restore the originals")
+
+    def rate(r):
+        random.seed(seed + r)
+        game.predictor.reset()
+        _, _, _, dt = run_matches(game, matches, RandomStrategy(random.Random(seed + r)))
+        return matches / dt
+
+    off = on = 0.0
+    m = Metrics()
+    for r in range(rounds):
+        off = max(off, rate(r))
+        install(game, m)
+        on = max(on, rate(r))
+        uninstall(game)
+    print("stats off: original functions restored (zero added calls)")
+    print(f"stats off  {off:10,.0f} matches/sec")
+    print(f"stats on   {on:10,.0f} matches/sec ({on / off - 1:+.1%})")
+    print()
+    print(report(m))
+    return off, on
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 3000)
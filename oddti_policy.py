@@ -0,0 +1,304 @@
+# ==========================================================
+# ⚡ ODDTI™ v2.3 — Optimal mixed-strategy policy table
+# Equilibrium batting and bowling mixes for every innings state,
+# solved offline and stored as a small binary table.
+# No external libs (stdlib only, PC only).
+# ==========================================================
+#
+# States:
+#   chase, need n     the batter wins at n runs, an out at need 1 ties
+#   first innings, s  the batter has s; an out leaves the chaser needing s+1
+# Every ball is the same guessing game: the batter picks a, the bowler
+# picks b.  a == b is OUT (payoff o), otherwise the batter moves to the
+# state a runs on (payoff g_a; a = 0 stays put, so g_0 is the state's own
+# value).  Ties count half a win.  For fixed g the game has a closed form:
+#   d_a = g_a - o,  S = the best k actions,
+#   v   = (sum_S g_a / d_a - 1) / sum_S 1 / d_a
+#   bowler q_a = (g_a - v) / d_a,   batter p_a ~ 1 / d_a   (a in S)
+# and v is found as the fixed point v = value(g_0 = v) by bisection.
+# Chase values only need smaller needs and the first innings only needs
+# larger scores plus the chase table, so each table is one sweep.
+#
+#   table = load()                                   # builds the file once
+#   table.pick("bowl", runs_left=12, score=0)        # one row lookup
+#   table.pick("bat", None, score=30, pred=4, blend=0.5)
+#
+#   python oddti_policy.py build | check | bench
+# ==========================================================
+
+import os
+import random
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_right
+
+VALID_NUMS = (0, 1, 2, 3, 4, 5, 6)
+N = 7
+DEFAULT_PATH = "oddti_policy.bin"
+ROWS = 256            # stored states per kind (larger needs/scores clamp)
+SOLVE_ROWS = 400      # solved states per kind; the rest is the boundary
+SCALE = 1 << 16       # probabilities stored as 16-bit cumulative thresholds
+HEADER = struct.Struct("<8sHHH")
+MAGIC = b"ODDTIPOL"
+VERSION = 1
+
+CHASE_BAT, CHASE_BOWL, FIRST_BAT, FIRST_BOWL = range(4)
+KINDS = 4
+
+# -----------------------------
+# Solver
+# -----------------------------
+
+def guess_game(g, o):
+    """
+    Value and equilibrium mixes of one ball: batter payoff g[a] if not
+    caught, o if caught.  Returns (v, batter mix, bowler mix).
+    """
+    d = [max(x - o, 1e-15) for x in g]
+    order = sorted(VALID_NUMS, key=lambda a: -g[a])
+    num = den = 0.0
+    for k, a in enumerate(order):
+        num += g[a] / d[a]
+        den += 1.0 / d[a]
+        v = (num - 1.0) / den
+        if k == N - 1 or g[order[k + 1]] <= v:
+            break
+    support = order[:k + 1]
+    p = [0.0] * N
+    q = [0.0] * N
+    for a in support:
+        p[a] = 1.0 / d[a] / den
+        q[a] = max(0.0, (g[a] - v) / d[a])
+    total = sum(q)
+    q = [x / total for x in q] if total > 0 else p[:]
+    return v, p, q
+
+
+def solve_state(g, o, iters=60):
+    """Solve one state whose g[0] is its own value (the 0-run self loop)."""
+    lo, hi = o, 1.0
+    for _ in range(iters):
+        mid = (lo + hi) / 2
+        g[0] = mid
+        if guess_game(g, o)[0] > mid:
+            lo = mid
+        else:
+            hi = mid
+    g[0] = lo
+    return guess_game(g, o)
+
+
+def solve_chase(rows=SOLVE_ROWS):
+    """V[n] = chaser's value at need n (V[0] = 1), with both mixes per n."""
+    V = [1.0]
+    bat, bowl = [None], [None]
+    for n in range(1, rows + N + 1):
+        g = [0.0] + [V[max(n - a, 0)] for a in VALID_NUMS[1:]]
+        v, p, q = solve_state(g, 0.5 if n == 1 else 0.0)
+        V.append(v)
+        bat.append(p)
+        bowl.append(q)
+    return V, bat, bowl
+
+
+def solve_first(V, rows=SOLVE_ROWS):
+    """W[s] = first batter's value at score s, swept down from the boundary."""
+    top = len(V) - 1
+    W = {}
+    bat, bowl = [None] * rows, [None] * rows
+    for s in range(rows + N, rows - 1, -1):
+        W[s] = 1.0 - V[min(s + 1, top)]      # boundary: treat as all out here
+    for s in range(rows - 1, -1, -1):
+        g = [0.0] + [W[s + a] for a in VALID_NUMS[1:]]
+        v, p, q = solve_state(g, 1.0 - V[s + 1])
+        W[s] = v
+        bat[s], bowl[s] = p, q
+    return [W[s] for s in range(rows)], bat, bowl
+
+
+def _thresholds(mix):
+    """Six cumulative 16-bit cut points; action a owns [t[a-1], t[a])."""
+    out, acc = [], 0.0
+    for x in mix[:-1]:
+        acc += x
+        out.append(min(SCALE - 1, int(round(acc * SCALE))))
+    return out
+
+
+def build(path=DEFAULT_PATH, rows=ROWS):
+    """Solve every state and write the table. Returns the PolicyTable."""
+    V, chase_bat, chase_bowl = solve_chase()
+    W, first_bat, first_bowl = solve_first(V)
+    cum = array("H")
+    values = array("f")
+    for kind in range(KINDS):
+        for i in range(rows):
+            if kind == CHASE_BAT:
+                mix, val = chase_bat[i + 1], V[i + 1]
+            elif kind == CHASE_BOWL:
+                mix, val = chase_bowl[i + 1], 1.0 - V[i + 1]
+            elif kind == FIRST_BAT:
+                mix, val = first_bat[i], W[i]
+            else:
+                mix, val = first_bowl[i], 1.0 - W[i]
+            cum.extend(_thresholds(mix))
+            values.append(val)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, rows, KINDS))
+        f.write(cum.tobytes())
+        f.write(values.tobytes())
+    os.replace(tmp, path)
+    return PolicyTable(cum, values, rows)
+
+# -----------------------------
+# Runtime table
+# -----------------------------
+
+class PolicyTable:
+    """
+    Precomputed mixes: row = kind * rows + state, six thresholds per row.
+    state is need - 1 in a chase and the score so far in a first innings.
+    """
+
+    def __init__(self, cum, values, rows):
+        self.cum = cum
+        self.values = values
+        self.rows = rows
+
+    def _row(self, role, runs_left, score):
+        if runs_left is not None:
+            kind = CHASE_BAT if role == "bat" else CHASE_BOWL
+            state = runs_left - 1
+        else:
+            kind = FIRST_BAT if role == "bat" else FIRST_BOWL
+            state = score
+        return kind * self.rows + min(max(state, 0), self.rows - 1)
+
+    def mix(self, role, runs_left=None, score=0):
+        """Probabilities of 0-6 for this side in this state."""
+        base = self._row(role, runs_left, score) * (N - 1)
+        cuts = [0] + list(self.cum[base:base + N - 1]) + [SCALE]
+        return [(cuts[a + 1] - cuts[a]) / SCALE for a in VALID_NUMS]
+
+    def value(self, role, runs_left=None, score=0):
+        """Win chance (ties half) for this side if both play the table."""
+        return self.values[self._row(role, runs_left, score)]
+
+    def pick(self, role, runs_left=None, score=0, rng=random, pred=None, blend=0.0):
+        """
+        Draw a number from the table.  With prob `blend` follow the
+        predictor instead: bowl `pred`, or bat anything in the table
+        except `pred`.
+        """
+        base = self._row(role, runs_left, score) * (N - 1)
+        if pred is not None and blend and rng.random() < blend:
+            if role == "bowl":
+                return pred
+            for _ in range(8):
+                c = bisect_right(self.cum, int(rng.random() * SCALE), base, base + N - 1) - base
+                if c != pred:
+                    return c
+            return (pred + 1 + rng.randrange(N - 1)) % N
+        return bisect_right(self.cum, int(rng.random() * SCALE), base, base + N - 1) - base
+
+
+def read(path=DEFAULT_PATH):
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, rows, kinds = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or kinds != KINDS:
+        raise ValueError(f"{path} is not an ODDTI policy table")
+    cum = array("H")
+    values = array("f")
+    split = HEADER.size + rows * kinds * (N - 1) * cum.itemsize
+    cum.frombytes(data[HEADER.size:split])
+    values.frombytes(data[split:])
+    if sys.byteorder != "little":
+        cum.byteswap()
+        values.byteswap()
+    return PolicyTable(cum, values, rows)
+
+
+def load(path=DEFAULT_PATH):
+    """Read the table, solving and writing it first if the file is missing."""
+    try:
+        return read(path)
+    except (OSError, ValueError):
+        return build(path)
+
+# -----------------------------
+# Check + timings
+# -----------------------------
+
+def _chase_sim(table, need, bat, bowl, games, rng):
+    """Chaser's win rate (ties half) with bat/bowl callables (runs_left)."""
+    total = 0.0
+    for _ in range(games):
+        left = need
+        while left > 0:
+            a, b = bat(left), bowl(left)
+            if a == b:
+                total += 0.5 if left == 1 else 0.0
+                break
+            left -= a
+        else:
+            total += 1.0
+    return total / games
+
+
+def check(games=20000, seed=3, path="oddti_policy_check.bin"):
+    """
+    The table's chase value must match play (table v table), and no
+    fixed batting number or random batting may beat it against the
+    table's bowler.
+    """
+    rng = random.Random(seed)
+    table = build(path)
+    try:
+        again = read(path)
+        if list(again.cum) != list(table.cum):
+            raise AssertionError("table did not round-trip through the file")
+        for need in (1, 6, 20, 45):
+            v = table.value("bat", need)
+            tbat = lambda left: table.pick("bat", left, rng=rng)
+            tbowl = lambda left: table.pick("bowl", left, rng=rng)
+            got = _chase_sim(table, need, tbat, tbowl, games, rng)
+            best = max(_chase_sim(table, need, lambda left, a=a: a, tbowl, games // 4, rng)
+                       for a in VALID_NUMS[1:])
+            rand = _chase_sim(table, need, lambda left: rng.randrange(N), tbowl, games, rng)
+            print(f"need {need:3}: value {v:.4f}  table v table {got:.4f}  "
+                  f"best fixed bat {best:.4f}  random bat {rand:.4f}")
+            slack = 4 * (0.25 / games) ** 0.5
+            if abs(got - v) > slack or rand > v + slack or best > v + 2 * slack:
+                raise AssertionError(f"policy is not an equilibrium at need {need}")
+    finally:
+        os.remove(path)
+
+
+def bench(path=DEFAULT_PATH, picks=1000000):
+    t0 = time.perf_counter()
+    build(path)
+    built = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    table = read(path)
+    loaded = time.perf_counter() - t0
+    pick = table.pick
+    t0 = time.perf_counter()
+    for k in range(picks):
+        pick("bowl", (k & 63) + 1)
+    dt = time.perf_counter() - t0
+    print(f"solve + write {built:.2f}s, {os.path.getsize(path):,} bytes; "
+          f"load {loaded * 1e3:.2f} ms; pick {dt / picks * 1e9:.0f} ns")
+
+
+if __name__ == "__main__":
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "check"
+    if cmd == "build":
+        build()
+    elif cmd == "bench":
+        bench()
+    else:
+        check()
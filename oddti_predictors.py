@@ -0,0 +1,593 @@
+# ==========================================================
+# ⚡ ODDTI™ v2.3 — Predictor models
+# Drop-in alternatives to the predictor edition's Predictor.
+# Every model keeps the same interface:
+#   pred.predict(prev) -> 0-6
+#   pred.update(prev, actual)
+#   pred.reset()
+#   pred.last_player_move
+# No external libs (stdlib only).
+# ==========================================================
+
+import random
+import time
+from array import array
+from bisect import insort
+from collections import OrderedDict
+
+VALID_NUMS = (0, 1, 2, 3, 4, 5, 6)
+N = len(VALID_NUMS)
+
+# -----------------------------
+# ArrayPredictor: frequency + 1-step Markov on a flat table
+# -----------------------------
+# Rows 0-6 of the table are the Markov rows (previous move -> next),
+# row 7 is the overall frequency.  Each row keeps its running maximum and
+# the sorted list of keys at that maximum, so predict() is one lookup and
+# one random.choice() with no scan and no new list.
+# -----------------------------
+FREQ_ROW = N
+
+class ArrayPredictor:
+    __slots__ = ("counts", "row_max", "row_ties", "last_player_move", "rng")
+
+    def __init__(self, rng=None):
+        self.rng = rng or random    # tie-breaking source (a random.Random or the module)
+        self.counts = array("l", [1]) * ((N + 1) * N)  # Laplace smoothing
+        self.row_max = array("l", [1]) * (N + 1)
+        self.row_ties = [list(VALID_NUMS) for _ in range(N + 1)]
+        self.last_player_move = None
+
+    def predict(self, prev=None):
+        """
+        Predict player's next number given prev (last move).
+        Uses the Markov row if prev is a valid move, else overall freq.
+        """
+        if prev is None:
+            prev = self.last_player_move
+        if prev is None or prev not in VALID_NUMS:
+            prev = FREQ_ROW
+        return self.rng.choice(self.row_ties[prev])
+
+    def _bump(self, row, k):
+        i = row * N + k
+        v = self.counts[i] + 1
+        self.counts[i] = v
+        top = self.row_max[row]
+        if v > top:
+            self.row_max[row] = v
+            ties = self.row_ties[row]
+            ties.clear()
+            ties.append(k)
+        elif v == top:
+            insort(self.row_ties[row], k)
+
+    def update(self, prev, actual):
+        """Update counts after observing actual (prev may be None)."""
+        if actual not in VALID_NUMS:
+            return
+        self._bump(FREQ_ROW, actual)
+        if prev is not None and prev in VALID_NUMS:
+            self._bump(prev, actual)
+        self.last_player_move = actual
+
+    def reset(self):
+        self.__init__(self.rng)
+
+    def load_counts(self, counts, last_player_move=None):
+        """Replace the table with 56 saved counts (Markov rows, then freq)."""
+        if len(counts) != (N + 1) * N:
+            raise ValueError("expected 56 counts")
+        self.counts = array(self.counts.typecode, counts)
+        for row in range(N + 1):
+            cells = self.counts[row * N:(row + 1) * N]
+            top = max(cells)
+            self.row_max[row] = top
+            self.row_ties[row] = [k for k in VALID_NUMS if cells[k] == top]
+        self.last_player_move = last_player_move
+
+    # dict views, same shape as Predictor.freq / Predictor.markov
+    @property
+    def freq(self):
+        base = FREQ_ROW * N
+        return {n: self.counts[base + n] for n in VALID_NUMS}
+
+    @property
+    def markov(self):
+        return {p: {n: self.counts[p * N + n] for n in VALID_NUMS} for p in VALID_NUMS}
+
+# -----------------------------
+# NGramPredictor: variable-order context model with backoff
+# -----------------------------
+# Looks at the last 1..order moves.  Each context is packed into one int
+# (one base-8 digit per move, newest lowest), and the packed keys for all
+# orders are rolled forward on every update, so no history is rescanned.
+# predict() tries the longest seen context first and backs off to shorter
+# ones, then to the overall frequency.  At most max_contexts contexts are
+# kept; the least recently updated ones are evicted when the cap is hit,
+# after the ball has been counted under every current context, so a
+# context in use is never dropped (as long as max_contexts >= order).
+# -----------------------------
+MAX_ORDER = 6
+
+class NGramPredictor:
+    __slots__ = ("order", "max_contexts", "min_support", "contexts", "keys",
+                 "base", "last_player_move", "evictions", "rng")
+
+    def __init__(self, order=3, max_contexts=50000, min_support=1, rng=None):
+        if not 1 <= order <= MAX_ORDER:
+            raise ValueError(f"order must be 1-{MAX_ORDER}")
+        if max_contexts < 1:
+            raise ValueError("max_contexts must be at least 1")
+        self.order = order
+        self.max_contexts = max_contexts
+        self.min_support = min_support
+        # key -> [total, row_max, ties, counts]
+        self.contexts = OrderedDict()
+        # keys[j] is the packed key of the last j+1 moves (0 = not enough history)
+        self.keys = [0] * order
+        self.rng = rng or random
+        self.base = ArrayPredictor(self.rng)   # order-0 frequency (row 7 only is used)
+        self.last_player_move = None
+        self.evictions = 0
+
+    def predict(self, prev=None):
+        """
+        Predict player's next number from the longest known context.
+        prev is only consulted when it differs from the last seen move.
+        """
+        if prev is not None and prev != self.last_player_move and prev in VALID_NUMS:
+            entry = self.contexts.get(prev + 1)
+            if entry is not None and entry[0] >= self.min_support:
+                return self.rng.choice(entry[2])
+        else:
+            contexts = self.contexts
+            for j in range(self.order - 1, -1, -1):
+                key = self.keys[j]
+                if key:
+                    entry = contexts.get(key)
+                    if entry is not None and entry[0] >= self.min_support:
+                        return self.rng.choice(entry[2])
+        return self.rng.choice(self.base.row_ties[FREQ_ROW])
+
+    def update(self, prev, actual):
+        """Count actual under every current context, then roll the keys."""
+        if actual not in VALID_NUMS:
+            return
+        self.base._bump(FREQ_ROW, actual)
+        contexts = self.contexts
+        keys = self.keys
+        for key in keys:
+            if not key:
+                break
+            entry = contexts.get(key)
+            if entry is None:
+                counts = array("l", [0]) * N
+                counts[actual] = 1
+                contexts[key] = [1, 1, [actual], counts]
+                continue
+            contexts.move_to_end(key)
+            counts = entry[3]
+            v = counts[actual] + 1
+            counts[actual] = v
+            entry[0] += 1
+            if v > entry[1]:
+                entry[1] = v
+                ties = entry[2]
+                ties.clear()
+                ties.append(actual)
+            elif v == entry[1]:
+                insort(entry[2], actual)
+        while len(contexts) > self.max_contexts:
+            contexts.popitem(last=False)
+            self.evictions += 1
+        digit = actual + 1
+        for j in range(self.order - 1, 0, -1):
+            prev_key = keys[j - 1]
+            keys[j] = prev_key * 8 + digit if prev_key else 0
+        keys[0] = digit
+        self.last_player_move = actual
+
+    def reset(self):
+        self.__init__(self.order, self.max_contexts, self.min_support, self.rng)
+
+    @property
+    def freq(self):
+        return self.base.freq
+
+    @property
+    def markov(self):
+        rows = {}
+        for p in VALID_NUMS:
+            entry = self.contexts.get(p + 1)
+            rows[p] = {n: (entry[3][n] if entry else 0) for n in VALID_NUMS}
+        return rows
+
+# -----------------------------
+# DecayingPredictor: recency-weighted counts
+# -----------------------------
+# Every observation loses half its weight after `half_life` more moves.
+# Instead of multiplying all 56 cells on each update, the predictor keeps
+# one global scale that grows by 1/decay per update and adds `scale`
+# (not 1) to the cells it touches; a cell's effective count is
+# counts[i] / scale.  Only ratios matter for argmax, so the running
+# max/tie bookkeeping of ArrayPredictor still holds.  When scale gets
+# large, all cells are divided by it once (renormalisation).
+# -----------------------------
+RENORM_AT = 1e100
+
+class DecayingPredictor(ArrayPredictor):
+    __slots__ = ("half_life", "decay", "scale")
+
+    def __init__(self, half_life=40.0, rng=None):
+        if half_life <= 0:
+            raise ValueError("half_life must be positive")
+        ArrayPredictor.__init__(self, rng)
+        self.half_life = half_life
+        self.decay = 0.5 ** (1.0 / half_life)
+        self.scale = 1.0
+        self.counts = array("d", self.counts)
+        self.row_max = array("d", self.row_max)
+
+    def _bump(self, row, k):
+        i = row * N + k
+        v = self.counts[i] + self.scale
+        self.counts[i] = v
+        top = self.row_max[row]
+        if v > top:
+            self.row_max[row] = v
+            ties = self.row_ties[row]
+            ties.clear()
+            ties.append(k)
+        elif v == top:
+            insort(self.row_ties[row], k)
+
+    def update(self, prev, actual):
+        """Decay everything by one step (lazily), then count actual."""
+        if actual not in VALID_NUMS:
+            return
+        self.scale /= self.decay
+        if self.scale > RENORM_AT:
+            self._renormalise()
+        self._bump(FREQ_ROW, actual)
+        if prev is not None and prev in VALID_NUMS:
+            self._bump(prev, actual)
+        self.last_player_move = actual
+
+    def _renormalise(self):
+        s = self.scale
+        counts = self.counts
+        for i in range(len(counts)):
+            counts[i] /= s
+        for row in range(N + 1):
+            self.row_max[row] /= s
+        self.scale = 1.0
+
+    def reset(self):
+        self.__init__(self.half_life, self.rng)
+
+    def load_counts(self, counts, last_player_move=None):
+        """Load effective counts (as returned by freq/markov)."""
+        ArrayPredictor.load_counts(self, [c * self.scale for c in counts],
+                                   last_player_move)
+
+    def effective(self, row, k):
+        return self.counts[row * N + k] / self.scale
+
+    @property
+    def freq(self):
+        return {n: self.effective(FREQ_ROW, n) for n in VALID_NUMS}
+
+    @property
+    def markov(self):
+        return {p: {n: self.effective(p, n) for n in VALID_NUMS} for p in VALID_NUMS}
+
+# -----------------------------
+# EnsemblePredictor: experts mixed by multiplicative weights
+# -----------------------------
+# Batting and bowling moves are kept apart: call set_role("bat"/"bowl")
+# (the player's role) before predict/update; the predictor edition's CPU
+# does this every ball.  Each role has its own experts:
+#   shared   ArrayPredictor over both roles (the classic predictor)
+#   markov   this role's Markov row after its own last move
+#   freq     this role's overall frequency
+#   repeat   this role's last move
+#   lag2     this role's move two balls back (a-b-a-b patterns)
+#   parity   most frequent number of the parity that usually follows
+# An expert votes for its set of equally likely numbers, splitting its
+# weight between them; predict() picks the number with the most weight.
+# update() multiplies a wrong expert's weight by beta (a right one tied
+# m ways by beta ** (1 - 1/m)) and rescales so the best weight is 1, with
+# a floor so an expert that was wrong for a while can come back when the
+# player changes habits.  Votes, weights, histories and the experts' tie
+# sets live in preallocated arrays/lists: every ball is the same small
+# amount of work and allocates nothing.
+# -----------------------------
+EXPERTS = ("shared", "markov", "freq", "repeat", "lag2", "parity")
+E = len(EXPERTS)
+ROLES = ("bat", "bowl")
+
+class EnsemblePredictor:
+    __slots__ = ("beta", "floor", "rng", "shared", "models", "history", "parity",
+                 "weights", "penalty", "picks", "singles", "votes", "zeros", "ties",
+                 "role", "pending", "last_player_move")
+
+    def __init__(self, beta=0.75, floor=1e-3, rng=None):
+        if not 0.0 < beta < 1.0:
+            raise ValueError("beta must be between 0 and 1")
+        self.beta = beta
+        self.floor = floor
+        self.rng = rng or random
+        self.shared = ArrayPredictor(self.rng)
+        self.models = [ArrayPredictor(self.rng) for _ in ROLES]
+        self.history = array("b", [-1]) * (2 * len(ROLES))   # per role: last, one before
+        self.parity = array("l", [1]) * (4 * len(ROLES))     # per role: [parity][next parity]
+        self.weights = array("d", [1.0]) * (E * len(ROLES))
+        # penalty[m]: factor for an expert that was right but tied m ways
+        self.penalty = array("d", [beta] + [beta ** (1.0 - 1.0 / m) for m in range(1, N + 1)])
+        self.singles = [[0], [0], [0]]   # tie sets of repeat, lag2, parity
+        self.picks = [None] * E          # each expert's tie set for this ball
+        self.votes = array("d", [0.0]) * N
+        self.zeros = array("d", [0.0]) * N
+        self.ties = []
+        self.role = 0
+        self.pending = False
+        self.last_player_move = None
+
+    def set_role(self, role):
+        r = 0 if role == "bat" else 1
+        if r != self.role:
+            self.role = r
+            self.pending = False
+
+    def _call_experts(self, prev):
+        r = self.role
+        picks, singles = self.picks, self.singles
+        shared, model = self.shared, self.models[r]
+        if prev is None:
+            prev = shared.last_player_move
+        picks[0] = shared.row_ties[FREQ_ROW if prev is None or prev not in VALID_NUMS else prev]
+        own = model.last_player_move
+        freq = picks[2] = model.row_ties[FREQ_ROW]
+        picks[1] = freq if own is None else model.row_ties[own]
+        last = self.history[2 * r]
+        if last < 0:
+            picks[3] = picks[4] = picks[5] = freq
+            return
+        singles[0][0] = last
+        picks[3] = singles[0]
+        before = self.history[2 * r + 1]
+        if before >= 0:
+            singles[1][0] = before
+            picks[4] = singles[1]
+        else:
+            picks[4] = singles[0]
+        p = last & 1
+        base = 4 * r + 2 * p
+        best = p if self.parity[base + p] > self.parity[base + 1 - p] else 1 - p
+        counts = model.counts
+        row = FREQ_ROW * N
+        for k in range(best + 2, N, 2):
+            if counts[row + k] > counts[row + best]:
+                best = k
+        singles[2][0] = best
+        picks[5] = singles[2]
+
+    def predict(self, prev=None):
+        """Weighted vote of this role's experts (ties broken at random)."""
+        self._call_experts(prev)
+        self.pending = True
+        votes, w = self.votes, self.weights
+        votes[:] = self.zeros
+        e = self.role * E
+        for ties in self.picks:
+            share = w[e] / len(ties)
+            for k in ties:
+                votes[k] += share
+            e += 1
+        top = max(votes)
+        if votes.count(top) == 1:
+            return votes.index(top)
+        ties = self.ties
+        ties.clear()
+        for k in range(N):
+            if votes[k] == top:
+                ties.append(k)
+        return self.rng.choice(ties)
+
+    def update(self, prev, actual):
+        """Score the experts on actual, then teach every model it."""
+        if actual not in VALID_NUMS:
+            return
+        if not self.pending:
+            self._call_experts(prev)     # the CPU did not ask this ball
+        self.pending = False
+        r = self.role
+        w, penalty, beta, floor = self.weights, self.penalty, self.beta, self.floor
+        e = base = r * E
+        top = 0.0
+        for ties in self.picks:
+            v = w[e] * (penalty[len(ties)] if actual in ties else beta)
+            if v < floor:
+                v = floor               # the best was 1.0, so this is relative
+            w[e] = v
+            if v > top:
+                top = v
+            e += 1
+        if top < 1.0:
+            for e in range(base, base + E):
+                w[e] /= top
+
+        shared = self.shared
+        if prev is not None and prev in VALID_NUMS:
+            shared._bump(prev, actual)
+        shared._bump(FREQ_ROW, actual)
+        shared.last_player_move = actual
+        model = self.models[r]
+        last = self.history[2 * r]
+        if last >= 0:
+            model._bump(last, actual)
+            self.parity[4 * r + 2 * (last & 1) + (actual & 1)] += 1
+        model._bump(FREQ_ROW, actual)
+        model.last_player_move = actual
+        self.history[2 * r + 1] = last
+        self.history[2 * r] = actual
+        self.last_player_move = actual
+
+    def reset(self):
+        self.__init__(self.beta, self.floor, self.rng)
+
+    def expert_weights(self):
+        """{role: {expert: weight}} (best expert of a role is 1.0)."""
+        return {role: {name: self.weights[r * E + e] for e, name in enumerate(EXPERTS)}
+                for r, role in enumerate(ROLES)}
+
+    # dict views of the shared table, same shape as Predictor.freq / markov
+    @property
+    def freq(self):
+        return self.shared.freq
+
+    @property
+    def markov(self):
+        return self.shared.markov
+
+# -----------------------------
+# Checks and benchmarks (python oddti_predictors.py; the equivalence
+# with the edition's Predictor is tests/test_predictors.py)
+# -----------------------------
+
+def _reference_class():
+    from oddti_edition import load_edition
+    return load_edition().Predictor
+
+
+def check_decay_accuracy(balls=1000000, half_life=40.0, seed=5):
+    """
+    Run DecayingPredictor next to an eager reference that multiplies all
+    56 cells every ball, and report the worst relative error and how
+    often the two disagree on the set of most likely moves.
+    """
+    lazy = DecayingPredictor(half_life)
+    d = lazy.decay
+    eager = [1.0] * ((N + 1) * N)
+    rng = random.Random(seed)
+    prev = None
+    worst = 0.0
+    tie_diffs = 0
+    for b in range(balls):
+        actual = rng.choice(VALID_NUMS) if rng.random() < 0.7 else (prev or 0)
+        eager = [c * d for c in eager]
+        eager[FREQ_ROW * N + actual] += 1
+        if prev is not None:
+            eager[prev * N + actual] += 1
+        lazy.update(prev, actual)
+        prev = actual
+        if b % 97 == 0 or b == balls - 1:
+            for row in range(N + 1):
+                cells = eager[row * N:(row + 1) * N]
+                for k in VALID_NUMS:
+                    err = abs(lazy.effective(row, k) - cells[k]) / cells[k]
+                    worst = max(worst, err)
+                top = max(cells)
+                ties = [k for k in VALID_NUMS if top - cells[k] <= top * 1e-12]
+                if ties != lazy.row_ties[row]:
+                    tie_diffs += 1
+    print(f"DecayingPredictor over {balls} balls: max relative error {worst:.2e}, "
+          f"tie-set mismatches {tie_diffs}")
+    return worst, tie_diffs
+
+
+def benchmark(model_classes=None, balls=200000, seed=1):
+    """Print predictions/sec (predict + update per ball) for each class."""
+    if model_classes is None:
+        model_classes = (_reference_class(), ArrayPredictor)
+    rng = random.Random(seed)
+    moves = [rng.choice(VALID_NUMS) for _ in range(balls)]
+    rates = {}
+    for cls in model_classes:
+        pred = cls()
+        random.seed(seed)
+        predict, update = pred.predict, pred.update
+        prev = None
+        t0 = time.perf_counter()
+        for m in moves:
+            predict(prev)
+            update(prev, m)
+            prev = m
+        dt = time.perf_counter() - t0
+        rates[cls.__name__] = balls / dt
+        print(f"{cls.__name__:16} {balls / dt:12,.0f} predictions/sec")
+    return rates
+
+
+def _habit_moves(kind, rng):
+    """Move function (role, own history) -> 0-6 for a simulated player."""
+    if kind == "random":
+        return lambda role, hist: rng.choice(VALID_NUMS)
+    if kind == "repeater":
+        return lambda role, hist: (hist[-1] if hist and rng.random() < 0.7
+                                   else rng.choice(VALID_NUMS))
+    if kind == "cycler":
+        cycles = {"bat": (4, 6, 5), "bowl": (1, 2, 3)}
+        return lambda role, hist: (cycles[role][len(hist) % 3] if rng.random() < 0.8
+                                   else rng.choice(VALID_NUMS))
+    if kind == "alternator":
+        return lambda role, hist: (rng.choice((1, 3, 5, 5)) if not hist or hist[-1] % 2 == 0
+                                   else rng.choice((0, 2, 4, 6, 6)))
+    if kind == "role habits":
+        return lambda role, hist: rng.choice((6, 6, 5, 4) if role == "bat" else (1, 2, 2, 0))
+    if kind == "switcher":
+        fav = [3]
+        def move(role, hist):
+            if len(hist) % 60 == 59:
+                fav[0] = rng.choice(VALID_NUMS)
+            return fav[0] if rng.random() < 0.6 else rng.choice(VALID_NUMS)
+        return move
+    raise ValueError(kind)
+
+
+HABITS = ("random", "repeater", "cycler", "alternator", "role habits", "switcher")
+
+
+def compare_hit_rates(model_classes=None, balls=30000, seed=3):
+    """
+    Hit rate of each model on the same simulated players.  Innings end at
+    random (1 in 6 balls) and the player's role swaps, as in a match.
+    """
+    if model_classes is None:
+        model_classes = (_reference_class(), ArrayPredictor, EnsemblePredictor)
+    names = [cls.__name__ for cls in model_classes]
+    print(f"{'player':12}" + "".join(f"{n:>20}" for n in names))
+    rates = {}
+    for kind in HABITS:
+        row = []
+        for cls in model_classes:
+            rng = random.Random(seed)
+            random.seed(seed)
+            move = _habit_moves(kind, rng)
+            pred = cls()
+            set_role = getattr(pred, "set_role", None)
+            hist = {"bat": [], "bowl": []}
+            role = "bat"
+            hits = 0
+            for _ in range(balls):
+                if set_role is not None:
+                    set_role(role)
+                guess = pred.predict(pred.last_player_move)
+                actual = move(role, hist[role])
+                hist[role].append(actual)
+                hits += guess == actual
+                pred.update(pred.last_player_move, actual)
+                if rng.random() < 1 / 6:
+                    role = "bowl" if role == "bat" else "bat"
+            row.append(hits / balls)
+        rates[kind] = dict(zip(names, row))
+        print(f"{kind:12}" + "".join(f"{r:20.1%}" for r in row))
+    return rates
+
+
+if __name__ == "__main__":
+    check_decay_accuracy()
+    benchmark((_reference_class(), ArrayPredictor, NGramPredictor, DecayingPredictor,
+               EnsemblePredictor))
+    compare_hit_rates()
@@ -0,0 +1,150 @@
+# ==========================================================
+# ⚡ ODDTI™ v2.3 — CPU batting samplers
+# Precomputed alias tables for the CPU's batting pick, so choosing a
+# number is one random() and two lookups instead of building lists.
+# No external libs (stdlib only).
+# ==========================================================
+#
+# A weighting scheme is a function weight(n, runs_left) -> float >= 0.
+# For every scheme the sampler builds one alias table per
+#   (excluded prediction 0-6 or none) x (runs_left 1-6 or "more/none")
+# the first time the scheme is used, i.e. 8 x 7 tables of 7 entries.
+#   sampler = get_sampler("value")
+#   c = sampler.pick(pred, runs_left, rng)   # pred=None excludes nothing
+# ==========================================================
+
+import random
+import time
+
+VALID_NUMS = (0, 1, 2, 3, 4, 5, 6)
+N = len(VALID_NUMS)
+NEAR = 6            # runs_left 1..6 get their own tables
+
+
+def value_weight(n, runs_left):
+    """The edition's original policy: weight 1 + n for every number."""
+    return 1 + n
+
+
+def uniform_weight(n, runs_left):
+    return 1
+
+
+def target_weight(n, runs_left):
+    """
+    Value weighting, but when the chase is within one ball, lean hard on
+    numbers that finish it and prefer the smallest of those (more of them
+    left un-guessed by a bowler who expects a big hit).
+    """
+    if runs_left is None or runs_left > NEAR:
+        return 1 + n
+    if n >= runs_left:
+        return 8 + (NEAR - n)
+    return 1
+
+
+SCHEMES = {
+    "value": value_weight,
+    "uniform": uniform_weight,
+    "target": target_weight,
+}
+
+def register_scheme(name, weight):
+    """Add a weighting scheme usable by get_sampler(name)."""
+    SCHEMES[name] = weight
+    _samplers.pop(name, None)
+
+
+class AliasTable:
+    """Walker/Vose alias table over VALID_NUMS."""
+    __slots__ = ("prob", "alias")
+
+    def __init__(self, weights):
+        total = float(sum(weights))
+        if total <= 0:
+            raise ValueError("weights must not all be zero")
+        scaled = [w * N / total for w in weights]
+        self.prob = [1.0] * N
+        self.alias = list(VALID_NUMS)
+        small = [i for i in VALID_NUMS if scaled[i] < 1.0]
+        large = [i for i in VALID_NUMS if scaled[i] >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+    def sample(self, rng):
+        x = rng.random() * N
+        i = int(x)
+        return i if x - i < self.prob[i] else self.alias[i]
+
+
+class BattingSampler:
+    def __init__(self, weight):
+        self.weight = weight
+        # tables[bucket][excluded]; excluded index N means "nothing excluded"
+        self.tables = []
+        for bucket in range(NEAR + 1):
+            runs_left = None if bucket == 0 else bucket
+            row = []
+            for excluded in range(N + 1):
+                row.append(AliasTable([0 if n == excluded else weight(n, runs_left)
+                                       for n in VALID_NUMS]))
+            self.tables.append(row)
+
+    def pick(self, pred, runs_left, rng=random):
+        """Draw a batting number, never `pred` (if given)."""
+        bucket = runs_left if runs_left is not None and 0 < runs_left <= NEAR else 0
+        return self.tables[bucket][N if pred is None else pred].sample(rng)
+
+
+_samplers = {}
+
+def get_sampler(name="value"):
+    sampler = _samplers.get(name)
+    if sampler is None:
+        sampler = _samplers[name] = BattingSampler(SCHEMES[name])
+    return sampler
+
+# -----------------------------
+# Microbenchmark (python oddti_sampling.py)
+# -----------------------------
+
+def _list_pick(pred, rng):
+    # the original cpu_choose_when_batting body
+    candidates = [n for n in VALID_NUMS if n != pred]
+    weighted = []
+    for n in candidates:
+        weight = 1 + n
+        weighted.extend([n] * weight)
+    return rng.choice(weighted)
+
+
+def benchmark(balls=500000, seed=3):
+    rng = random.Random(seed)
+    preds = [rng.choice(VALID_NUMS) for _ in range(balls)]
+    sampler = get_sampler("value")
+    pick = sampler.pick
+    counts = {"list": [0] * N, "alias": [0] * N}
+
+    t0 = time.perf_counter()
+    for p in preds:
+        counts["list"][_list_pick(p, rng)] += 1
+    before = (time.perf_counter() - t0) / balls
+
+    t0 = time.perf_counter()
+    for p in preds:
+        counts["alias"][pick(p, None, rng)] += 1
+    after = (time.perf_counter() - t0) / balls
+
+    print(f"per ball: list building {before * 1e9:.0f} ns, alias table {after * 1e9:.0f} ns "
+          f"(x{before / after:.1f})")
+    print("share   ", " ".join(f"{n:>6}" for n in VALID_NUMS))
+    for name, c in counts.items():
+        print(f"{name:8}", " ".join(f"{x / balls:6.3f}" for x in c))
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,477 @@
+# ==========================================================
+# ⚡ ODDTI™ v2.3 — Multi-session game server
+# Hosts many matches in one process over a plain TCP line protocol.
+# Each connection gets its own Session (toss/innings/series state,
+# Predictor, epsilon and random stream) instead of the edition's globals.
+# No external libs (stdlib asyncio, PC only).
+# ==========================================================
+#
+# Protocol: the server sends text lines.  A line starting with "? " is a
+# prompt and the client answers with one line:
+#   ? mode single/series     ? call odd/even     ? toss 0-6
+#   ? elect bat/bowl         ? bat 0-6           ? bowl 0-6
+# Every other line is commentary.  "bye" ends the session.  A line longer
+# than LINE_LIMIT bytes gets "Line too long ..." and "bye", then the
+# connection is closed.
+# With checkpoints on (serve [port] [host] [dir]) the server first sends
+# "session <id>" and saves the session after every line; after a restart
+# the client answers the mode prompt with "resume <id>" to carry on.
+#
+#   python oddti_server.py serve [port] [host] [checkpoint dir]
+#   python oddti_server.py load [clients] [seconds] [host] [port]
+#   python oddti_server.py bench [clients] [seconds]   (server + clients)
+#   nc localhost 8023                                  (play by hand)
+# ==========================================================
+
+import asyncio
+import os
+import random
+import secrets
+import sys
+import time
+from array import array
+
+from oddti_predictors import ArrayPredictor
+from oddti_sampling import get_sampler
+
+VALID_NUMS = (0, 1, 2, 3, 4, 5, 6)
+USE_PREDICTOR = True
+PREDICTOR_EPSILON = 0.12
+BATTING_SCHEME = "value"
+DEFAULT_PORT = 8023
+LINE_LIMIT = 1024           # longest client line the stream reader buffers
+
+# -----------------------------
+# Session: one match or series, driven one line at a time
+# -----------------------------
+class Session:
+    def __init__(self, rng=None, predictor=None, epsilon=PREDICTOR_EPSILON,
+                 use_predictor=USE_PREDICTOR, batting_scheme=BATTING_SCHEME):
+        self.rng = rng or random.Random()
+        self.batting_scheme = batting_scheme
+        self.sampler = get_sampler(batting_scheme)
+        self.predictor = predictor if predictor is not None else ArrayPredictor(self.rng)
+        self.epsilon = epsilon
+        self.use_predictor = use_predictor
+        self.phase = "mode"
+        self.prompt = "? mode single/series"
+        self.series = False
+        self.match_no = 0
+        self.player_wins = 0
+        self.comp_wins = 0
+        self.player_parity = None
+        self.player_first = True
+        self.innings = 0
+        self.batting = None
+        self.score = 0
+        self.first_score = 0
+        self.target = None
+        self.cpu_move = None
+        self.prev_player_move = None
+        self.balls = 0
+
+    def start(self):
+        return ["=== ⚡ ODDTI™ v2.3 (server) ===", self.prompt]
+
+    def feed(self, line):
+        """Handle one client line and return the lines to send back."""
+        out = []
+        if self.phase == "done":
+            return out
+        getattr(self, "_on_" + self.phase)(line.strip().lower(), out)
+        if self.phase != "done":
+            out.append(self.prompt)
+        return out
+
+    def _ask(self, phase, prompt):
+        self.phase = phase
+        self.prompt = prompt
+
+    def current_prompt(self):
+        """The prompt for the current phase (used when a session is restored)."""
+        if self.phase == "ball":
+            return "? bat 0-6" if self.batting == "player" else "? bowl 0-6"
+        return {"mode": "? mode single/series", "call": "? call odd/even",
+                "toss": "? toss 0-6", "elect": "? elect bat/bowl"}.get(self.phase, "")
+
+    @staticmethod
+    def _num(v, out):
+        try:
+            n = int(v)
+        except ValueError:
+            n = -1
+        if n not in VALID_NUMS:
+            out.append("Value must be one of: 0-6")
+            return None
+        return n
+
+    # ---- CPU choices (same policy as the predictor edition) ----
+    def cpu_choose_when_bowling(self):
+        if self.use_predictor and self.rng.random() > self.epsilon:
+            return self.predictor.predict(self.prev_player_move)
+        return self.rng.choice(VALID_NUMS)
+
+    def cpu_choose_when_batting(self):
+        if self.use_predictor and self.rng.random() > self.epsilon:
+            pred = self.predictor.predict(self.prev_player_move)
+            runs_left = None if self.target is None else self.target + 1 - self.score
+            return self.sampler.pick(pred, runs_left, self.rng)
+        return self.rng.choice(VALID_NUMS)
+
+    # ---- toss ----
+    def _on_mode(self, v, out):
+        if v not in ("single", "series"):
+            out.append("Invalid choice. Options: single, series")
+            return
+        self.series = v == "series"
+        self._new_match(out)
+
+    def _new_match(self, out):
+        self.match_no += 1
+        if self.series:
+            out.append(f"=== SERIES: Match {self.match_no}/3 ===")
+        self._ask("call", "? call odd/even")
+
+    def _on_call(self, v, out):
+        if v not in ("odd", "even"):
+            out.append("Invalid choice. Options: odd, even")
+            return
+        self.player_parity = v
+        self._ask("toss", "? toss 0-6")
+
+    def _on_toss(self, v, out):
+        player_num = self._num(v, out)
+        if player_num is None:
+            return
+        comp_num = self.rng.choice(VALID_NUMS)
+        s = player_num + comp_num
+        parity = "even" if s % 2 == 0 else "odd"
+        out.append(f"You: {player_num}, Computer: {comp_num}")
+        out.append(f"Sum = {s} → {parity}")
+        if parity == self.player_parity:
+            out.append("You win the toss!")
+            self._ask("elect", "? elect bat/bowl")
+            return
+        out.append("Computer wins the toss!")
+        comp_choice = self.rng.choice(("bat", "bowl"))
+        out.append(f"Computer chooses to {comp_choice}.")
+        self.player_first = comp_choice != "bat"
+        self._start_innings(1, out)
+
+    def _on_elect(self, v, out):
+        if v not in ("bat", "bowl"):
+            out.append("Invalid choice. Options: bat, bowl")
+            return
+        self.player_first = v == "bat"
+        self._start_innings(1, out)
+
+    # ---- innings ----
+    def _start_innings(self, innings, out):
+        self.innings = innings
+        player_bats = self.player_first == (innings == 1)
+        self.batting = "player" if player_bats else "computer"
+        self.score = 0
+        self.target = None if innings == 1 else self.first_score
+        out.append(f"--- {self.batting.upper()} INNINGS START ---")
+        self._next_ball()
+
+    def _next_ball(self):
+        if self.batting == "player":
+            self.cpu_move = None
+            self._ask("ball", "? bat 0-6")
+        else:
+            # CPU commits to its bat before the player bowls
+            self.cpu_move = self.cpu_choose_when_batting()
+            self._ask("ball", "? bowl 0-6")
+
+    def _on_ball(self, v, out):
+        p = self._num(v, out)
+        if p is None:
+            return
+        self.balls += 1
+        prev = self.prev_player_move
+        if self.batting == "player":
+            c = self.cpu_choose_when_bowling()
+            out.append(f"Computer bowls: {c}")
+        else:
+            c = self.cpu_move
+            out.append(f"Computer bats: {c}")
+        self.predictor.update(prev, p)
+        self.prev_player_move = p
+        if p == c:
+            out.append("You're OUT!" if self.batting == "player" else "Computer is OUT!")
+            self._end_innings(out)
+            return
+        runs = p if self.batting == "player" else c
+        self.score += runs
+        out.append(f"Runs this ball: {runs} | Total: {self.score}")
+        if self.target is not None:
+            runs_left = self.target + 1 - self.score
+            if runs_left <= 0:
+                out.append("Target achieved! 🎯")
+                self._end_innings(out)
+                return
+            out.append(f"Runs required: {runs_left}")
+        self._next_ball()
+
+    def _end_innings(self, out):
+        out.append(f"--- {self.batting.upper()} INNINGS END: Score = {self.score} ---")
+        if self.innings == 1:
+            self.first_score = self.score
+            chaser = "Computer needs" if self.batting == "player" else "You need"
+            out.append(f"{chaser} {self.score + 1} to win.")
+            self._start_innings(2, out)
+        else:
+            self._end_match(out)
+
+    # ---- match / series ----
+    def match_scores(self):
+        if self.player_first:
+            return self.first_score, self.score
+        return self.score, self.first_score
+
+    def _end_match(self, out):
+        p_score, c_score = self.match_scores()
+        out.append(f"Player score    : {p_score}")
+        out.append(f"Computer score  : {c_score}")
+        if p_score > c_score:
+            out.append(f"Result: Player wins by {p_score - c_score} runs.")
+            self.player_wins += 1
+        elif c_score > p_score:
+            out.append(f"Result: Computer wins by {c_score - p_score} runs.")
+            self.comp_wins += 1
+        else:
+            out.append("Result: Match tied!")
+        if self.series:
+            out.append(f"Series so far: Player {self.player_wins} - Computer {self.comp_wins}")
+            if self.match_no < 3 and self.player_wins < 2 and self.comp_wins < 2:
+                self._new_match(out)
+                return
+            if self.player_wins > self.comp_wins:
+                out.append(f"You win the series {self.player_wins} - {self.comp_wins}! 🏆")
+            elif self.comp_wins > self.player_wins:
+                out.append(f"Computer wins the series {self.comp_wins} - {self.player_wins}! 🤖")
+            else:
+                out.append("Series tied overall.")
+        out.append("bye")
+        self.phase = "done"
+
+# -----------------------------
+# Server
+# -----------------------------
+LATENCY_SAMPLES = 1 << 16
+
+class ServerStats:
+    """Connection counts, ball throughput and a ring of per-ball latencies."""
+
+    def __init__(self):
+        self.open = 0
+        self.total = 0
+        self.balls = 0
+        self.latency = array("d", [0.0]) * LATENCY_SAMPLES
+        self.samples = 0
+        self._last_balls = 0
+        self._last_time = time.perf_counter()
+
+    def record(self, seconds):
+        self.latency[self.samples % LATENCY_SAMPLES] = seconds
+        self.samples += 1
+        self.balls += 1
+
+    def report(self):
+        now = time.perf_counter()
+        rate = (self.balls - self._last_balls) / max(now - self._last_time, 1e-9)
+        self._last_balls, self._last_time = self.balls, now
+        return (f"conns {self.open} open / {self.total} total | {rate:,.0f} balls/s | "
+                f"latency {_percentiles(self.latency[:min(self.samples, LATENCY_SAMPLES)])}")
+
+
+def _percentiles(samples, points=(50, 95, 99)):
+    if not samples:
+        return "n/a"
+    xs = sorted(samples)
+    parts = []
+    for p in points:
+        x = xs[min(len(xs) - 1, int(len(xs) * p / 100))]
+        parts.append(f"p{p} {x * 1e6:.0f}us")
+    return " ".join(parts)
+
+
+class GameServer:
+    def __init__(self, session_factory=Session, checkpoint_dir=None):
+        self.session_factory = session_factory
+        self.checkpoint_dir = checkpoint_dir    # oddti_checkpoint files, one per session
+        self.stats = ServerStats()
+
+    def _checkpoint(self, sid):
+        from oddti_checkpoint import Checkpoint
+        return Checkpoint(os.path.join(self.checkpoint_dir, f"{sid}.ckpt"))
+
+    def _resume(self, text, ck):
+        """Swap in the saved session named by "resume <id>", if there is one."""
+        sid = text.split()[-1]
+        if not sid.isalnum() or not os.path.exists(
+                os.path.join(self.checkpoint_dir, f"{sid}.ckpt")):
+            return None, ck
+        saved = self._checkpoint(sid)
+        session = saved.restore()
+        if session is None or session.phase == "done":
+            saved.close()
+            return None, ck
+        ck.remove()
+        return session, saved
+
+    async def handle(self, reader, writer):
+        stats = self.stats
+        stats.open += 1
+        stats.total += 1
+        session = self.session_factory()
+        ck = None
+        try:
+            lines = session.start()
+            if self.checkpoint_dir is not None:
+                sid = secrets.token_hex(6)
+                ck = self._checkpoint(sid)
+                lines.insert(1, f"session {sid}")
+            writer.write(("\n".join(lines) + "\n").encode())
+            while session.phase != "done":
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    # no newline within LINE_LIMIT bytes: the stream cannot resync
+                    writer.write(f"Line too long (max {LINE_LIMIT} bytes).\nbye\n".encode())
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                t0 = time.perf_counter()
+                ball = session.phase == "ball"
+                text = line.decode("utf-8", "replace")
+                if ck is not None and session.phase == "mode" and text.startswith("resume"):
+                    restored, ck = self._resume(text.strip(), ck)
+                    if restored is None:
+                        out = ["No saved session with that id.", session.prompt]
+                    else:
+                        session = restored
+                        out = [f"Resumed match {session.match_no}, "
+                               f"score {session.score}.", session.prompt]
+                else:
+                    out = session.feed(text)
+                    if ck is not None:
+                        ck.save(session)
+                writer.write(("\n".join(out) + "\n").encode())
+                if ball:
+                    stats.record(time.perf_counter() - t0)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            stats.open -= 1
+            if ck is not None:
+                if session.phase == "done":
+                    ck.remove()
+                else:
+                    ck.close()
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=DEFAULT_PORT, report_every=5.0):
+        server = await asyncio.start_server(self.handle, host, port, limit=LINE_LIMIT)
+        port = server.sockets[0].getsockname()[1]
+        print(f"ODDTI server on {host}:{port}")
+        async with server:
+            while True:
+                await asyncio.sleep(report_every)
+                print(self.stats.report())
+
+# -----------------------------
+# Load client (random player over real sockets)
+# -----------------------------
+
+async def _client(host, port, deadline, rng, rtts, counts):
+    while time.perf_counter() < deadline:
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            sent = None
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                text = line.decode("utf-8", "replace").rstrip("\n")
+                if text == "bye":
+                    break
+                if not text.startswith("? "):
+                    continue
+                if sent is not None:
+                    rtts.append(time.perf_counter() - sent)
+                    counts[0] += 1
+                if time.perf_counter() >= deadline:
+                    break
+                kind = text.split()[1]
+                if kind == "mode":
+                    answer = "series"
+                elif kind == "call":
+                    answer = rng.choice(("odd", "even"))
+                elif kind == "elect":
+                    answer = rng.choice(("bat", "bowl"))
+                else:
+                    answer = str(rng.choice(VALID_NUMS))
+                sent = time.perf_counter() if kind in ("bat", "bowl") else None
+                writer.write((answer + "\n").encode())
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+async def load_test(clients=1000, seconds=10.0, host="127.0.0.1", port=DEFAULT_PORT, seed=0):
+    """Run `clients` concurrent random players; print balls/sec and RTT percentiles."""
+    rtts, counts = [], [0]
+    deadline = time.perf_counter() + seconds
+    t0 = time.perf_counter()
+    tasks = [_client(host, port, deadline, random.Random(seed + i), rtts, counts)
+             for i in range(clients)]
+    await asyncio.gather(*tasks)
+    dt = time.perf_counter() - t0
+    print(f"{clients} clients, {counts[0]} balls in {dt:.1f}s = {counts[0] / dt:,.0f} balls/s")
+    print(f"round trip {_percentiles(rtts)}")
+    return counts[0] / dt
+
+
+async def bench(clients=1000, seconds=10.0):
+    """Start a server on a free port and load it from the same process."""
+    game = GameServer()
+    server = await asyncio.start_server(game.handle, "127.0.0.1", 0, limit=LINE_LIMIT,
+                                        backlog=clients)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        await load_test(clients, seconds, "127.0.0.1", port)
+    print("server:", game.stats.report())
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    cmd = argv[0] if argv else "serve"
+    if cmd == "serve":
+        port = int(argv[1]) if len(argv) > 1 else DEFAULT_PORT
+        host = argv[2] if len(argv) > 2 else "127.0.0.1"
+        checkpoint_dir = argv[3] if len(argv) > 3 else None
+        if checkpoint_dir:
+            os.makedirs(checkpoint_dir, exist_ok=True)
+        asyncio.run(GameServer(checkpoint_dir=checkpoint_dir).serve(host, port))
+    elif cmd == "load":
+        args = [int(argv[1]) if len(argv) > 1 else 1000,
+                float(argv[2]) if len(argv) > 2 else 10.0,
+                argv[3] if len(argv) > 3 else "127.0.0.1",
+                int(argv[4]) if len(argv) > 4 else DEFAULT_PORT]
+        asyncio.run(load_test(*args))
+    elif cmd == "bench":
+        asyncio.run(bench(int(argv[1]) if len(argv) > 1 else 1000,
+                          float(argv[2]) if len(argv) > 2 else 10.0))
+    else:
+        print("usage: oddti_server.py serve|load|bench")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
@@ -0,0 +1,242 @@
+# ==========================================================
+# ⚡ ODDTI™ v2.3 — Headless Match Simulator
+# Batch engine for evaluating strategies without input()/print()
+# Platform: Python 3.8+ with NumPy (PC only, not for TI-84)
+# ==========================================================
+
+import random
+import sys
+import time
+
+import numpy as np
+
+VALID_NUMS = (0, 1, 2, 3, 4, 5, 6)
+MAX_BALLS = 10000   # safety cap for scripted sides that never collide
+
+# -----------------------------
+# Strategies
+# -----------------------------
+# A Strategy describes how one side picks numbers for a whole batch of
+# matches at once.  Mixed strategies are drawn from a probability vector,
+# scripted strategies repeat a fixed sequence from the first ball of each
+# innings.  Batting and bowling can use different plans.
+#   s = Strategy.random()
+#   s = Strategy.mixed(bat=[...7 probs...], bowl=[...])
+#   s = Strategy.scripted(bat=[6, 6, 4], bowl=[0, 1])
+# -----------------------------
+class Strategy:
+    def __init__(self, bat, bowl, call=None, elect=None):
+        self.bat = bat
+        self.bowl = bowl
+        self.call = call      # "odd"/"even" or None for a coin flip
+        self.elect = elect    # "bat"/"bowl" or None for a coin flip
+
+    @classmethod
+    def random(cls):
+        return cls.mixed()
+
+    @classmethod
+    def mixed(cls, bat=None, bowl=None, **kw):
+        return cls(_Mixed(bat), _Mixed(bowl if bowl is not None else bat), **kw)
+
+    @classmethod
+    def scripted(cls, bat, bowl=None, **kw):
+        return cls(_Scripted(bat), _Scripted(bowl if bowl is not None else bat), **kw)
+
+    def draw(self, rng, role, step, n):
+        plan = self.bat if role == "bat" else self.bowl
+        return plan.draw(rng, step, n)
+
+
+class _Mixed:
+    def __init__(self, probs=None):
+        if probs is None:
+            probs = [1.0] * len(VALID_NUMS)
+        p = np.asarray(probs, dtype=float)
+        if p.shape != (len(VALID_NUMS),) or (p < 0).any() or p.sum() <= 0:
+            raise ValueError("mixed strategy needs 7 non-negative weights")
+        self.probs = p / p.sum()
+        self.cdf = np.cumsum(self.probs)
+        self.cdf[-1] = 1.0
+        self.uniform = bool(np.allclose(self.probs, 1.0 / len(VALID_NUMS)))
+
+    def draw(self, rng, step, n):
+        if self.uniform:
+            return rng.integers(0, len(VALID_NUMS), size=n, dtype=np.int8)
+        return np.searchsorted(self.cdf, rng.random(n), side="right").astype(np.int8)
+
+
+class _Scripted:
+    def __init__(self, seq):
+        seq = np.asarray(list(seq), dtype=np.int8)
+        if seq.size == 0 or (seq < 0).any() or (seq > 6).any():
+            raise ValueError("scripted strategy needs moves in 0-6")
+        self.seq = seq
+
+    def draw(self, rng, step, n):
+        return np.full(n, self.seq[step % self.seq.size], dtype=np.int8)
+
+# -----------------------------
+# Batched innings / toss / match
+# -----------------------------
+
+def simulate_innings(rng, batter, bowler, n, target=None, max_balls=MAX_BALLS):
+    """
+    Play n innings side by side with the play_innings rules: the batter's
+    number is scored unless it equals the bowler's (OUT), and a chase stops
+    as soon as target + 1 is reached.  target is None or an int array.
+    Returns (scores, balls) as int arrays.
+    """
+    scores = np.zeros(n, dtype=np.int64)
+    balls = np.zeros(n, dtype=np.int64)
+    need = None if target is None else np.asarray(target, dtype=np.int64) + 1
+    active = np.arange(n)
+    step = 0
+    while active.size and step < max_balls:
+        m = active.size
+        bat = batter.draw(rng, "bat", step, m)
+        bowl = bowler.draw(rng, "bowl", step, m)
+        out = bat == bowl
+        scores[active] += np.where(out, 0, bat)
+        balls[active] += 1
+        done = out
+        if need is not None:
+            done = done | (scores[active] >= need[active])
+        active = active[~done]
+        step += 1
+    return scores, balls
+
+
+def simulate_toss(rng, player, n):
+    """Return a bool array: True where the player bats first."""
+    if player.call is None:
+        call_even = rng.integers(0, 2, size=n) == 0
+    else:
+        call_even = np.full(n, player.call == "even")
+    s = rng.integers(0, 7, size=n) + rng.integers(0, 7, size=n)
+    player_wins = (s % 2 == 0) == call_even
+    if player.elect is None:
+        player_bats = rng.integers(0, 2, size=n) == 0
+    else:
+        player_bats = np.full(n, player.elect == "bat")
+    # CPU picks bat/bowl with a coin flip, as in single_match()
+    cpu_bats = rng.integers(0, 2, size=n) == 0
+    return np.where(player_wins, player_bats, ~cpu_bats)
+
+
+def simulate_matches(rng, player, cpu, n, max_balls=MAX_BALLS):
+    """
+    Play n single matches (toss + both innings).  Returns a dict of arrays:
+    player_score, cpu_score, player_first, balls, winner (1 player, -1 cpu, 0 tie).
+    """
+    player_first = simulate_toss(rng, player, n)
+    p_score = np.zeros(n, dtype=np.int64)
+    c_score = np.zeros(n, dtype=np.int64)
+    balls = np.zeros(n, dtype=np.int64)
+
+    for first, bat1, bowl1, s1, s2 in ((True, player, cpu, p_score, c_score),
+                                       (False, cpu, player, c_score, p_score)):
+        idx = np.flatnonzero(player_first == first)
+        if not idx.size:
+            continue
+        first_sc, b1 = simulate_innings(rng, bat1, bowl1, idx.size, max_balls=max_balls)
+        chase_sc, b2 = simulate_innings(rng, bowl1, bat1, idx.size, target=first_sc,
+                                        max_balls=max_balls)
+        s1[idx] = first_sc
+        s2[idx] = chase_sc
+        balls[idx] = b1 + b2
+
+    winner = np.sign(p_score - c_score)
+    return {"player_score": p_score, "cpu_score": c_score,
+            "player_first": player_first, "balls": balls, "winner": winner}
+
+
+def simulate_series(rng, player, cpu, n, max_balls=MAX_BALLS):
+    """
+    Play n best-of-three series.  Returns (series_winner, matches_played)
+    where series_winner is 1 player, -1 cpu, 0 tied overall.
+    """
+    w = np.stack([simulate_matches(rng, player, cpu, n, max_balls)["winner"]
+                  for _ in range(3)])
+    p_two = (w[:2] == 1).sum(axis=0)
+    c_two = (w[:2] == -1).sum(axis=0)
+    decided = (p_two == 2) | (c_two == 2)
+    played = np.where(decided, 2, 3)
+    p_wins = p_two + np.where(decided, 0, w[2] == 1)
+    c_wins = c_two + np.where(decided, 0, w[2] == -1)
+    return np.sign(p_wins - c_wins), played
+
+# -----------------------------
+# Interactive reference (real ODDTI2 code, random human)
+# -----------------------------
+
+def interactive_reference(n, seed=0):
+    """
+    Run ODDTI2.single_match() n times with random players on both sides
+    (each with its own random.Random) and stdout discarded.  Used to check
+    the batch engine against the real interactive rules.
+    Returns (winners, player_scores, cpu_scores).
+    """
+    import ODDTI2
+    from oddti_strategy import RandomStrategy, run_matches
+
+    player = RandomStrategy(random.Random(seed))
+    cpu = RandomStrategy(random.Random(seed + 1))
+    winners, ps, cs = [], [], []
+
+    class Recorder:
+        def single_match(self, player, cpu):
+            res = ODDTI2.single_match(player, cpu)
+            winners.append({"player": 1, "cpu": -1}.get(res[0], 0))
+            ps.append(res[1])
+            cs.append(res[2])
+            return res
+
+    run_matches(Recorder(), n, player, cpu)
+    return np.array(winners), np.array(ps), np.array(cs)
+
+
+def compare_with_interactive(n_batch=200000, n_ref=5000, seed=0):
+    """Print win rates and score means from both engines side by side."""
+    rng = np.random.default_rng(seed)
+    res = simulate_matches(rng, Strategy.random(), Strategy.random(), n_batch)
+    w_ref, p_ref, c_ref = interactive_reference(n_ref, seed)
+    rows = (
+        ("player win", (res["winner"] == 1).mean(), (w_ref == 1).mean()),
+        ("cpu win", (res["winner"] == -1).mean(), (w_ref == -1).mean()),
+        ("tie", (res["winner"] == 0).mean(), (w_ref == 0).mean()),
+        ("player mean", res["player_score"].mean(), p_ref.mean()),
+        ("cpu mean", res["cpu_score"].mean(), c_ref.mean()),
+    )
+    print(f"{'':12} {'batch':>10} {'interactive':>12}")
+    for name, a, b in rows:
+        print(f"{name:12} {a:10.4f} {b:12.4f}")
+
+# -----------------------------
+# Throughput
+# -----------------------------
+
+def benchmark(n=1000000, seed=0, player=None, cpu=None):
+    """Time n batched matches and return matches/sec."""
+    rng = np.random.default_rng(seed)
+    player = player or Strategy.random()
+    cpu = cpu or Strategy.random()
+    t0 = time.perf_counter()
+    res = simulate_matches(rng, player, cpu, n)
+    dt = time.perf_counter() - t0
+    innings = 2 * n
+    print(f"{n} matches ({res['balls'].sum()} balls) in {dt:.3f}s")
+    print(f"{n / dt:,.0f} matches/sec, {innings / dt:,.0f} innings/sec")
+    return n / dt
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "compare":
+        compare_with_interactive()
+    else:
+        benchmark(int(argv[0]) if argv else 1000000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# ==========================================================
+# ⚡ ODDTI™ v2.3 — Exact innings solver
+# Score distribution and chase odds for fixed mixed strategies,
+# computed exactly instead of simulated.
+# No external libs (stdlib only; the Monte Carlo check uses NumPy).
+# ==========================================================
+#
+# An innings is a Markov chain over (runs scored, runs still needed).
+# With batter mix p and bowler mix q, one ball is
+#   OUT          with prob  sum_i p_i q_i
+#   +i runs      with prob  p_i (1 - q_i)
+# A 0-run ball leaves the state unchanged, so it is folded out by
+# conditioning on "something happens" (divide by 1 - P(+0)).  Both tables
+# below are then simple recurrences over at most 6 earlier entries:
+#   reach[s] = sum_i reach[s-i] r_i          (prob the batter ever has s)
+#   chase[n] = sum_i chase[n-i] r_i          (prob of scoring n more, n<=0 -> 1)
+# Each entry is computed once and reused by every later one (memoized DP).
+# ==========================================================
+
+import sys
+import time
+from functools import lru_cache
+
+VALID_NUMS = (0, 1, 2, 3, 4, 5, 6)
+UNIFORM = (1 / 7,) * 7
+DEFAULT_TAIL = 1e-12
+
+
+def _normalise(mix):
+    mix = tuple(float(x) for x in mix)
+    if len(mix) != len(VALID_NUMS) or min(mix) < 0 or sum(mix) <= 0:
+        raise ValueError("a mixed strategy needs 7 non-negative weights")
+    total = sum(mix)
+    return tuple(x / total for x in mix)
+
+
+class InningsTable:
+    """
+    Exact tables for one batter/bowler pairing.
+        t = solve(bat_mix, bowl_mix)
+        t.score_pmf[s]      P(first-innings score == s)
+        t.chase(n)          P(chaser scores n more before getting out)
+        t.tie(n)            P(chaser is out needing exactly 1 after needing n,
+                             i.e. the match is tied)
+    Tables stop once the remaining probability mass is below `tail` (or
+    once another score no longer changes the float sum, for a tail below
+    rounding); chase()/tie() extend them on demand for larger n.
+    """
+
+    def __init__(self, bat, bowl, tail=DEFAULT_TAIL):
+        if not 0.0 < tail < 1.0:
+            raise ValueError("tail must be between 0 and 1")
+        self.bat = _normalise(bat)
+        self.bowl = _normalise(bowl)
+        self.tail = tail
+        p, q = self.bat, self.bowl
+        out = sum(p[i] * q[i] for i in VALID_NUMS)
+        stay = p[0] * (1 - q[0])
+        if out <= 0:
+            raise ValueError("the batter can never be out with these strategies")
+        live = 1.0 - stay
+        self.p_out = out / live
+        # r[i]: prob of +i runs (i = 1..6) given the ball changes the state
+        self.r = (0.0,) + tuple(p[i] * (1 - q[i]) / live for i in VALID_NUMS[1:])
+        self.expected_balls = 1.0 / out
+
+        self.score_pmf = []
+        reach = []
+        mass = 0.0
+        s = 0
+        while mass < 1.0 - tail:
+            v = 1.0 if s == 0 else self._step(reach, s)
+            reach.append(v)
+            self.score_pmf.append(v * self.p_out)
+            if s and mass + v * self.p_out == mass:
+                break
+            mass += v * self.p_out
+            s += 1
+        self._chase = [1.0]   # index n: need n more (n = 0 -> already won)
+        self._tie = [0.0]
+
+    def _step(self, table, n, below=0.0):
+        r = self.r
+        total = 0.0
+        for i in range(1, 7):
+            k = n - i
+            total += r[i] * (table[k] if k >= 0 else below)
+        return total
+
+    def _extend(self, n):
+        chase, tie = self._chase, self._tie
+        for k in range(len(chase), n + 1):
+            chase.append(self._step(chase, k, below=1.0))
+            tie.append(self.p_out if k == 1 else self._step(tie, k))
+
+    def chase(self, need):
+        """P(the batter scores at least `need` more runs)."""
+        if need <= 0:
+            return 1.0
+        if need >= len(self._chase):
+            self._extend(need)
+        return self._chase[need]
+
+    def tie(self, need):
+        """P(the chase ends exactly one run short, a tied match)."""
+        if need <= 0:
+            return 0.0
+        if need >= len(self._tie):
+            self._extend(need)
+        return self._tie[need]
+
+    @property
+    def mean_score(self):
+        return sum(s * p for s, p in enumerate(self.score_pmf))
+
+
+@lru_cache(maxsize=256)
+def _cached(bat, bowl, tail):
+    return InningsTable(bat, bowl, tail)
+
+
+def solve(bat=UNIFORM, bowl=UNIFORM, tail=DEFAULT_TAIL):
+    """Build (or fetch from cache) the InningsTable for these strategies."""
+    return _cached(_normalise(bat), _normalise(bowl), tail)
+
+
+def match_odds(first_bat, first_bowl, second_bat, second_bowl, tail=DEFAULT_TAIL):
+    """
+    Exact (first batter wins, chaser wins, tie) probabilities.
+    first_bat/first_bowl: mixes in the first innings; second_*: the chase.
+    """
+    first = solve(first_bat, first_bowl, tail)
+    chase = solve(second_bat, second_bowl, tail)
+    won = tied = 0.0
+    for s, p in enumerate(first.score_pmf):
+        won += p * chase.chase(s + 1)
+        tied += p * chase.tie(s + 1)
+    return 1.0 - won - tied, won, tied
+
+# -----------------------------
+# Check against the Monte Carlo engine (python oddti_solver.py)
+# -----------------------------
+
+def check_against_sim(n=1000000, seed=0):
+    import numpy as np
+    import oddti_sim
+
+    bat = (1, 1, 2, 2, 3, 4, 5)
+    bowl = (3, 1, 1, 1, 1, 2, 2)
+    table = solve(bat, bowl)
+    rng = np.random.default_rng(seed)
+    batter = oddti_sim.Strategy.mixed(bat=bat)
+    bowler = oddti_sim.Strategy.mixed(bowl=bowl, bat=bowl)
+    scores, _ = oddti_sim.simulate_innings(rng, batter, bowler, n)
+    print(f"mean score   exact {table.mean_score:8.4f}   sim {scores.mean():8.4f}")
+    for s in (0, 5, 10, 20):
+        print(f"P(score={s:<2}) exact {table.score_pmf[s]:8.5f}   sim {(scores == s).mean():8.5f}")
+    for target in (5, 14, 30):
+        chased, _ = oddti_sim.simulate_innings(rng, batter, bowler, n,
+                                               target=np.full(n, target))
+        print(f"chase {target + 1:<3}    exact {table.chase(target + 1):8.5f}   "
+              f"sim {(chased > target).mean():8.5f}")
+
+    u = oddti_sim.Strategy.random()
+    res = oddti_sim.simulate_matches(rng, u, u, n)
+    first_won = np.where(res["player_first"], res["winner"] == 1, res["winner"] == -1)
+    exact = match_odds(UNIFORM, UNIFORM, UNIFORM, UNIFORM)
+    print("random v random (first wins, chaser wins, tie)")
+    print(f"  exact {exact[0]:.4f} {exact[1]:.4f} {exact[2]:.4f}")
+    print(f"  sim   {first_won.mean():.4f} {(res['winner'] != 0).mean() - first_won.mean():.4f} "
+          f"{(res['winner'] == 0).mean():.4f}")
+
+
+def time_queries(queries=1000000):
+    table = solve()
+    t0 = time.perf_counter()
+    build = solve((1, 2, 3, 4, 5, 6, 7), UNIFORM, 1e-13)
+    built = time.perf_counter() - t0
+    chase = table.chase
+    t0 = time.perf_counter()
+    for k in range(queries):
+        chase(k & 63)
+    dt = time.perf_counter() - t0
+    print(f"table build {built * 1e3:.2f} ms ({len(build.score_pmf)} scores), "
+          f"query {dt / queries * 1e6:.3f} us")
+
+
+if __name__ == "__main__":
+    check_against_sim(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
+    time_queries()
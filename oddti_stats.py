@@ -0,0 +1,399 @@
+# ==========================================================
+# ⚡ ODDTI™ v2.3 — Career stats and leaderboard
+# Running per-player (or per-strategy) aggregates kept in flat arrays,
+# one column per stat, updated in O(1) per match, with sorted indexes
+# for top-N queries.
+# No external libs (stdlib only, PC only).
+# ==========================================================
+#
+#   board = Leaderboard.load()               # oddti_stats.bin, empty if missing
+#   board.add_match("ganesh", "cpu", 34, 21, a_first=True, a_balls=9, b_balls=7)
+#   board.top("win_rate", 10)                # [(name, value), ...]
+#   board.career("ganesh")                   # dict of stats
+#   board.save()
+# Results can also be fed as events (the same kinds oddti_events writes):
+#   feed = MatchFeed(board, player="ganesh", cpu="cpu")
+#   feed.emit("ball", ...); feed.emit("match_end", player=34, cpu=21, ...)
+#   ingest(board, "oddti_events.jsonl")      # replay saved logs once
+#
+#   python oddti_stats.py [matches]          bulk load + query timings
+#   python oddti_stats.py show [file]        print the leaderboard
+# ==========================================================
+
+import os
+import random
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left, insort
+
+DEFAULT_PATH = "oddti_stats.bin"
+BANDS = (10, 20, 30, 50)            # chase bands: need 1-10, 11-20, 21-30, 31-50, 51+
+N_BANDS = len(BANDS) + 1
+SCORE_CAP = 127                     # scores above this share the last histogram bucket
+HIST = SCORE_CAP + 2
+MIN_MATCHES = 10                    # for the win-rate and average leaderboards
+COUNTERS = ("matches", "wins", "losses", "ties", "innings", "runs", "balls", "high")
+METRICS = ("win_rate", "wins", "avg_score", "high")
+
+HEADER = struct.Struct("<8sHIII")
+MAGIC = b"ODDTISTA"
+VERSION = 1
+
+
+def band(need):
+    return bisect_left(BANDS, need)
+
+
+def band_label(k):
+    lo = 1 if k == 0 else BANDS[k - 1] + 1
+    return f"{lo}+" if k == len(BANDS) else f"{lo}-{BANDS[k]}"
+
+
+class SortedIndex:
+    """
+    Sorted list split into chunks of about `load` items, so an insert or
+    delete moves one short chunk instead of the whole list.
+    """
+
+    def __init__(self, items=(), load=256):
+        self.load = load
+        items = sorted(items)
+        self.chunks = [items[k:k + load] for k in range(0, len(items), load)]
+        self.maxes = [c[-1] for c in self.chunks]
+
+    def __len__(self):
+        return sum(len(c) for c in self.chunks)
+
+    def add(self, x):
+        if not self.chunks:
+            self.chunks.append([x])
+            self.maxes.append(x)
+            return
+        i = bisect_left(self.maxes, x)
+        if i == len(self.maxes):
+            i -= 1
+        chunk = self.chunks[i]
+        insort(chunk, x)
+        self.maxes[i] = chunk[-1]
+        if len(chunk) > 2 * self.load:
+            tail = chunk[self.load:]
+            del chunk[self.load:]
+            self.maxes[i] = chunk[-1]
+            self.chunks.insert(i + 1, tail)
+            self.maxes.insert(i + 1, tail[-1])
+
+    def remove(self, x):
+        i = bisect_left(self.maxes, x)
+        chunk = self.chunks[i]
+        del chunk[bisect_left(chunk, x)]
+        if chunk:
+            self.maxes[i] = chunk[-1]
+        else:
+            del self.chunks[i]
+            del self.maxes[i]
+
+    def head(self, n):
+        out = []
+        for chunk in self.chunks:
+            out.extend(chunk[:n - len(out)])
+            if len(out) >= n:
+                break
+        return out
+
+    def position(self, x):
+        """Number of items smaller than x."""
+        i = bisect_left(self.maxes, x)
+        before = sum(len(c) for c in self.chunks[:i])
+        return before + (bisect_left(self.chunks[i], x) if i < len(self.chunks) else 0)
+
+
+class Leaderboard:
+    """
+    Columnar career stats.  Row r of every column belongs to names[r].
+    Per-row blocks: chase attempts/wins by band (N_BANDS cells each) and
+    an innings-score histogram (HIST cells) used as an exact quantile sketch.
+    """
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self.names = []
+        self.rows = {}
+        self.cols = {c: array("q") for c in COUNTERS}
+        self.chase_tried = array("q")
+        self.chase_won = array("q")
+        self.hist = array("q")
+        self.total_matches = 0
+        # sorted (-value, name) lists, one per leaderboard metric
+        self.index = {m: SortedIndex() for m in METRICS}
+
+    def __len__(self):
+        return len(self.names)
+
+    def _row(self, name):
+        r = self.rows.get(name)
+        if r is None:
+            r = self.rows[name] = len(self.names)
+            self.names.append(name)
+            for col in self.cols.values():
+                col.append(0)
+            self.chase_tried.extend(array("q", [0]) * N_BANDS)
+            self.chase_won.extend(array("q", [0]) * N_BANDS)
+            self.hist.extend(array("q", [0]) * HIST)
+        return r
+
+    # ---- metric values + index upkeep ----
+    def _metric(self, r, metric):
+        c = self.cols
+        played = c["matches"][r]
+        if not played:
+            return None         # not on any leaderboard yet
+        if metric == "win_rate":
+            if played < MIN_MATCHES:
+                return None
+            return (c["wins"][r] + 0.5 * c["ties"][r]) / played
+        if metric == "avg_score":
+            if played < MIN_MATCHES or not c["innings"][r]:
+                return None
+            return c["runs"][r] / c["innings"][r]
+        return c[metric][r]
+
+    def _reindex(self, r, old):
+        name = self.names[r]
+        for metric, idx in self.index.items():
+            before, after = old[metric], self._metric(r, metric)
+            if before == after:
+                continue
+            if before is not None:
+                idx.remove((-before, name))
+            if after is not None:
+                idx.add((-after, name))
+
+    # ---- updates ----
+    def _innings(self, r, score, balls):
+        c = self.cols
+        c["innings"][r] += 1
+        c["runs"][r] += score
+        c["balls"][r] += balls
+        if score > c["high"][r]:
+            c["high"][r] = score
+        self.hist[r * HIST + min(score, SCORE_CAP + 1)] += 1
+
+    def add_match(self, a, b, a_score, b_score, a_first, a_balls=0, b_balls=0):
+        """Record one completed match between a and b (names)."""
+        ra, rb = self._row(a), self._row(b)
+        old_a = {m: self._metric(ra, m) for m in METRICS}
+        old_b = {m: self._metric(rb, m) for m in METRICS}
+        c = self.cols
+        for r, own, other in ((ra, a_score, b_score), (rb, b_score, a_score)):
+            c["matches"][r] += 1
+            if own > other:
+                c["wins"][r] += 1
+            elif own < other:
+                c["losses"][r] += 1
+            else:
+                c["ties"][r] += 1
+        self._innings(ra, a_score, a_balls)
+        self._innings(rb, b_score, b_balls)
+        chaser, need, won = (rb, a_score + 1, b_score > a_score) if a_first else \
+                            (ra, b_score + 1, a_score > b_score)
+        k = chaser * N_BANDS + band(need)
+        self.chase_tried[k] += 1
+        self.chase_won[k] += won
+        self.total_matches += 1
+        self._reindex(ra, old_a)
+        if rb != ra:
+            self._reindex(rb, old_b)
+
+    # ---- queries ----
+    def top(self, metric="win_rate", n=10):
+        """Best n (name, value) for a metric, straight from its index."""
+        return [(name, -v) for v, name in self.index[metric].head(n)]
+
+    def rank(self, name, metric="win_rate"):
+        """1-based position of name on a leaderboard, or None if not on it."""
+        r = self.rows.get(name)
+        v = None if r is None else self._metric(r, metric)
+        if v is None:
+            return None
+        return self.index[metric].position((-v, name)) + 1
+
+    def quantile(self, name, q):
+        """q-th quantile (0-1) of name's innings scores."""
+        r = self.rows[name]
+        base = r * HIST
+        total = self.cols["innings"][r]
+        if not total:
+            return None
+        want = q * total
+        seen = 0
+        for s in range(HIST):
+            seen += self.hist[base + s]
+            if seen >= want and seen:
+                return s
+        return SCORE_CAP + 1
+
+    def career(self, name):
+        r = self.rows[name]
+        c = {k: col[r] for k, col in self.cols.items()}
+        innings = c["innings"] or 1
+        c["win_rate"] = (c["wins"] + 0.5 * c["ties"]) / (c["matches"] or 1)
+        c["avg_score"] = c["runs"] / innings
+        c["avg_balls"] = c["balls"] / innings
+        c["median_score"] = self.quantile(name, 0.5)
+        c["p90_score"] = self.quantile(name, 0.9)
+        base = r * N_BANDS
+        c["chase"] = {band_label(k): (self.chase_won[base + k], self.chase_tried[base + k])
+                      for k in range(N_BANDS) if self.chase_tried[base + k]}
+        return c
+
+    # ---- persistence ----
+    def save(self, path=None):
+        path = path or self.path
+        names = "\n".join(self.names).encode()
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(self.names), len(names),
+                                self.total_matches))
+            f.write(names)
+            for col in (*self.cols.values(), self.chase_tried, self.chase_won, self.hist):
+                col.tofile(f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path=DEFAULT_PATH):
+        board = cls(path)
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            return board
+        with f:
+            try:
+                magic, version, count, name_bytes, total = HEADER.unpack(f.read(HEADER.size))
+            except struct.error:
+                raise ValueError(f"{path} is not an ODDTI stats file") from None
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not an ODDTI stats file")
+            board.names = f.read(name_bytes).decode().split("\n") if count else []
+            board.rows = {n: r for r, n in enumerate(board.names)}
+            try:
+                for col in board.cols.values():
+                    col.fromfile(f, count)
+                board.chase_tried.fromfile(f, count * N_BANDS)
+                board.chase_won.fromfile(f, count * N_BANDS)
+                board.hist.fromfile(f, count * HIST)
+            except EOFError:
+                raise ValueError(f"{path} is truncated") from None
+        board.total_matches = total
+        for metric in METRICS:
+            board.index[metric] = SortedIndex(
+                (-v, board.names[r]) for r in range(count)
+                for v in (board._metric(r, metric),) if v is not None)
+        return board
+
+# -----------------------------
+# Event-fed aggregation
+# -----------------------------
+
+class MatchFeed:
+    """
+    Event sink (emit(kind, **fields), like EventLog) that counts balls per
+    innings and hands each completed match to the leaderboard.
+    """
+
+    def __init__(self, board, player="player", cpu="cpu"):
+        self.board = board
+        self.player = player
+        self.cpu = cpu
+        self.balls = {"player": 0, "computer": 0}
+
+    def emit(self, kind, **fields):
+        if kind == "ball":
+            side = "player" if fields["batting"] == "player" else "computer"
+            self.balls[side] += 1
+        elif kind == "match_end":
+            self.board.add_match(self.player, self.cpu, fields["player"], fields["cpu"],
+                                 fields["player_batted_first"],
+                                 self.balls["player"], self.balls["computer"])
+            self.balls = {"player": 0, "computer": 0}
+
+
+def ingest(board, path, player="player", cpu="cpu"):
+    """Add every match in an oddti_events log (and its rotations) to board."""
+    from oddti_events import read_events
+    feed = MatchFeed(board, player, cpu)
+    for ev in read_events(path, kinds={"ball", "match_end"}):
+        feed.emit(ev.pop("kind"), **ev)
+    return board
+
+# -----------------------------
+# Output + timings
+# -----------------------------
+
+def print_board(board, n=10):
+    print(f"{board.total_matches:,} matches, {len(board):,} players")
+    print(f"{'#':>3} {'name':24} {'P':>7} {'W':>7} {'Win%':>6} {'Avg':>6} {'High':>5} "
+          f"{'Balls':>6} {'Med':>4}")
+    names = [name for name, _ in board.top("win_rate", n)]
+    if len(names) < n:
+        # players under MIN_MATCHES are not ranked by win rate yet
+        names += [name for name, _ in board.top("high", len(board))
+                  if name not in names][:n - len(names)]
+    for k, name in enumerate(names, start=1):
+        c = board.career(name)
+        print(f"{k:>3} {name:24} {c['matches']:>7} {c['wins']:>7} {100 * c['win_rate']:>6.1f} "
+              f"{c['avg_score']:>6.1f} {c['high']:>5} {c['avg_balls']:>6.1f} "
+              f"{c['median_score']:>4}")
+
+
+def benchmark(matches=1000000, players=20000, seed=4):
+    rng = random.Random(seed)
+    skill = [rng.random() for _ in range(players)]
+    names = [f"p{k:05d}" for k in range(players)]
+    # pre-draw the matches so only add_match is timed
+    games = []
+    for _ in range(matches):
+        a, b = rng.randrange(players), rng.randrange(players)
+        sa = int(rng.expovariate(1 / (8 + 20 * skill[a])))
+        sb = int(rng.expovariate(1 / (8 + 20 * skill[b])))
+        games.append((names[a], names[b], sa, sb, rng.random() < 0.5,
+                      1 + sa // 4, 1 + sb // 4))
+    board = Leaderboard()
+    t0 = time.perf_counter()
+    add = board.add_match
+    for g in games:
+        add(*g)
+    dt = time.perf_counter() - t0
+    print(f"{matches:,} matches in {dt:.2f}s = {matches / dt:,.0f} matches/sec "
+          f"({dt / matches * 1e6:.2f} us each)")
+    t0 = time.perf_counter()
+    for _ in range(1000):
+        board.top("win_rate", 10)
+    q = (time.perf_counter() - t0) / 1000
+    played = list(board.rows)[:1000]
+    t0 = time.perf_counter()
+    for name in played:
+        board.career(name)
+    c = (time.perf_counter() - t0) / len(played)
+    path = "oddti_stats_bench.bin"
+    t0 = time.perf_counter()
+    board.save(path)
+    saved = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    again = Leaderboard.load(path)
+    loaded = time.perf_counter() - t0
+    size = os.path.getsize(path)
+    os.remove(path)
+    if again.top("win_rate", 50) != board.top("win_rate", 50):
+        raise AssertionError("leaderboard changed across save/load")
+    print(f"top-10 {q * 1e6:.1f} us, career {c * 1e6:.1f} us, "
+          f"save {saved * 1e3:.0f} ms, load {loaded * 1e3:.0f} ms ({size / 1e6:.1f} MB)")
+    print_board(board, 5)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "show":
+        print_board(Leaderboard.load(sys.argv[2] if len(sys.argv) > 2 else DEFAULT_PATH))
+    else:
+        benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,237 @@
+# ==========================================================
+# ⚡ ODDTI™ v2.3 — Player model store
+# Keeps one predictor model per player in a single binary file.
+# The file is memory-mapped: opening it reads only the header and
+# loading a player is a hash lookup plus one fixed-size record.
+# No external libs (stdlib only, PC only).
+# ==========================================================
+#
+# File layout (little endian):
+#   header  64 bytes : magic, version, record size, capacity, count
+#   slots   capacity x 260 bytes, open addressing with linear probing
+#           name     32 bytes utf-8, NUL padded (empty slot = all zero);
+#                    longer names are rejected, not truncated
+#           last     int8, -1 when the player has no last move
+#           (pad)    3 bytes
+#           counts   56 x uint32: Markov rows 0-6, then overall freq
+# ==========================================================
+
+import mmap
+import os
+import struct
+import sys
+import time
+import zlib
+
+VALID_NUMS = (0, 1, 2, 3, 4, 5, 6)
+N = len(VALID_NUMS)
+
+MAGIC = b"ODDTIPM1"
+VERSION = 1
+HEADER = struct.Struct("<8sHHII")
+HEADER_SIZE = 64
+RECORD = struct.Struct("<32sb3x56I")
+NAME_SIZE = 32
+MAX_LOAD = 0.7
+DEFAULT_CAPACITY = 1024
+DEFAULT_PATH = "oddti_players.bin"
+INT_TYPECODES = "bBhHiIlLqQ"
+
+
+def _key(name):
+    raw = name.strip().lower().encode("utf-8")
+    if not raw:
+        raise ValueError("player name must not be empty")
+    if len(raw) > NAME_SIZE:
+        # truncating would let two long names share one record
+        raise ValueError(f"player name is longer than {NAME_SIZE} bytes")
+    return raw
+
+
+def _table(pred):
+    """
+    pred's 56 integer counts.  The store holds plain count tables only
+    (Predictor, ArrayPredictor); models whose table means something else
+    (decayed float weights, n-gram contexts, ensembles) are a TypeError.
+    """
+    counts = getattr(pred, "counts", None)
+    if counts is not None:
+        if getattr(counts, "typecode", None) in INT_TYPECODES and len(counts) == (N + 1) * N:
+            return counts
+    elif isinstance(getattr(pred, "__dict__", {}).get("markov"), dict):
+        markov, freq = pred.markov, pred.freq
+        counts = [markov[p][n] for p in VALID_NUMS for n in VALID_NUMS]
+        counts += [freq[n] for n in VALID_NUMS]
+        if all(isinstance(c, int) for c in counts):
+            return counts
+    raise TypeError(f"the player store holds integer count tables (Predictor, "
+                    f"ArrayPredictor), not {type(pred).__name__}")
+
+
+class ModelStore:
+    """
+    Fixed-record, memory-mapped store of per-player predictor models.
+        store = ModelStore("oddti_players.bin")
+        store.load_into("ganesh", predictor)   # True if the player was known
+        store.save_from("ganesh", predictor)   # write back in place
+        store.close()
+    """
+
+    def __init__(self, path=DEFAULT_PATH, capacity=DEFAULT_CAPACITY):
+        self.path = path
+        self._mm = None
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            _create(path, capacity)
+        self._open()
+
+    def _open(self):
+        self._file = open(self.path, "r+b")
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        magic, version, rec_size, capacity, count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION or rec_size != RECORD.size:
+            self.close()
+            raise ValueError(f"{self.path} is not an ODDTI player store")
+        self.capacity = capacity
+        self.count = count
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._file.close()
+            self._mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, name):
+        return self._find(_key(name))[1]
+
+    # ---- slot lookup ----
+    def _find(self, key):
+        """Return (offset, found) for key: its slot, or the empty slot to use."""
+        mm = self._mm
+        cap = self.capacity
+        i = zlib.crc32(key) % cap
+        while True:
+            off = HEADER_SIZE + i * RECORD.size
+            stored = mm[off:off + NAME_SIZE]
+            if stored[0] == 0:
+                return off, False
+            if stored.rstrip(b"\0") == key:
+                return off, True
+            i = (i + 1) % cap
+
+    # ---- raw records ----
+    def read(self, name):
+        """Return (counts, last_move) for name, or None if unknown."""
+        off, found = self._find(_key(name))
+        if not found:
+            return None
+        _, last, *counts = RECORD.unpack_from(self._mm, off)
+        return counts, (None if last < 0 else last)
+
+    def write(self, name, counts, last_move):
+        """Write 56 counts and the last move for name, in place."""
+        key = _key(name)
+        off, found = self._find(key)
+        if not found:
+            if self.count + 1 > self.capacity * MAX_LOAD:
+                self._grow()
+                off, found = self._find(key)
+            self.count += 1
+            HEADER.pack_into(self._mm, 0, MAGIC, VERSION, RECORD.size,
+                             self.capacity, self.count)
+        RECORD.pack_into(self._mm, off, key, -1 if last_move is None else last_move,
+                         *counts)
+
+    def flush(self):
+        self._mm.flush()
+
+    def _grow(self):
+        """Rehash into a file with twice the slots (rare; amortised O(1))."""
+        tmp = self.path + ".tmp"
+        _create(tmp, self.capacity * 2)
+        with ModelStore(tmp) as bigger:
+            mm = self._mm
+            for i in range(self.capacity):
+                off = HEADER_SIZE + i * RECORD.size
+                if mm[off] == 0:
+                    continue
+                key = mm[off:off + NAME_SIZE].rstrip(b"\0")
+                dst, _ = bigger._find(key)
+                bigger._mm[dst:dst + RECORD.size] = mm[off:off + RECORD.size]
+            bigger.count = self.count
+            HEADER.pack_into(bigger._mm, 0, MAGIC, VERSION, RECORD.size,
+                             bigger.capacity, bigger.count)
+            bigger.flush()
+        self.close()
+        os.replace(tmp, self.path)
+        self._open()
+
+    # ---- predictor helpers ----
+    def load_into(self, name, pred):
+        """Load name's model into pred. Returns False (pred untouched) if unknown."""
+        _table(pred)
+        rec = self.read(name)
+        if rec is None:
+            return False
+        counts, last = rec
+        if hasattr(pred, "load_counts"):
+            pred.load_counts(counts, last)
+        else:
+            for p in VALID_NUMS:
+                pred.markov[p] = {n: counts[p * N + n] for n in VALID_NUMS}
+            pred.freq = {n: counts[N * N + n] for n in VALID_NUMS}
+            pred.last_player_move = last
+        return True
+
+    def save_from(self, name, pred):
+        """Write pred's Markov and freq tables back to name's record."""
+        self.write(name, _table(pred), pred.last_player_move)
+
+
+def _create(path, capacity):
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, capacity, 0).ljust(HEADER_SIZE, b"\0"))
+        f.truncate(HEADER_SIZE + capacity * RECORD.size)
+
+# -----------------------------
+# Benchmark (python oddti_store.py [players])
+# -----------------------------
+
+def benchmark(players=50000, path="oddti_store_bench.bin"):
+    from oddti_predictors import ArrayPredictor
+    if os.path.exists(path):
+        os.remove(path)
+    pred = ArrayPredictor()
+    for m in (1, 2, 3, 1, 2, 3):
+        pred.update(pred.last_player_move, m)
+    t0 = time.perf_counter()
+    with ModelStore(path) as store:
+        for i in range(players):
+            store.save_from(f"player{i}", pred)
+    build = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    store = ModelStore(path)
+    opened = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for i in range(0, players, 7):
+        store.load_into(f"player{i}", pred)
+    lookups = len(range(0, players, 7))
+    load = (time.perf_counter() - t0) / lookups
+    store.close()
+    size = os.path.getsize(path)
+    os.remove(path)
+    print(f"{players} players, {size / 1e6:.1f} MB, built in {build:.2f}s")
+    print(f"open: {opened * 1e3:.3f} ms, load one player: {load * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,243 @@
+# ==========================================================
+# ⚡ ODDTI™ v2.3 — Player strategies
+# Ready-made players for either side of a match in both editions
+# (ODDTI2.single_match / best_of_three and the predictor edition's
+# single_match / best_of_three accept player= and cpu=).
+# No external libs (stdlib only, PC only).
+# ==========================================================
+#
+# Protocol (duck typed, same in ODDTI2.py and the predictor edition):
+#   call_toss() -> "odd"/"even"        toss_number() -> 0-6
+#   elect() -> "bat"/"bowl"            play(role, runs_left) -> 0-6
+#   observe(role, own, other)          told both numbers after each ball
+# role is "bat" or "bowl"; runs_left is None outside a chase.
+#
+#   python oddti_strategy.py [matches]     bot v bot through both editions
+# ==========================================================
+
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+
+VALID_NUMS = (0, 1, 2, 3, 4, 5, 6)
+
+
+class ConsoleStrategy:
+    """A human at the keyboard (generic prompts)."""
+
+    def _ask(self, prompt, options):
+        while True:
+            resp = input(prompt).strip().lower()
+            if resp in options:
+                return resp
+            print("Options:", "/".join(options))
+
+    def call_toss(self):
+        return self._ask("Toss call (odd/even): ", ("odd", "even"))
+
+    def toss_number(self):
+        return int(self._ask("Toss number (0-6): ", tuple(map(str, VALID_NUMS))))
+
+    def elect(self):
+        return self._ask("Bat or bowl? (bat/bowl): ", ("bat", "bowl"))
+
+    def play(self, role, runs_left):
+        prompt = f"{role.capitalize()} number (0-6): "
+        return int(self._ask(prompt, tuple(map(str, VALID_NUMS))))
+
+    def observe(self, role, own, other):
+        pass
+
+
+class RandomStrategy:
+    """Uniform random player; all draws come from its own rng."""
+
+    def __init__(self, rng=None):
+        self.rng = rng or random.Random()
+
+    def reset(self, rng):
+        self.rng = rng
+
+    def call_toss(self):
+        return self.rng.choice(("odd", "even"))
+
+    def toss_number(self):
+        return self.rng.choice(VALID_NUMS)
+
+    def elect(self):
+        return self.rng.choice(("bat", "bowl"))
+
+    def play(self, role, runs_left):
+        return self.rng.choice(VALID_NUMS)
+
+    def observe(self, role, own, other):
+        pass
+
+
+class PredictorStrategy(RandomStrategy):
+    """
+    The predictor edition's CPU as a self-contained player: its own
+    predictor, epsilon and batting scheme instead of module globals.
+    """
+
+    def __init__(self, epsilon=0.12, scheme="value", rng=None, predictor=None):
+        from oddti_sampling import get_sampler
+        self.epsilon = epsilon
+        self.sampler = get_sampler(scheme)
+        RandomStrategy.__init__(self, rng)
+        if predictor is None:
+            self.reset(self.rng)
+        else:
+            self.predictor = predictor
+
+    def reset(self, rng):
+        from oddti_predictors import ArrayPredictor
+        self.rng = rng
+        self.predictor = ArrayPredictor(rng)
+
+    def play(self, role, runs_left):
+        rng = self.rng
+        set_role = getattr(self.predictor, "set_role", None)
+        if set_role is not None:
+            set_role("bowl" if role == "bat" else "bat")
+        if rng.random() <= self.epsilon:
+            return rng.choice(VALID_NUMS)
+        pred = self.guess()
+        if role == "bowl":
+            return pred
+        return self.sampler.pick(pred, runs_left, rng)
+
+    def guess(self):
+        """The predictor's call for the opponent's next number."""
+        return self.predictor.predict(self.predictor.last_player_move)
+
+    def observe(self, role, own, other):
+        self.predictor.update(self.predictor.last_player_move, other)
+
+
+class ReplayStrategy:
+    """
+    Replays recorded answers.  Tokens (whitespace separated) are sorted by
+    kind: odd/even for toss calls, bat/bowl for elections, 0-6 for toss
+    numbers and balls, each kind used in order.  When a kind runs out,
+    loop=True starts it again, otherwise EOFError is raised like input().
+        ReplayStrategy.from_file("moves.txt")
+        ReplayStrategy.from_events("oddti_events.jsonl")
+    """
+
+    def __init__(self, tokens, loop=False):
+        self.queues = {"call": [], "elect": [], "num": []}
+        for t in tokens:
+            t = str(t).strip().lower()
+            if t in ("odd", "even"):
+                self.queues["call"].append(t)
+            elif t in ("bat", "bowl"):
+                self.queues["elect"].append(t)
+            elif t.isdigit() and int(t) in VALID_NUMS:
+                self.queues["num"].append(int(t))
+            elif t:
+                raise ValueError(f"cannot replay token {t!r}")
+        self.pos = {k: 0 for k in self.queues}
+        self.loop = loop
+
+    @classmethod
+    def from_file(cls, path, loop=False):
+        with open(path, encoding="utf-8") as f:
+            return cls(f.read().split(), loop)
+
+    @classmethod
+    def from_events(cls, path, loop=False):
+        """The player's toss calls, toss numbers, elections and balls from an event log."""
+        from oddti_events import read_events
+        tokens = []
+        for ev in read_events(path, kinds={"toss", "ball"}):
+            if ev["kind"] == "toss":
+                tokens.append(ev["call"])
+                if ev["winner"] == "player" and "elect" in ev:
+                    tokens.append(ev["elect"])
+            tokens.append(ev["player"])
+        return cls(tokens, loop)
+
+    def _next(self, kind):
+        q = self.queues[kind]
+        i = self.pos[kind]
+        if i >= len(q):
+            if not self.loop or not q:
+                raise EOFError(f"replay has no more {kind} answers")
+            i = 0
+        self.pos[kind] = i + 1
+        return q[i]
+
+    def call_toss(self):
+        return self._next("call") if self.queues["call"] or not self.loop else "odd"
+
+    def toss_number(self):
+        return self._next("num")
+
+    def elect(self):
+        return self._next("elect") if self.queues["elect"] or not self.loop else "bat"
+
+    def play(self, role, runs_left):
+        return self._next("num")
+
+    def observe(self, role, own, other):
+        pass
+
+# -----------------------------
+# Bot v bot through the real editions
+# -----------------------------
+
+class Discard:
+    """A stdout that throws everything away (headless matches)."""
+
+    def write(self, s):
+        return len(s)
+
+    def flush(self):
+        pass
+
+
+def run_matches(engine, matches, player, cpu=None, quiet=True):
+    """
+    Play `matches` single matches with engine.single_match(player, cpu)
+    (engine = the ODDTI2 module or the loaded predictor edition).
+    Returns (player wins, cpu wins, ties, seconds).
+    """
+    wins = losses = ties = 0
+    t0 = time.perf_counter()
+    with redirect_stdout(Discard() if quiet else sys.stdout):
+        for _ in range(matches):
+            res = engine.single_match(player, cpu)
+            p, c = (res[1], res[2]) if isinstance(res[0], str) else (res[0], res[1])
+            if p > c:
+                wins += 1
+            elif c > p:
+                losses += 1
+            else:
+                ties += 1
+    return wins, losses, ties, time.perf_counter() - t0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    matches = int(argv[0]) if argv else 2000
+    import ODDTI2
+    from oddti_edition import load_edition
+    edition = load_edition()
+    edition.LOG_EVENTS = False
+    edition.TRACK_STATS = False
+    rng = random.Random(2025)
+    for label, engine, cpu in (("ODDTI2 (random CPU)", ODDTI2, None),
+                               ("predictor edition", edition, None)):
+        w, l, t, dt = run_matches(engine, matches, RandomStrategy(rng), cpu)
+        print(f"{label:22} random player {w}-{l}-{t} (W-L-T), "
+              f"{matches / dt:,.0f} matches/sec")
+    w, l, t, dt = run_matches(edition, matches, PredictorStrategy(rng=rng),
+                              RandomStrategy(rng))
+    print(f"{'predictor edition':22} predictor bot v random CPU {w}-{l}-{t}, "
+          f"{matches / dt:,.0f} matches/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+# ==========================================================
+# ⚡ ODDTI™ v2.3 — Predictor settings sweep
+# Measures the predictor CPU's win rate and hit rate over a grid of
+# PREDICTOR_EPSILON values and predictor models, against a panel of
+# simulated players, and ranks the settings by confidence interval.
+# No external libs (stdlib only, PC only).
+# ==========================================================
+#
+# Work is done in rounds.  Each round plays one block of matches per
+# (setting, panel player) on a process pool.  Block b against panel
+# player k uses the same seeds for every setting (common random
+# numbers): the player, the CPU's toss answers and the CPU's play each
+# get their own stream, so settings are compared on the same player
+# moves and tosses.  Matches are played by oddti_tournament.play_match
+# (ODDTI2's single_match), the panel player on the player's side.  After
+# `min_rounds`, a setting whose paired difference to the current leader
+# is clearly negative (upper 95% bound < 0) stops getting blocks.
+#
+#   python oddti_sweep.py [--rounds R] [--block G] [--workers N]
+#                         [--eps 0,0.05,0.1] [--models markov,ngram2,decay40,ensemble]
+#                         [--schemes value,target] [--out oddti_sweep.csv]
+# ==========================================================
+
+import csv
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from oddti_strategy import PredictorStrategy
+from oddti_tournament import make_bot, play_match
+
+Z = 1.96
+DEFAULT_EPS = (0.0, 0.05, 0.1, 0.12, 0.15, 0.2, 0.3, 0.45, 0.6, 0.9)
+DEFAULT_MODELS = ("markov", "ngram2", "decay40")
+DEFAULT_SCHEMES = ("value",)
+PANEL = (
+    ("random",),
+    ("repeater", 6),
+    ("repeater", 2, 0.4),
+    ("cycler", (4, 6, 5)),
+    ("cycler", (1, 2, 3, 4), 0.3),
+    ("greedy",),
+    ("predictor", 0.12),
+)
+
+
+def make_predictor(model, rng):
+    """markov, ngramK (K = 1-6), decayH (half-life H balls) or ensemble."""
+    import oddti_predictors
+    if model == "markov":
+        return oddti_predictors.ArrayPredictor(rng)
+    if model.startswith("ngram"):
+        return oddti_predictors.NGramPredictor(order=int(model[5:]), rng=rng)
+    if model.startswith("decay"):
+        return oddti_predictors.DecayingPredictor(half_life=float(model[5:]), rng=rng)
+    if model == "ensemble":
+        return oddti_predictors.EnsemblePredictor(rng=rng)
+    raise ValueError(f"unknown predictor model {model!r}")
+
+
+class SweepCPU(PredictorStrategy):
+    """Predictor CPU that also counts how often its prediction was right."""
+
+    def __init__(self, epsilon, model, scheme):
+        self.model = model
+        self.predictions = self.hits = 0
+        self.pending = None
+        self.toss = random.Random()     # toss answers, apart from play
+        super().__init__(epsilon=epsilon, scheme=scheme)
+
+    def reset(self, rng):
+        self.rng = rng
+        self.predictor = make_predictor(self.model, rng)
+
+    def toss_number(self):
+        return self.toss.choice((0, 1, 2, 3, 4, 5, 6))
+
+    def elect(self):
+        return self.toss.choice(("bat", "bowl"))
+
+    def guess(self):
+        self.pending = super().guess()
+        return self.pending
+
+    def observe(self, role, own, other):
+        if self.pending is not None:
+            self.predictions += 1
+            self.hits += self.pending == other
+            self.pending = None
+        super().observe(role, own, other)
+
+
+def setting_name(setting):
+    eps, model, scheme = setting
+    name = f"eps={eps:.2f} {model}"
+    return name if scheme == "value" else f"{name} {scheme}"
+
+# -----------------------------
+# One block: `games` matches, CPU memory carried over like a session
+# -----------------------------
+
+def run_block(task):
+    seed, setting, k, spec, block, games = task
+    cpu = SweepCPU(*setting)
+    player = make_bot(spec)
+    cpu.reset(random.Random(f"{seed}:cpu:{k}:{block}"))
+    player.reset(random.Random(f"{seed}:player:{k}:{block}"))
+    cpu.toss = random.Random(f"{seed}:toss:{k}:{block}")
+    points = 0.0
+    for _ in range(games):
+        p, c = play_match(player, cpu)
+        points += 1.0 if c > p else 0.5 if c == p else 0.0
+    return setting, k, block, points / games, cpu.predictions, cpu.hits
+
+# -----------------------------
+# Sweep with early stopping
+# -----------------------------
+
+class Result:
+    def __init__(self, setting):
+        self.setting = setting
+        self.scores = {}        # (panel index, block) -> CPU points per match
+        self.predictions = 0
+        self.hits = 0
+        self.stopped = None     # round it was dropped in
+
+    def mean(self):
+        return sum(self.scores.values()) / len(self.scores)
+
+    def interval(self):
+        xs = list(self.scores.values())
+        m = sum(xs) / len(xs)
+        if len(xs) < 2:
+            return m, 0.0, 1.0
+        var = sum((x - m) ** 2 for x in xs) / (len(xs) - 1)
+        half = Z * (var / len(xs)) ** 0.5
+        return m, m - half, m + half
+
+    def paired_upper(self, other):
+        """Upper 95% bound of (self - other) over the blocks both played."""
+        keys = [key for key in self.scores if key in other.scores]
+        if len(keys) < 2:
+            return float("inf")
+        d = [self.scores[key] - other.scores[key] for key in keys]
+        m = sum(d) / len(d)
+        var = sum((x - m) ** 2 for x in d) / (len(d) - 1)
+        return m + Z * (var / len(d)) ** 0.5
+
+
+def sweep(grid, panel=PANEL, rounds=8, block=100, min_rounds=3, workers=None,
+          seed=2025, log=print):
+    """Run the sweep; returns Results sorted best first."""
+    results = {s: Result(s) for s in grid}
+    live = list(grid)
+    pool = ProcessPoolExecutor(max_workers=workers) if workers != 1 else None
+    try:
+        for r in range(rounds):
+            tasks = [(seed, s, k, spec, r, block)
+                     for s in live for k, spec in enumerate(panel)]
+            done = pool.map(run_block, tasks, chunksize=4) if pool else map(run_block, tasks)
+            for setting, k, b, score, preds, hits in done:
+                res = results[setting]
+                res.scores[(k, b)] = score
+                res.predictions += preds
+                res.hits += hits
+            leader = max((results[s] for s in live), key=Result.mean)
+            if r + 1 >= min_rounds:
+                for s in list(live):
+                    if results[s] is not leader and results[s].paired_upper(leader) < 0:
+                        results[s].stopped = r + 1
+                        live.remove(s)
+            log(f"round {r + 1}/{rounds}: {len(tasks)} blocks, {len(live)} settings left, "
+                f"leader {setting_name(leader.setting)} {leader.mean():.3f}")
+    finally:
+        if pool:
+            pool.shutdown()
+    # rank by the lower end of the interval: a setting has to be both good
+    # and well measured to come first
+    return sorted(results.values(), key=lambda res: (-res.interval()[1], -res.mean()))
+
+
+def write_table(ranked, path):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["rank", "epsilon", "model", "scheme", "cpu_win_rate", "ci_low",
+                    "ci_high", "hit_rate", "blocks", "stopped_round"])
+        for k, res in enumerate(ranked, start=1):
+            m, lo, hi = res.interval()
+            w.writerow([k, *res.setting, f"{m:.4f}", f"{lo:.4f}", f"{hi:.4f}",
+                        f"{res.hits / max(res.predictions, 1):.4f}", len(res.scores),
+                        res.stopped or ""])
+
+
+def print_table(ranked):
+    print(f"{'#':>3} {'setting':28} {'win':>6} {'95% CI':>15} {'hit':>6} {'blocks':>6} stop")
+    for k, res in enumerate(ranked, start=1):
+        m, lo, hi = res.interval()
+        print(f"{k:>3} {setting_name(res.setting):28} {m:6.3f} [{lo:6.3f},{hi:6.3f}] "
+              f"{res.hits / max(res.predictions, 1):6.3f} {len(res.scores):>6} "
+              f"{res.stopped or '':>4}")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    opts = {"--rounds": "8", "--block": "100", "--workers": "", "--out": "oddti_sweep.csv",
+            "--eps": ",".join(map(str, DEFAULT_EPS)), "--models": ",".join(DEFAULT_MODELS),
+            "--schemes": ",".join(DEFAULT_SCHEMES)}
+    while argv:
+        flag = argv.pop(0)
+        if flag not in opts or not argv:
+            print("usage: python oddti_sweep.py [--rounds R] [--block G] [--workers N] "
+                  "[--eps E,E] [--models M,M] [--schemes S,S] [--out FILE]")
+            return
+        opts[flag] = argv.pop(0)
+    grid = [(float(e), m, s) for e in opts["--eps"].split(",")
+            for m in opts["--models"].split(",") for s in opts["--schemes"].split(",")]
+    for _, m, _ in grid:
+        make_predictor(m, None)     # reject bad model names before forking
+    t0 = time.perf_counter()
+    ranked = sweep(grid, rounds=int(opts["--rounds"]), block=int(opts["--block"]),
+                   workers=int(opts["--workers"]) if opts["--workers"] else None)
+    dt = time.perf_counter() - t0
+    print_table(ranked)
+    write_table(ranked, opts["--out"])
+    print(f"{len(grid)} settings x {len(PANEL)} players in {dt:.1f}s; "
+          f"table written to {opts['--out']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+# ==========================================================
+# ⚡ ODDTI™ v2.3 — Bot tournament runner
+# Round-robin of CPU strategies across all cores.  Bots are
+# oddti_strategy players and every match is played by ODDTI2's
+# single_match, so the tournament plays exactly what the game plays.
+# Every pairing series draws from its own seeded random.Random, so
+# results are identical for any number of workers.
+# No external libs (stdlib only, PC only).
+# ==========================================================
+#
+#   python oddti_tournament.py [games_per_pairing] [workers]
+#   python oddti_tournament.py scaling [games_per_pairing]
+# ==========================================================
+
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+
+import ODDTI2
+from oddti_strategy import Discard, PredictorStrategy, RandomStrategy
+
+VALID_NUMS = (0, 1, 2, 3, 4, 5, 6)
+
+# -----------------------------
+# Bots
+# -----------------------------
+# Bots are oddti_strategy players: they answer the toss, pick a number
+# for a role ("bat"/"bowl") and are told the result of every ball.  All
+# randomness must come from the rng handed to reset() so that a series
+# replays exactly from its seed.
+# -----------------------------
+class RandomBot(RandomStrategy):
+    name = "random"
+
+
+class PredictorBot(PredictorStrategy):
+    """The predictor edition's CPU: guess the opponent's next number."""
+
+    def __init__(self, epsilon=0.12, scheme="value", rng=None):
+        super().__init__(epsilon=epsilon, scheme=scheme, rng=rng)
+        self.name = f"predictor(eps={epsilon:.2f})"
+        if scheme != "value":
+            self.name = f"predictor(eps={epsilon:.2f},{scheme})"
+
+
+class RepeaterBot(RandomBot):
+    """Human habit: keeps coming back to a favourite number."""
+
+    def __init__(self, favourite=6, stick=0.6, rng=None):
+        super().__init__(rng=rng)
+        self.favourite = favourite
+        self.stick = stick
+        self.name = f"repeater({favourite})"
+
+    def play(self, role, runs_left):
+        if self.rng.random() < self.stick:
+            return self.favourite
+        return self.rng.choice(VALID_NUMS)
+
+
+class CyclerBot(RandomBot):
+    """Human habit: runs through a short pattern, with the odd slip."""
+
+    def __init__(self, pattern=(4, 6, 5), slip=0.15, rng=None):
+        super().__init__(rng=rng)
+        self.pattern = tuple(pattern)
+        self.slip = slip
+        self.i = 0
+        self.name = "cycler(" + "".join(map(str, self.pattern)) + ")"
+
+    def reset(self, rng):
+        super().reset(rng)
+        self.i = 0
+
+    def play(self, role, runs_left):
+        move = self.pattern[self.i % len(self.pattern)]
+        self.i += 1
+        if self.rng.random() < self.slip:
+            return self.rng.choice(VALID_NUMS)
+        return move
+
+
+class GreedyBot(RandomBot):
+    """Human habit: big numbers when batting, anything when bowling."""
+
+    name = "greedy"
+
+    def play(self, role, runs_left):
+        if role == "bat":
+            return self.rng.choice((4, 5, 6, 6))
+        return self.rng.choice(VALID_NUMS)
+
+
+BOTS = {
+    "random": RandomBot,
+    "predictor": PredictorBot,
+    "repeater": RepeaterBot,
+    "cycler": CyclerBot,
+    "greedy": GreedyBot,
+}
+
+def make_bot(spec):
+    """Build a bot from a picklable spec such as ("predictor", 0.2)."""
+    return BOTS[spec[0]](*spec[1:])
+
+
+DEFAULT_FIELD = (
+    ("random",),
+    ("predictor", 0.0),
+    ("predictor", 0.12),
+    ("predictor", 0.3),
+    ("predictor", 0.6),
+    ("predictor", 0.12, "target"),
+    ("repeater", 6),
+    ("cycler", (4, 6, 5)),
+    ("greedy",),
+)
+
+# -----------------------------
+# Headless match: ODDTI2.single_match with its output thrown away
+# -----------------------------
+
+def play_match(a, b):
+    """a plays the player's side (and calls the toss), b the CPU's.
+    Returns (a_score, b_score)."""
+    verbosity = ODDTI2.VERBOSITY
+    ODDTI2.VERBOSITY = 0        # only the scorecard is rendered, then dropped
+    try:
+        with redirect_stdout(Discard()):
+            _, a_score, b_score = ODDTI2.single_match(a, b)
+    finally:
+        ODDTI2.VERBOSITY = verbosity
+    return a_score, b_score
+
+
+def run_pairing(task):
+    """
+    One pairing series: `games` matches between the same two bots, whose
+    memory carries over between matches like a human session.
+    """
+    seed, i, j, spec_a, spec_b, games = task
+    rng = random.Random(f"{seed}:{i}:{j}")
+    a, b = make_bot(spec_a), make_bot(spec_b)
+    a.reset(rng)
+    b.reset(rng)
+    results = []
+    for g in range(games):
+        # alternate who calls the toss
+        if g % 2:
+            sb, sa = play_match(b, a)
+        else:
+            sa, sb = play_match(a, b)
+        results.append((sa, sb))
+    return i, j, results
+
+# -----------------------------
+# Tournament + standings
+# -----------------------------
+
+def run_tournament(field=DEFAULT_FIELD, games=200, workers=None, seed=2025):
+    """Round robin over `field`; returns (rows, seconds). Rows are standings dicts."""
+    tasks = [(seed, i, j, field[i], field[j], games)
+             for i in range(len(field)) for j in range(i + 1, len(field))]
+    t0 = time.perf_counter()
+    if workers == 1:
+        results = list(map(run_pairing, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run_pairing, tasks, chunksize=1))
+    dt = time.perf_counter() - t0
+    return standings(field, results), dt
+
+
+def standings(field, results):
+    names = [make_bot(spec).name for spec in field]
+    rows = [{"name": n, "played": 0, "won": 0, "lost": 0, "tied": 0,
+             "runs": 0, "elo": 1500.0} for n in names]
+    # results arrive in task order, so Elo is independent of worker count
+    for i, j, games in sorted(results):
+        for sa, sb in games:
+            ra, rb = rows[i], rows[j]
+            ra["played"] += 1
+            rb["played"] += 1
+            ra["runs"] += sa
+            rb["runs"] += sb
+            if sa > sb:
+                ra["won"] += 1
+                rb["lost"] += 1
+                score = 1.0
+            elif sb > sa:
+                rb["won"] += 1
+                ra["lost"] += 1
+                score = 0.0
+            else:
+                ra["tied"] += 1
+                rb["tied"] += 1
+                score = 0.5
+            expect = 1.0 / (1.0 + 10 ** ((rb["elo"] - ra["elo"]) / 400.0))
+            ra["elo"] += 16 * (score - expect)
+            rb["elo"] -= 16 * (score - expect)
+    for r in rows:
+        r["points"] = 2 * r["won"] + r["tied"]
+        r["win_pct"] = 100.0 * r["won"] / max(r["played"], 1)
+        r["avg"] = r["runs"] / max(r["played"], 1)
+    rows.sort(key=lambda r: (-r["points"], -r["elo"], r["name"]))
+    return rows
+
+
+def print_standings(rows):
+    print(f"{'#':>2} {'bot':28} {'P':>6} {'W':>6} {'L':>6} {'T':>5} "
+          f"{'Pts':>6} {'Win%':>6} {'Avg':>6} {'Elo':>6}")
+    for k, r in enumerate(rows, start=1):
+        print(f"{k:>2} {r['name']:28} {r['played']:>6} {r['won']:>6} {r['lost']:>6} "
+              f"{r['tied']:>5} {r['points']:>6} {r['win_pct']:>6.1f} {r['avg']:>6.1f} "
+              f"{r['elo']:>6.0f}")
+
+
+def scaling(games=200):
+    """Run the same tournament on 1..cpu_count workers and print the speedup."""
+    cores = os.cpu_count() or 1
+    base_rows, base = run_tournament(games=games, workers=1)
+    print(f"workers  1: {base:.2f}s")
+    for w in range(2, cores + 1):
+        rows, dt = run_tournament(games=games, workers=w)
+        same = "same standings" if rows == base_rows else "STANDINGS DIFFER"
+        print(f"workers {w:2}: {dt:.2f}s speedup x{base / dt:.2f} ({same})")
+    if cores == 1:
+        print("only one core available; nothing to compare")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "scaling":
+        scaling(int(argv[1]) if len(argv) > 1 else 200)
+        return
+    games = int(argv[0]) if argv else 200
+    workers = int(argv[1]) if len(argv) > 1 else None
+    rows, dt = run_tournament(games=games, workers=workers)
+    print_standings(rows)
+    matches = sum(r["played"] for r in rows) // 2
+    print(f"{matches} matches in {dt:.2f}s ({matches / dt:,.0f} matches/sec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+# ==========================================================
+# ⚡ ODDTI™ v2.3 — Bulk predictor training
+# Warm-starts a Predictor from recorded player moves, counting
+# (prev, actual) pairs with NumPy bincount instead of calling
+# Predictor.update() once per move.
+# Platform: Python 3.8+ with NumPy (PC only)
+# ==========================================================
+#
+# Input files, one session per file, in play order:
+#   *.txt / anything else : one digit 0-6 per move, any separators
+#                           ("3 4 6\n6 1" or "34661"); other bytes ignored
+#   *.jsonl               : oddti_events logs, "player" of every ball event
+# Each file starts with no previous move, exactly like
+#   prev = None
+#   for m in moves: pred.update(prev, m); prev = m
+# Large text files are split into byte ranges that workers count in
+# parallel; the pair across each boundary is added when merging.
+#
+#   python oddti_train.py FILE... [--workers N]     train + report moves/sec
+#   python oddti_train.py --check                   compare with update()
+# The same comparison runs under pytest in tests/test_train.py.
+# ==========================================================
+
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+N = 7
+CHUNK_BYTES = 1 << 22          # read size per step
+SPLIT_BYTES = 1 << 25          # text files larger than this are split
+
+
+class Counts:
+    """Partial count table for a run of consecutive moves."""
+
+    def __init__(self):
+        self.freq = np.zeros(N, dtype=np.int64)
+        self.trans = np.zeros(N * N, dtype=np.int64)   # prev * 7 + actual
+        self.first = None      # first move of the run
+        self.last = None       # last move of the run
+        self.moves = 0
+
+    def add_chunk(self, moves):
+        """Count a chunk of int moves (0-6) continuing this run."""
+        if not moves.size:
+            return
+        self.freq += np.bincount(moves, minlength=N)
+        pairs = moves[:-1] * N + moves[1:]
+        self.trans += np.bincount(pairs, minlength=N * N)
+        if self.last is not None:
+            self.trans[self.last * N + moves[0]] += 1
+        if self.first is None:
+            self.first = int(moves[0])
+        self.last = int(moves[-1])
+        self.moves += moves.size
+
+    def join(self, other, continuous):
+        """Append `other`; continuous=True if it directly follows this run."""
+        self.freq += other.freq
+        self.trans += other.trans
+        if continuous and self.last is not None and other.first is not None:
+            self.trans[self.last * N + other.first] += 1
+        if self.first is None:
+            self.first = other.first
+        if other.last is not None:
+            self.last = other.last
+        self.moves += other.moves
+        return self
+
+    def apply(self, pred):
+        """
+        Add these counts to pred (Predictor or ArrayPredictor) and set its
+        last move, the same as the equivalent sequence of update() calls.
+        """
+        freq = self.freq.tolist()
+        trans = self.trans.tolist()
+        if hasattr(pred, "load_counts"):
+            counts = [c + trans[i] for i, c in enumerate(pred.counts[:N * N])]
+            counts += [c + freq[n] for n, c in enumerate(pred.counts[N * N:])]
+            pred.load_counts(counts, pred.last_player_move)
+        else:
+            for n in range(N):
+                pred.freq[n] = pred.freq.get(n, 0) + freq[n]
+                for a in range(N):
+                    row = pred.markov[n]
+                    row[a] = row.get(a, 0) + trans[n * N + a]
+        if self.last is not None:
+            pred.last_player_move = self.last
+        return pred
+
+# -----------------------------
+# Readers
+# -----------------------------
+
+def _digits(raw):
+    b = np.frombuffer(raw, dtype=np.uint8)
+    b = b[(b >= 48) & (b <= 54)]   # "0".."6"
+    return (b - 48).astype(np.intp)
+
+
+def count_text(task):
+    """Count moves in bytes [start, end) of a text file."""
+    path, start, end = task
+    counts = Counts()
+    with open(path, "rb") as f:
+        f.seek(start)
+        left = end - start
+        while left > 0:
+            raw = f.read(min(CHUNK_BYTES, left))
+            if not raw:
+                break
+            left -= len(raw)
+            counts.add_chunk(_digits(raw))
+    return counts
+
+
+def count_events(task):
+    """Count player moves from an oddti_events log."""
+    from array import array
+    from oddti_events import read_events
+    path = task[0]
+    counts = Counts()
+    buf = array("b")
+    for ev in read_events(path, kinds={"ball"}, rotated=False):
+        buf.append(ev["player"])
+        if len(buf) >= CHUNK_BYTES:
+            counts.add_chunk(np.frombuffer(buf, dtype=np.int8).astype(np.intp))
+            buf = array("b")
+    counts.add_chunk(np.frombuffer(buf, dtype=np.int8).astype(np.intp))
+    return counts
+
+
+def _tasks(paths):
+    """Split files into (func, task, file_index) units of work."""
+    tasks = []
+    for idx, path in enumerate(paths):
+        if path.endswith(".jsonl") or ".jsonl." in path:
+            tasks.append((count_events, (path,), idx))
+            continue
+        size = os.path.getsize(path)
+        for start in range(0, max(size, 1), SPLIT_BYTES):
+            tasks.append((count_text, (path, start, min(size, start + SPLIT_BYTES)), idx))
+    return tasks
+
+
+def _run(job):
+    func, task, _ = job
+    return func(task)
+
+
+def train(paths, pred=None, workers=None):
+    """
+    Count every file (in parallel when workers != 1), merge the partial
+    tables in file order and add them to pred.  Returns (pred, Counts).
+    """
+    jobs = _tasks(paths)
+    if workers == 1 or len(jobs) == 1:
+        parts = [_run(j) for j in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_run, jobs))
+    total = Counts()
+    prev_file = None
+    session = None
+    for (_, _, idx), part in zip(jobs, parts):
+        if idx != prev_file:
+            if session is not None:
+                total.join(session, continuous=False)
+            session = Counts()
+            prev_file = idx
+        session.join(part, continuous=True)
+    if session is not None:
+        total.join(session, continuous=False)
+    if pred is None:
+        from oddti_predictors import ArrayPredictor
+        pred = ArrayPredictor()
+    return total.apply(pred), total
+
+# -----------------------------
+# Check + throughput
+# -----------------------------
+
+def make_dataset(path, moves, seed=0):
+    """Write a synthetic session of `moves` digits with a human-ish habit."""
+    rng = np.random.default_rng(seed)
+    m = rng.integers(0, N, size=moves)
+    sticky = rng.random(moves) < 0.3
+    m[1:][sticky[1:]] = (m[:-1][sticky[1:]] + 2) % N
+    with open(path, "wb") as f:
+        for i in range(0, moves, 1 << 20):
+            part = (m[i:i + (1 << 20)] + 48).astype(np.uint8)
+            f.write(part.tobytes())
+            f.write(b"\n")
+
+
+def check(moves=200000, tmp="oddti_train_check"):
+    """Bulk training must give the same tables as sequential update()."""
+    from oddti_edition import load_edition
+    from oddti_predictors import ArrayPredictor
+    global SPLIT_BYTES
+    Predictor = load_edition().Predictor
+    paths = []
+    for k in range(3):
+        path = f"{tmp}_{k}.txt"
+        make_dataset(path, moves // (k + 1), seed=k)
+        paths.append(path)
+    saved, SPLIT_BYTES = SPLIT_BYTES, 50000      # force split files
+    try:
+        ref = Predictor()
+        for path in paths:
+            prev = None
+            with open(path) as f:
+                for ch in f.read():
+                    if "0" <= ch <= "6":
+                        ref.update(prev, int(ch))
+                        prev = int(ch)
+        for model in (Predictor(), ArrayPredictor()):
+            got, _ = train(paths, model, workers=2)
+            same = (got.freq == ref.freq and got.markov == ref.markov
+                    and got.last_player_move == ref.last_player_move)
+            print(f"{type(model).__name__}: {'identical' if same else 'DIFFERENT'} "
+                  f"to sequential update()")
+            if not same:
+                raise AssertionError("bulk training differs from update()")
+    finally:
+        SPLIT_BYTES = saved
+        for path in paths:
+            os.remove(path)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] == "--check":
+        check()
+        return
+    workers = None
+    if "--workers" in argv:
+        k = argv.index("--workers")
+        workers = int(argv[k + 1])
+        del argv[k:k + 2]
+    scratch = None
+    if not argv:
+        scratch = "oddti_train_bench.txt"
+        make_dataset(scratch, 20000000)
+        argv = [scratch]
+    t0 = time.perf_counter()
+    _, total = train(argv, workers=workers)
+    dt = time.perf_counter() - t0
+    print(f"{total.moves:,} moves from {len(argv)} file(s) in {dt:.2f}s "
+          f"= {total.moves / dt:,.0f} moves/sec")
+    if scratch:
+        os.remove(scratch)
+
+
+if __name__ == "__main__":
+    main()
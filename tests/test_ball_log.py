@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from ODDTI2 import BallLog
+
+
+def _balls(n, seed=0):
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        bat, bowl = rng.randrange(7), rng.randrange(7)
+        out.append((bat, bowl, 0 if bat == bowl else bat))
+    return out
+
+
+SLICES = [slice(a, b, c) for a in (None, -9, -3, -1, 0, 2, 5, 40)
+          for b in (None, -7, -2, 0, 1, 4, 12, 40) for c in (None, 1, 2, 3, -1, -2)]
+
+
+@pytest.mark.parametrize("size", [None, 1, 5, 8])
+@pytest.mark.parametrize("n", [0, 1, 4, 5, 6, 13, 40])
+def test_ball_log_reads_like_a_list(size, n):
+    log = BallLog(size)
+    balls = _balls(n, seed=n)
+    for ball in balls:
+        log.append(ball)
+    ref = balls if size is None else balls[-size:] if n else []
+    assert len(log) == len(ref)
+    assert list(log) == ref
+    for i in range(-len(ref) - 2, len(ref) + 2):
+        if -len(ref) <= i < len(ref):
+            assert log[i] == ref[i]
+        else:
+            with pytest.raises(IndexError):
+                log[i]
+    for s in SLICES:
+        assert log[s] == ref[s], s
+
+
+def test_ring_wraps_many_times():
+    log = BallLog(5)
+    balls = _balls(1003, seed=9)
+    for k, (bat, bowl, _) in enumerate(balls, start=1):
+        log.add(bat, bowl)
+        assert log[:] == balls[max(0, k - 5):k]
+    assert log.balls == 1003 and len(log.buf) == 5
@@ -0,0 +1,55 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from oddti_batch import FREQ_ROW, N, NO_MOVE, BatchPredictorStore
+from oddti_predictors import ArrayPredictor
+
+
+def test_batch_predictions_are_among_the_reference_ties():
+    sessions, balls = 300, 60
+    rng = np.random.default_rng(1)
+    store = BatchPredictorStore(capacity=8, seed=1)
+    sids = np.array([store.add() for _ in range(sessions)])
+    preds = [ArrayPredictor() for _ in range(sessions)]
+    prevs = np.full(sessions, NO_MOVE)
+    for _ in range(balls):
+        got = store.predict(sids)
+        for k, p in enumerate(preds):
+            row = p.last_player_move if p.last_player_move is not None else FREQ_ROW
+            assert got[k] in p.row_ties[row]
+        actual = np.where(rng.random(sessions) < 0.5, (prevs + 1) % N,
+                          rng.integers(0, N, sessions))
+        store.update(sids, prevs, actual)
+        for k, p in enumerate(preds):
+            p.update(None if prevs[k] < 0 else int(prevs[k]), int(actual[k]))
+        prevs = actual
+    for k in (0, 7, sessions - 1):
+        back = store.to_predictor(sids[k])
+        assert list(back.counts) == list(preds[k].counts)
+        assert back.last_player_move == preds[k].last_player_move
+
+
+def test_free_slots_are_reused():
+    store = BatchPredictorStore(capacity=4)
+    sids = [store.add() for _ in range(10)]
+    assert store.capacity == 16
+    for sid in sids[::2]:
+        store.remove(sid)
+    again = [store.add() for _ in sids[::2]]
+    assert sorted(again) == sorted(sids[::2])
+    assert store.capacity == 16 and len(store) == 10
+    with pytest.raises(KeyError):
+        store.remove(store.capacity - 1)
+
+
+def test_add_from_round_trips_an_array_predictor():
+    pred = ArrayPredictor()
+    prev = None
+    for m in [1, 2, 2, 6, 1, 2, 5] * 20:
+        pred.update(prev, m)
+        prev = m
+    store = BatchPredictorStore(capacity=2)
+    back = store.to_predictor(store.add_from(pred))
+    assert list(back.counts) == list(pred.counts)
+    assert back.last_player_move == pred.last_player_move
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from oddti_checkpoint import RECORD_SIZE, Checkpoint, check, dumps, loads, transcript
+from oddti_server import Session
+
+
+def _played(seed, k):
+    session = Session(rng=random.Random(seed))
+    session.start()
+    for line, _ in transcript(seed)[:k]:
+        session.feed(line)
+    return session
+
+
+def _plays_on(session, steps):
+    return [session.feed(line) for line, _ in steps] == [out for _, out in steps]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_dumps_loads_plays_on_identically(seed):
+    steps = transcript(seed)
+    for k in (0, 1, len(steps) // 2, len(steps) - 1):
+        data = dumps(_played(seed, k))
+        assert len(data) == RECORD_SIZE
+        assert _plays_on(loads(data), steps[k:])
+
+
+def test_checkpoint_restores_newest_save(tmp_path):
+    path = str(tmp_path / "s.ckpt")
+    steps = transcript(4)
+    k = len(steps) // 3
+    with Checkpoint(path) as ck:
+        assert ck.restore() is None
+        session = _played(4, 0)
+        for line, _ in steps[:k]:
+            session.feed(line)
+            ck.save(session)
+    with Checkpoint(path) as ck:
+        assert _plays_on(ck.restore(), steps[k:])
+
+
+def test_torn_save_falls_back_to_the_ball_before(tmp_path):
+    path = str(tmp_path / "s.ckpt")
+    steps = transcript(5)
+    k = len(steps) // 2
+    with Checkpoint(path) as ck:
+        session = _played(5, 0)
+        for line, _ in steps[:k]:
+            session.feed(line)
+            ck.save(session)
+        newest = (ck.seq & 1) * RECORD_SIZE
+    with open(path, "r+b") as f:
+        f.seek(newest + RECORD_SIZE // 2)
+        f.write(b"\xff" * 16)
+    with Checkpoint(path) as ck:
+        assert _plays_on(ck.restore(), steps[k - 1:])
+
+
+def test_killed_process_and_worker_handoff(tmp_path, capsys):
+    check(seeds=(1,), path=str(tmp_path / "crash.ckpt"))
+    assert "identical" in capsys.readouterr().out
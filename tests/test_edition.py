@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PLAY = f"""
+import random, sys
+sys.path.insert(0, {ROOT!r})
+from oddti_edition import load_edition
+from oddti_strategy import RandomStrategy
+game = load_edition()
+player = RandomStrategy(random.Random(1))
+for _ in range(3):
+    game.single_match(player)
+"""
+
+
+def test_plain_play_writes_no_files(tmp_path):
+    proc = subprocess.run([sys.executable, "-c", PLAY], cwd=tmp_path,
+                          capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert os.listdir(tmp_path) == []
+
+
+MENU = f"""
+import sys
+sys.path.insert(0, {ROOT!r})
+from oddti_edition import load_edition
+load_edition().main()
+"""
+
+TRACKED = PLAY.replace("player = ", "game.TRACK_STATS = True\nplayer = ")
+
+
+def test_bad_leaderboard_file_is_reported_not_raised(tmp_path):
+    (tmp_path / "oddti_stats.bin").write_bytes(b"ODDTI")
+    proc = subprocess.run([sys.executable, "-c", MENU], cwd=tmp_path, input="4\n5\n",
+                          capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert "Could not read the leaderboard" in proc.stdout
+    assert "Exiting" in proc.stdout
+
+    proc = subprocess.run([sys.executable, "-c", TRACKED], cwd=tmp_path,
+                          capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.count("Could not read the leaderboard") == 1
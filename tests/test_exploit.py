@@ -0,0 +1,50 @@
+import random
+from itertools import product
+
+import pytest
+
+from oddti_exploit import N, VALID_NUMS, ExploitSearch, analyze, playout
+
+
+def _table(seed):
+    rng = random.Random(seed)
+    return [rng.randint(1, 4) for _ in range((N + 1) * N)], rng.choice(VALID_NUMS)
+
+
+def _brute_force(s, depth):
+    best = 0.0
+    for seq in product(VALID_NUMS, repeat=depth):
+        v, alive = 0.0, 1.0
+        for a in seq:
+            alive *= 1.0 - s.out_probs()[a]
+            v += alive * a
+            s.play(a)
+        for _ in seq:
+            s.unplay()
+        best = max(best, v)
+    return best
+
+
+@pytest.mark.parametrize("seed,epsilon", [(9, 0.12), (10, 0.0), (11, 0.5)])
+def test_search_matches_brute_force_at_depth_4(seed, epsilon):
+    counts, last = _table(seed)
+    brute = _brute_force(ExploitSearch(counts, last, epsilon), 4)
+    s = ExploitSearch(counts, last, epsilon)
+    assert s.value(4) == pytest.approx(brute, abs=1e-9)
+    assert s.counts == counts and s.last == last
+
+
+def test_best_line_holds_up_in_play():
+    counts, last = _table(9)
+    depth, epsilon = 4, 0.12
+    rep = analyze(counts=counts, last=last, depth=depth, epsilon=epsilon, workers=1)
+    values = [entry["expected_runs"] for entry in rep["lines"]]
+    assert values == sorted(values, reverse=True)
+    best = rep["lines"][0]
+    assert len(best["line"]) == depth
+    played = playout(counts, last, epsilon, best["line"], trials=5000)
+    assert played == pytest.approx(best["expected_runs"], abs=0.15)
+    rng = random.Random(1)
+    rand = sum(playout(counts, last, epsilon, [rng.choice(VALID_NUMS) for _ in range(depth)],
+                       trials=100, seed=k) for k in range(50)) / 50
+    assert played > rand
@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+from oddti_policy import N, VALID_NUMS, _chase_sim, build, guess_game, read
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_guess_game_mixes_are_an_equilibrium(seed):
+    rng = random.Random(seed)
+    o = rng.random()
+    g = [o + rng.random() for _ in VALID_NUMS]
+    v, p, q = guess_game(g, o)
+    assert sum(p) == pytest.approx(1.0) and sum(q) == pytest.approx(1.0)
+    assert min(p) >= 0 and min(q) >= 0
+    # No pure bowling number holds the batter under v, no pure batting number beats it.
+    for b in VALID_NUMS:
+        assert sum(p[a] * (o if a == b else g[a]) for a in VALID_NUMS) >= v - 1e-9
+    for a in VALID_NUMS:
+        assert q[a] * o + (1 - q[a]) * g[a] <= v + 1e-9
+
+
+@pytest.fixture(scope="module")
+def table(tmp_path_factory):
+    path = tmp_path_factory.mktemp("policy") / "policy.bin"
+    table = build(str(path))
+    assert list(read(str(path)).cum) == list(table.cum)
+    return table
+
+
+@pytest.mark.parametrize("need", [1, 6, 20])
+def test_chase_value_is_an_equilibrium(table, need):
+    games = 4000
+    rng = random.Random(need)
+    slack = 4 * (0.25 / games) ** 0.5
+    v = table.value("bat", need)
+    tbat = lambda left: table.pick("bat", left, rng=rng)
+    tbowl = lambda left: table.pick("bowl", left, rng=rng)
+    assert abs(_chase_sim(table, need, tbat, tbowl, games, rng) - v) < slack
+    rand = _chase_sim(table, need, lambda left: rng.randrange(N), tbowl, games, rng)
+    assert rand < v + slack
+    for a in VALID_NUMS[1:]:
+        fixed = _chase_sim(table, need, lambda left: a, tbowl, games // 4, rng)
+        assert fixed < v + 2 * slack
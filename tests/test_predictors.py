@@ -0,0 +1,119 @@
+import random
+
+import pytest
+
+from oddti_edition import load_edition
+from oddti_predictors import (RENORM_AT, VALID_NUMS, ArrayPredictor, DecayingPredictor,
+                              EnsemblePredictor, NGramPredictor, _habit_moves,
+                              check_decay_accuracy, compare_hit_rates)
+
+
+@pytest.mark.parametrize("seed", [7, 8])
+def test_array_predictor_is_the_reference_predictor(seed):
+    """Same moves and the same random state: every prediction matches."""
+    balls = 20000
+    ref, new = load_edition().Predictor(), ArrayPredictor()
+    moves = random.Random(seed)
+    prev = None
+    for i in range(balls):
+        if i == balls // 2:
+            ref.reset()
+            new.reset()
+            prev = None
+        state = random.getstate()
+        a = ref.predict(prev)
+        random.setstate(state)
+        assert new.predict(prev) == a, f"ball {i}"
+        actual = moves.choice(VALID_NUMS) if moves.random() < 0.6 else (prev or 0)
+        ref.update(prev, actual)
+        new.update(prev, actual)
+        prev = actual
+        if i % 997 == 0:
+            assert (new.freq, new.markov) == (ref.freq, ref.markov)
+    assert (new.freq, new.markov, new.last_player_move) == \
+        (ref.freq, ref.markov, ref.last_player_move)
+
+
+@pytest.mark.parametrize("order,cap", [(2, 2), (3, 3), (3, 5), (6, 8)])
+def test_ngram_keeps_every_context_in_use_at_the_cap(order, cap):
+    pred = NGramPredictor(order=order, max_contexts=cap, rng=random.Random(1))
+    moves = random.Random(order * 100 + cap)
+    prev = None
+    for _ in range(3000):
+        m = moves.choice((0, 1, 2, 3, 3, 4, 5, 6, 6))
+        in_use = [k for k in pred.keys if k]
+        before = {k: pred.contexts[k][0] for k in in_use if k in pred.contexts}
+        pred.update(prev, m)
+        prev = m
+        assert len(pred.contexts) <= cap
+        for k in in_use:
+            entry = pred.contexts[k]
+            assert entry[0] == before.get(k, 0) + 1
+            assert entry[3][m] >= 1
+    assert pred.evictions > 0
+
+
+@pytest.mark.parametrize("half_life", [40.0, 5.0])
+def test_decaying_predictor_matches_eager_decay(monkeypatch, half_life):
+    renorms = []
+    renormalise = DecayingPredictor._renormalise
+
+    def counted(self):
+        renorms.append(self.scale)
+        renormalise(self)
+
+    monkeypatch.setattr(DecayingPredictor, "_renormalise", counted)
+    worst, tie_diffs = check_decay_accuracy(balls=100000, half_life=half_life)
+    assert len(renorms) >= 5
+    assert all(s > RENORM_AT for s in renorms)
+    assert worst < 1e-12
+    assert tie_diffs == 0
+
+
+def test_ensemble_learns_habits_the_shared_table_misses():
+    rates = compare_hit_rates((ArrayPredictor, EnsemblePredictor), balls=5000)
+    for kind in ("repeater", "cycler", "role habits"):
+        assert rates[kind]["EnsemblePredictor"] > rates[kind]["ArrayPredictor"] + 0.05, kind
+    assert rates["random"]["EnsemblePredictor"] < 0.2
+
+
+def test_ensemble_weights_stay_normalised_per_role():
+    pred = EnsemblePredictor(beta=0.5, floor=1e-3, rng=random.Random(2))
+    move = _habit_moves("alternator", random.Random(3))
+    hist = {"bat": [], "bowl": []}
+    for k in range(3000):
+        role = "bat" if k // 7 % 2 else "bowl"
+        pred.set_role(role)
+        if k % 5:
+            assert pred.predict(pred.last_player_move) in VALID_NUMS
+        actual = move(role, hist[role])
+        hist[role].append(actual)
+        pred.update(pred.last_player_move, actual)
+        for weights in pred.expert_weights().values():
+            assert max(weights.values()) == 1.0
+            assert min(weights.values()) >= pred.floor
+    fresh = EnsemblePredictor().freq
+    assert sum(pred.freq.values()) == sum(fresh.values()) + 3000
+    pred.reset()
+    assert pred.last_player_move is None and pred.freq == fresh
+    assert set(pred.weights) == {1.0}
+
+
+def test_ensemble_is_repeatable_with_its_own_rng():
+    def run(seed):
+        pred = EnsemblePredictor(rng=random.Random(seed))
+        moves = random.Random(4)
+        out = []
+        for k in range(2000):
+            pred.set_role("bat" if k % 9 < 4 else "bowl")
+            out.append(pred.predict(pred.last_player_move))
+            pred.update(pred.last_player_move, moves.choice(VALID_NUMS))
+        return out
+
+    assert run(6) == run(6)
+
+
+def test_ensemble_rejects_bad_beta():
+    for beta in (0.0, 1.0, 1.5):
+        with pytest.raises(ValueError):
+            EnsemblePredictor(beta=beta)
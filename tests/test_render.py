@@ -0,0 +1,32 @@
+import pytest
+
+import ODDTI2
+from oddti_bench import scripted_output
+from oddti_edition import load_edition
+
+
+def _edition():
+    game = load_edition()
+    game.LOG_EVENTS = False
+    game.TRACK_STATS = False
+    return game
+
+
+@pytest.mark.parametrize("make_engine", [lambda: ODDTI2, _edition], ids=["ODDTI2", "edition"])
+def test_buffered_output_is_the_same_as_line_by_line(make_engine):
+    engine = make_engine()
+    if hasattr(engine, "predictor"):
+        engine.predictor.reset()
+    line = scripted_output(engine, "line")
+    assert line
+    for flush_every in ("ball", "innings", "match"):
+        if hasattr(engine, "predictor"):
+            engine.predictor.reset()
+        assert scripted_output(engine, flush_every) == line
+
+
+@pytest.mark.parametrize("make_engine", [lambda: ODDTI2, _edition], ids=["ODDTI2", "edition"])
+def test_lower_verbosity_prints_less(make_engine):
+    engine = make_engine()
+    sizes = [len(scripted_output(engine, "match", v)) for v in (2, 1, 0)]
+    assert sizes[0] > sizes[1] > sizes[2] > 0
@@ -0,0 +1,68 @@
+import gc
+import random
+import weakref
+
+import pytest
+
+import ODDTI2
+from oddti_edition import load_edition
+from oddti_events import EventLog, read_events
+from oddti_strategy import RandomStrategy, ReplayStrategy
+
+MATCHES = 8
+
+
+def _edition():
+    game = load_edition()
+    game.TRACK_STATS = False
+    game.LOG_EVENTS = True
+    return game
+
+
+def _record(engine, path, player, seed):
+    """Play MATCHES matches into an event log; returns the scores."""
+    engine.EVENT_LOG = EventLog(str(path))
+    cpu = RandomStrategy(random.Random(seed))
+    try:
+        return [engine.single_match(player, cpu)[:2] for _ in range(MATCHES)]
+    finally:
+        engine.EVENT_LOG.close()
+        engine.EVENT_LOG = None
+
+
+def _events(path):
+    return [{k: v for k, v in ev.items() if k not in ("seq", "t")}
+            for ev in read_events(str(path), rotated=False)]
+
+
+@pytest.mark.parametrize("make_engine", [lambda: ODDTI2, _edition], ids=["ODDTI2", "edition"])
+def test_recorded_matches_replay_from_start_to_finish(tmp_path, make_engine):
+    engine = make_engine()
+    if hasattr(engine, "predictor"):
+        engine.predictor.reset()
+    played = _record(engine, tmp_path / "played.jsonl", RandomStrategy(random.Random(1)), 2)
+    events = _events(tmp_path / "played.jsonl")
+    tosses = [ev for ev in events if ev["kind"] == "toss"]
+    assert {ev["winner"] for ev in tosses} >= {"player"}
+    assert all(ev["elect"] in ("bat", "bowl") for ev in tosses)
+
+    replay = ReplayStrategy.from_events(str(tmp_path / "played.jsonl"))
+    if hasattr(engine, "predictor"):
+        engine.predictor.reset()
+    replayed = _record(engine, tmp_path / "replayed.jsonl", replay, 2)
+    assert replayed == played
+    assert _events(tmp_path / "replayed.jsonl") == events
+    # every recorded answer was used, none left over
+    assert all(replay.pos[k] == len(q) for k, q in replay.queues.items())
+
+
+def test_closed_event_logs_are_not_kept_alive_by_atexit(tmp_path):
+    logs = []
+    for k in range(3):
+        with EventLog(str(tmp_path / f"events{k}.jsonl")) as log:
+            log.emit("ball", n=k)
+        logs.append(weakref.ref(log))
+    del log
+    gc.collect()
+    assert [ref() for ref in logs] == [None] * 3
+    assert [e["n"] for e in read_events(str(tmp_path / "events2.jsonl"))] == [2]
@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from oddti_sampling import N, NEAR, SCHEMES, VALID_NUMS, AliasTable, get_sampler
+
+
+def _target(weight, pred, runs_left):
+    w = [0 if n == pred else weight(n, runs_left) for n in VALID_NUMS]
+    return [x / sum(w) for x in w]
+
+
+def _exact(table):
+    """The distribution an alias table actually samples."""
+    p = [table.prob[k] / N for k in VALID_NUMS]
+    for i in VALID_NUMS:
+        p[table.alias[i]] += (1.0 - table.prob[i]) / N
+    return p
+
+
+@pytest.mark.parametrize("scheme", sorted(SCHEMES))
+def test_every_table_samples_its_scheme_exactly(scheme):
+    sampler = get_sampler(scheme)
+    for runs_left in (None, *range(1, NEAR + 1)):
+        for pred in (None, *VALID_NUMS):
+            table = sampler.tables[runs_left or 0][N if pred is None else pred]
+            got = _exact(table)
+            want = _target(SCHEMES[scheme], pred, runs_left)
+            assert max(abs(a - b) for a, b in zip(got, want)) < 1e-12
+            if pred is not None:
+                assert got[pred] == 0.0
+
+
+@pytest.mark.parametrize("scheme", sorted(SCHEMES))
+@pytest.mark.parametrize("pred,runs_left", [(None, None), (6, None), (0, 3), (3, 1), (5, 40)])
+def test_pick_frequencies_match_the_scheme(scheme, pred, runs_left):
+    draws = 30000
+    rng = random.Random(f"{scheme}:{pred}:{runs_left}")
+    pick = get_sampler(scheme).pick
+    counts = [0] * N
+    for _ in range(draws):
+        counts[pick(pred, runs_left, rng)] += 1
+    if pred is not None:
+        assert counts[pred] == 0
+    for n, p in enumerate(_target(SCHEMES[scheme], pred, runs_left)):
+        se = (p * (1 - p) / draws) ** 0.5
+        assert abs(counts[n] / draws - p) <= 5 * se + 1e-9
+
+
+def test_alias_table_rejects_all_zero_weights():
+    with pytest.raises(ValueError):
+        AliasTable([0] * N)
@@ -0,0 +1,25 @@
+import asyncio
+
+from oddti_server import LINE_LIMIT, GameServer
+
+
+async def _send_oversized_line():
+    game = GameServer()
+    server = await asyncio.start_server(game.handle, "127.0.0.1", 0, limit=LINE_LIMIT)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await reader.readline()                      # banner
+        assert (await reader.readline()).startswith(b"? mode")
+        writer.write(b"x" * (LINE_LIMIT * 4))        # no newline
+        await writer.drain()
+        reply = await asyncio.wait_for(reader.read(), timeout=5)
+        writer.close()
+    return reply.decode(), game.stats.open
+
+
+def test_oversized_line_gets_error_and_close():
+    reply, still_open = asyncio.run(_send_oversized_line())
+    assert reply.startswith("Line too long")
+    assert reply.rstrip().endswith("bye")
+    assert still_open == 0
@@ -0,0 +1,28 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from oddti_sim import Strategy, interactive_reference, simulate_matches
+
+
+def test_interactive_reference_leaves_the_global_rng_alone():
+    random.seed(11)
+    state = random.getstate()
+    interactive_reference(20, seed=3)
+    assert random.getstate() == state
+
+
+def test_batch_engine_agrees_with_interactive_play():
+    res = simulate_matches(np.random.default_rng(0), Strategy.random(), Strategy.random(),
+                           100000)
+    winners, ps, cs = interactive_reference(3000, seed=0)
+    n = len(winners)
+    for outcome in (1, -1, 0):
+        p = (winners == outcome).mean()
+        se = max((p * (1 - p) / n) ** 0.5, 1e-3)
+        assert abs((res["winner"] == outcome).mean() - p) < 5 * se
+    for batch, ref in ((res["player_score"], ps), (res["cpu_score"], cs)):
+        se = ref.std() / n ** 0.5
+        assert abs(batch.mean() - ref.mean()) < 5 * se
@@ -0,0 +1,53 @@
+import pytest
+
+from oddti_solver import UNIFORM, InningsTable, match_odds, solve
+
+BAT = (1, 1, 2, 2, 3, 4, 5)
+BOWL = (3, 1, 1, 1, 1, 2, 2)
+
+
+@pytest.mark.parametrize("tail", [0, 0.0, -1e-9, 1.0])
+def test_tail_outside_zero_one_is_rejected(tail):
+    with pytest.raises(ValueError):
+        InningsTable(UNIFORM, UNIFORM, tail)
+
+
+@pytest.mark.parametrize("tail", [1e-17, 1e-40, 5e-324])
+def test_tail_below_rounding_still_finishes(tail):
+    table = InningsTable(BAT, BOWL, tail)
+    assert abs(sum(table.score_pmf) - 1.0) < 1e-12
+
+
+def test_match_odds_sum_to_one():
+    assert abs(sum(match_odds(BAT, BOWL, BOWL, BAT)) - 1.0) < 1e-9
+
+
+def test_solver_agrees_with_the_simulator():
+    np = pytest.importorskip("numpy")
+    import oddti_sim
+    n = 200000
+    rng = np.random.default_rng(0)
+    table = solve(BAT, BOWL)
+    batter = oddti_sim.Strategy.mixed(bat=BAT)
+    bowler = oddti_sim.Strategy.mixed(bat=BOWL)
+
+    def close(exact, hits):
+        se = max((exact * (1 - exact) / n) ** 0.5, 1e-4)
+        return abs(hits.mean() - exact) < 5 * se
+
+    scores, _ = oddti_sim.simulate_innings(rng, batter, bowler, n)
+    assert abs(scores.mean() - table.mean_score) < 5 * scores.std() / n ** 0.5
+    for s in (0, 5, 10, 20):
+        assert close(table.score_pmf[s], scores == s)
+    for target in (5, 14, 30):
+        chased, _ = oddti_sim.simulate_innings(rng, batter, bowler, n,
+                                               target=np.full(n, target))
+        assert close(table.chase(target + 1), chased > target)
+
+    u = oddti_sim.Strategy.random()
+    res = oddti_sim.simulate_matches(rng, u, u, n)
+    first_won = np.where(res["player_first"], res["winner"] == 1, res["winner"] == -1)
+    first, chaser, tie = match_odds(UNIFORM, UNIFORM, UNIFORM, UNIFORM)
+    assert close(first, first_won)
+    assert close(tie, res["winner"] == 0)
+    assert close(chaser, (res["winner"] != 0) & ~first_won)
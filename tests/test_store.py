@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from oddti_edition import load_edition
+from oddti_predictors import ArrayPredictor, DecayingPredictor, NGramPredictor
+from oddti_store import NAME_SIZE, ModelStore
+
+
+def _train(pred, seed=3, balls=300):
+    rng = random.Random(seed)
+    prev = None
+    for _ in range(balls):
+        m = rng.choice((1, 3, 3, 5, 6))
+        pred.update(prev, m)
+        prev = m
+    return pred
+
+
+def _table(pred):
+    return ([pred.markov[p][n] for p in range(7) for n in range(7)]
+            + [pred.freq[n] for n in range(7)], pred.last_player_move)
+
+
+def test_array_predictor_round_trip(tmp_path):
+    pred = _train(ArrayPredictor())
+    with ModelStore(tmp_path / "players.bin") as store:
+        store.save_from("Ganesh", pred)
+    with ModelStore(tmp_path / "players.bin") as store:
+        back = ArrayPredictor()
+        assert store.load_into("  ganesh ", back)
+    assert _table(back) == _table(pred)
+
+
+def test_reference_predictor_round_trip(tmp_path):
+    game = load_edition()
+    pred = _train(game.Predictor())
+    with ModelStore(tmp_path / "players.bin") as store:
+        store.save_from("asha", pred)
+        back = game.Predictor()
+        assert store.load_into("asha", back)
+        assert not store.load_into("nobody", game.Predictor())
+    assert _table(back) == _table(pred)
+
+
+@pytest.mark.parametrize("make", [DecayingPredictor, NGramPredictor])
+def test_models_without_integer_table_are_rejected(tmp_path, make):
+    with ModelStore(tmp_path / "players.bin") as store:
+        with pytest.raises(TypeError):
+            store.save_from("asha", _train(make()))
+        store.save_from("asha", _train(ArrayPredictor()))
+        with pytest.raises(TypeError):
+            store.load_into("asha", make())
+
+
+def test_long_names_are_rejected_not_truncated(tmp_path):
+    base = "x" * NAME_SIZE
+    with ModelStore(tmp_path / "players.bin") as store:
+        store.save_from(base, _train(ArrayPredictor()))
+        for name in (base + "a", base + "b", "é" * (NAME_SIZE // 2 + 1)):
+            with pytest.raises(ValueError):
+                store.save_from(name, ArrayPredictor())
+            with pytest.raises(ValueError):
+                store.load_into(name, ArrayPredictor())
+        assert len(store) == 1
@@ -0,0 +1,30 @@
+import random
+
+from oddti_strategy import PredictorStrategy
+from oddti_sweep import PANEL, SweepCPU, run_block
+
+
+def test_sweep_cpu_plays_like_predictor_strategy_and_counts_hits():
+    cpu = SweepCPU(0.2, "markov", "target")
+    ref = PredictorStrategy(0.2, "target")
+    cpu.reset(random.Random(3))
+    ref.reset(random.Random(3))
+    moves = random.Random(4)
+    guesses = hits = 0
+    for k in range(500):
+        role = "bat" if k & 1 else "bowl"
+        runs_left = None if k % 3 else 15
+        assert cpu.play(role, runs_left) == ref.play(role, runs_left)
+        other = moves.choice(range(7))
+        if cpu.pending is not None:
+            guesses += 1
+            hits += cpu.pending == other
+        cpu.observe(role, 0, other)
+        ref.observe(role, 0, other)
+    assert 0 < cpu.predictions == guesses < 500
+    assert cpu.hits == hits
+
+
+def test_run_block_is_repeatable():
+    task = (5, (0.12, "ensemble", "value"), 1, PANEL[1], 0, 20)
+    assert run_block(task) == run_block(task)
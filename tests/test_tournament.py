@@ -0,0 +1,49 @@
+import random
+
+from oddti_strategy import PredictorStrategy, RandomStrategy
+from oddti_tournament import DEFAULT_FIELD, make_bot, play_match, run_tournament
+
+
+def test_bots_are_ready_to_play_when_built():
+    for spec in DEFAULT_FIELD:
+        bot = make_bot(spec)
+        assert isinstance(bot, RandomStrategy)
+        assert bot.play("bat", None) in range(7)
+        assert bot.call_toss() in ("odd", "even")
+
+
+def test_predictor_bot_plays_like_predictor_strategy():
+    bot = make_bot(("predictor", 0.12, "target"))
+    ref = PredictorStrategy(0.12, "target")
+    bot.reset(random.Random(7))
+    ref.reset(random.Random(7))
+    moves = random.Random(8)
+    for k in range(500):
+        role = "bat" if k & 1 else "bowl"
+        runs_left = None if k % 3 else 20
+        assert bot.play(role, runs_left) == ref.play(role, runs_left)
+        other = moves.choice(range(7))
+        bot.observe(role, 0, other)
+        ref.observe(role, 0, other)
+
+
+def test_play_match_goes_through_the_toss_protocol():
+    calls = []
+
+    class Caller(RandomStrategy):
+        def call_toss(self):
+            calls.append("call")
+            return super().call_toss()
+
+    a, b = Caller(random.Random(1)), RandomStrategy(random.Random(2))
+    for _ in range(5):
+        sa, sb = play_match(a, b)
+        assert sa >= 0 and sb >= 0
+    assert calls == ["call"] * 5
+
+
+def test_standings_do_not_depend_on_worker_count():
+    field = DEFAULT_FIELD[:4]
+    one, _ = run_tournament(field, games=20, workers=1)
+    two, _ = run_tournament(field, games=20, workers=2)
+    assert one == two
@@ -0,0 +1,57 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+import oddti_train
+from oddti_edition import load_edition
+from oddti_events import EventLog
+from oddti_predictors import ArrayPredictor
+
+
+def _tables(pred):
+    return pred.freq, pred.markov, pred.last_player_move
+
+
+def _sequential(Predictor, sessions):
+    ref = Predictor()
+    for moves in sessions:
+        prev = None
+        for m in moves:
+            ref.update(prev, m)
+            prev = m
+    return ref
+
+
+@pytest.fixture
+def sessions(tmp_path, monkeypatch):
+    """Three text sessions of different lengths, split into many byte ranges."""
+    monkeypatch.setattr(oddti_train, "SPLIT_BYTES", 5000)
+    paths, moves = [], []
+    for k in range(3):
+        path = str(tmp_path / f"session{k}.txt")
+        oddti_train.make_dataset(path, 40000 // (k + 1), seed=k)
+        with open(path) as f:
+            moves.append([int(ch) for ch in f.read() if "0" <= ch <= "6"])
+        paths.append(path)
+    return paths, moves
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("model", ["Predictor", "ArrayPredictor"])
+def test_bulk_training_matches_sequential_update(sessions, model, workers):
+    paths, moves = sessions
+    Predictor = load_edition().Predictor
+    make = Predictor if model == "Predictor" else ArrayPredictor
+    got, total = oddti_train.train(paths, make(), workers=workers)
+    assert _tables(got) == _tables(_sequential(Predictor, moves))
+
+
+def test_event_logs_train_like_their_ball_events(tmp_path):
+    path = str(tmp_path / "events.jsonl")
+    moves = [3, 5, 3, 6, 6, 0, 3, 5, 1, 4] * 30
+    with EventLog(path) as log:
+        for m in moves:
+            log.emit("toss", call="odd", player=2, cpu=4, winner="player", elect="bat")
+            log.emit("ball", batting="player", player=m, cpu=(m + 1) % 7, runs=m, score=0)
+    got, _ = oddti_train.train([path], ArrayPredictor(), workers=1)
+    assert _tables(got) == _tables(_sequential(ArrayPredictor, [moves]))
@@ -69,13 +69,153 @@ class Predictor:
 # Global predictor instance and config
 USE_PREDICTOR = True        # toggle predictor on/off
 PREDICTOR_EPSILON = 0.12    # probability CPU ignores predictor (randomize)
-predictor = Predictor()
+
+# Extra models live in oddti_predictors.py (PC only). The array-backed one
+# behaves exactly like the class above; fall back to it when the file is
+# not next to this one.
+try:
+    import oddti_predictors
+    ActivePredictor = oddti_predictors.ArrayPredictor
+except ImportError:
+    oddti_predictors = None
+    ActivePredictor = Predictor
+predictor = ActivePredictor()
+
+# Per-player models saved between runs (oddti_store.py, PC only)
+try:
+    import oddti_store
+except ImportError:
+    oddti_store = None
+PLAYER_STORE = None         # opened on first profile selection
+PLAYER_NAME = None          # whose model `predictor` currently holds
+
+# Precomputed batting samplers (oddti_sampling.py, PC only)
+try:
+    import oddti_sampling
+except ImportError:
+    oddti_sampling = None
+BATTING_SCHEME = "value"    # weighting for the CPU's batting pick
+
+# Equilibrium policy table (oddti_policy.py, PC only), loaded on first use
+try:
+    import oddti_policy
+except ImportError:
+    oddti_policy = None
+CPU_POLICY = "predictor"    # "predictor", "table" or "blend"
+POLICY_BLEND = 0.5          # blend: share of balls that follow the predictor
+POLICY = None
+
+def policy_table():
+    global POLICY
+    if POLICY is None:
+        POLICY = oddti_policy.load()
+    return POLICY
+
+# Ball-by-ball event log (oddti_events.py, PC only). Off by default so
+# plain play touches no files; Predictor Menu (11) turns it on, and the
+# log is opened on the first event after that.
+try:
+    import oddti_events
+except ImportError:
+    oddti_events = None
+LOG_EVENTS = False
+EVENT_LOG = None
+
+# Career stats + leaderboard (oddti_stats.py, PC only), fed from the events.
+# Off by default like the event log; Predictor Menu (12) turns it on.
+try:
+    import oddti_stats
+except ImportError:
+    oddti_stats = None
+TRACK_STATS = False
+STATS_FEED = None
+
+def cpu_label():
+    if CPU_POLICY != "predictor":
+        return f"cpu:{CPU_POLICY}"
+    return f"cpu:{type(getattr(predictor, 'inner', predictor)).__name__}"
+
+def record_stats(kind, fields):
+    global STATS_FEED, TRACK_STATS
+    if STATS_FEED is None:
+        try:
+            STATS_FEED = oddti_stats.MatchFeed(oddti_stats.Leaderboard.load())
+        except (OSError, ValueError) as e:
+            out(0, f"Could not read the leaderboard ({e}). Career stats OFF.")
+            TRACK_STATS = False
+            return
+    STATS_FEED.player = PLAYER_NAME or "player"
+    STATS_FEED.cpu = cpu_label()
+    STATS_FEED.emit(kind, **fields)
+    if kind == "match_end":
+        try:
+            STATS_FEED.board.save()
+        except OSError as e:
+            out(0, f"Could not save the leaderboard ({e}). Career stats OFF.")
+            TRACK_STATS = False
+
+def log_event(kind, **fields):
+    global EVENT_LOG, LOG_EVENTS
+    if TRACK_STATS and kind in ("ball", "match_end"):
+        record_stats(kind, fields)
+    if not LOG_EVENTS:
+        return
+    if EVENT_LOG is None:
+        try:
+            EVENT_LOG = oddti_events.EventLog()
+        except OSError:
+            LOG_EVENTS = False
+            return
+    EVENT_LOG.emit(kind, **fields)
+
+# Hot-path stats (oddti_metrics.py, PC only); install() sets METRICS
+try:
+    import oddti_metrics
+except ImportError:
+    oddti_metrics = None
+METRICS = None
+
+def save_player_model():
+    """Write the current model back to the player's record (in place)."""
+    if PLAYER_STORE is not None and PLAYER_NAME is not None:
+        PLAYER_STORE.save_from(PLAYER_NAME, predictor)
+        PLAYER_STORE.flush()
+
+# -----------------------------
+# Output: buffered, with a verbosity level
+# -----------------------------
+# Game text goes through out(level, ...) into a buffer that is written with
+# one print() per ball, innings or match (FLUSH_EVERY; "line" prints each
+# line straight away). The input helpers flush first, so prompts never
+# overtake the text before them.
+#   VERBOSITY 2  every ball
+#             1  toss, innings and match lines, no per-ball commentary
+#             0  summary only: scorecards and the series result
+VERBOSITY = 2
+FLUSH_EVERY = "ball"
+_FLUSH_RANK = {"line": 0, "ball": 1, "innings": 2, "match": 3}
+_out = []
+
+def out(level, *args):
+    if level > VERBOSITY:
+        return
+    if FLUSH_EVERY == "line":
+        print(*args)
+    else:
+        _out.append(" ".join([str(a) for a in args]))
+
+def flush(point=None):
+    """Write buffered text at `point` ("ball", "innings", "match") or now."""
+    if _out and (point is None or _FLUSH_RANK[point] >= _FLUSH_RANK[FLUSH_EVERY]):
+        print("\n".join(_out))
+        del _out[:]
 
 # -----------------------------
 # Input helpers
 # -----------------------------
 
 def input_choice(prompt, options):
+    flush()
     opts = [o.lower() for o in options]
     while True:
         resp = input(prompt).strip().lower()
@@ -84,6 +224,7 @@ def input_choice(prompt, options):
         print("Invalid choice. Options:", ", ".join(options))
 
 def input_int_in_set(prompt, valid_set):
+    flush()
     while True:
         try:
             val = int(input(prompt).strip())
@@ -104,29 +245,42 @@ def choose_odd_or_even():
 def player_choose_number():
     return input_int_in_set("Enter your toss number (0–6): ", set(VALID_NUMS))
 
-def toss(player_parity):
-    print("\n--- TOSS ---")
-    player_num = player_choose_number()
-    comp_num = random.choice(VALID_NUMS)
-    print(f"You: {player_num}, Computer: {comp_num}")
+def toss(player_parity, player=None, cpu=None):
+    player = player or HUMAN
+    cpu = cpu or CPU
+    out(1, "\n--- TOSS ---")
+    player_num = player.toss_number()
+    comp_num = cpu.toss_number()
+    out(1, f"You: {player_num}, Computer: {comp_num}")
     s = player_num + comp_num
     result_parity = "even" if s % 2 == 0 else "odd"
-    print(f"Sum = {s} → {result_parity}")
-    if result_parity == player_parity:
-        print("You win the toss!")
-        return "player"
-    print("Computer wins the toss!")
-    return "computer"
+    out(1, f"Sum = {s} → {result_parity}")
+    winner = "player" if result_parity == player_parity else "computer"
+    if winner == "player":
+        out(1, "You win the toss!")
+        choice = player.elect()
+    else:
+        out(1, "Computer wins the toss!")
+        choice = cpu.elect()
+        out(1, f"Computer chooses to {choice}.")
+    # the winner's election goes in the toss event so a log replays in full
+    log_event("toss", call=player_parity, player=player_num, cpu=comp_num,
+              winner=winner, elect=choice)
+    return winner, choice
 
 # -----------------------------
 # CPU choice wrappers using predictor
 # -----------------------------
-def cpu_choose_when_bowling(prev_player_move):
+def cpu_choose_when_bowling(prev_player_move, runs_left=None, score=0):
     """
     CPU is bowling (player batting). CPU should try to predict player's chosen bat
     and pick that number to get an OUT. If predictor disabled or epsilon triggers,
     pick random.
+    With a table policy the number comes from the equilibrium mix for this
+    state (runs_left in a chase, else the player's score so far).
     """
+    if CPU_POLICY != "predictor" and oddti_policy is not None:
+        return policy_choice("bowl", prev_player_move, runs_left, score)
     if USE_PREDICTOR and random.random() > PREDICTOR_EPSILON:
         pred = predictor.predict(prev_player_move)
         # choose predicted value (aggressive)
@@ -134,14 +288,19 @@ def cpu_choose_when_bowling(prev_player_move):
     else:
         return random.choice(VALID_NUMS)
 
-def cpu_choose_when_batting(prev_player_move):
+def cpu_choose_when_batting(prev_player_move, runs_left=None, score=0):
     """
     CPU is batting (player bowling). CPU would like to avoid being out:
     predict player's likely bowl, and pick a different number to avoid equality.
     Also bias toward higher scoring numbers for competitiveness.
+    runs_left (chase only) lets target-aware batting schemes finish the game.
     """
+    if CPU_POLICY != "predictor" and oddti_policy is not None:
+        return policy_choice("bat", prev_player_move, runs_left, score)
     if USE_PREDICTOR and random.random() > PREDICTOR_EPSILON:
         pred = predictor.predict(prev_player_move)
+        if oddti_sampling is not None:
+            return oddti_sampling.get_sampler(BATTING_SCHEME).pick(pred, runs_left)
         # choose a number != pred, prefer higher numbers but keep some randomness
         candidates = [n for n in VALID_NUMS if n != pred]
         # weight by value: replicate values so larger numbers slightly more likely
@@ -153,60 +312,153 @@ def cpu_choose_when_batting(prev_player_move):
     else:
         return random.choice(VALID_NUMS)
 
+def policy_choice(role, prev_player_move, runs_left, score):
+    """One lookup in the policy table, blended with the predictor if chosen."""
+    if CPU_POLICY == "blend" and USE_PREDICTOR:
+        pred = predictor.predict(prev_player_move)
+        return policy_table().pick(role, runs_left, score, random, pred, POLICY_BLEND)
+    return policy_table().pick(role, runs_left, score)
+
+# -----------------------------
+# Players (strategies)
+# -----------------------------
+# Either side of a match is any object with:
+#   call_toss() -> "odd"/"even"        toss_number() -> 0-6
+#   elect() -> "bat"/"bowl"            play(role, runs_left) -> 0-6
+#   observe(role, own, other)          told both numbers after each ball
+# role is "bat" or "bowl"; runs_left is None outside a chase.
+# ODDTI2.py and oddti_strategy.py (random / replay / predictor bots)
+# use the same methods.
+# -----------------------------
+class HumanPlayer:
+    """Console player: the original prompts."""
+
+    def call_toss(self):
+        return choose_odd_or_even()
+
+    def toss_number(self):
+        return player_choose_number()
+
+    def elect(self):
+        return bat_or_ball_choice_for_player()
+
+    def play(self, role, runs_left):
+        if role == "bat":
+            return input_int_in_set("Enter your number (0–6): ", set(VALID_NUMS))
+        return input_int_in_set("Enter your bowl number (0–6): ", set(VALID_NUMS))
+
+    def observe(self, role, own, other):
+        pass
+
+
+class PredictorCPU:
+    """The computer: module predictor + USE_PREDICTOR/PREDICTOR_EPSILON settings."""
+
+    def __init__(self):
+        # first-innings score so far (for the policy table); a chase uses runs_left
+        self.score = 0
+        self.chasing = False
+
+    def call_toss(self):
+        return random.choice(("odd", "even"))
+
+    def toss_number(self):
+        return random.choice(VALID_NUMS)
+
+    def elect(self):
+        return random.choice(("bat", "bowl"))
+
+    def play(self, role, runs_left):
+        self.chasing = runs_left is not None
+        set_role = getattr(predictor, "set_role", None)
+        if set_role is not None:
+            # role-aware models keep the player's batting and bowling apart
+            set_role("bowl" if role == "bat" else "bat")
+        if role == "bowl":
+            # try to guess the player's bat (to get out)
+            return cpu_choose_when_bowling(predictor.last_player_move, runs_left, self.score)
+        # avoid the player's likely bowl
+        return cpu_choose_when_batting(predictor.last_player_move, runs_left, self.score)
+
+    def observe(self, role, own, other):
+        # learn from the player's number (for next ball)
+        predictor.update(predictor.last_player_move, other)
+        if own == other:
+            self.score = 0
+        elif not self.chasing:
+            self.score += own if role == "bat" else other
+
+
+HUMAN = HumanPlayer()
+CPU = PredictorCPU()
+
 # -----------------------------
 # Innings logic (uses predictor)
 # -----------------------------
 
-def play_innings(batting, target=None):
+def play_innings(batting, target=None, player=None, cpu=None):
+    player = player or HUMAN
+    cpu = cpu or CPU
     score = 0
-    print(f"\n--- {batting.upper()} INNINGS START ---")
-    prev_player_move = predictor.last_player_move  # help predictor by providing last seen
+    out(1, f"\n--- {batting.upper()} INNINGS START ---")
     while True:
+        runs_left = None if target is None else target + 1 - score
         if batting == "player":
-            p = input_int_in_set("Enter your number (0–6): ", set(VALID_NUMS))
-            # CPU selects bowl: try to guess player's number (to get out)
-            c = cpu_choose_when_bowling(prev_player_move)
-            print(f"Computer bowls: {c}")
-            # update predictor with player's move after we observe it (for next ball)
-            predictor.update(prev_player_move, p)
-            prev_player_move = p
+            p = player.play("bat", runs_left)
+            # CPU selects bowl
+            c = cpu.play("bowl", runs_left)
+            out(2, f"Computer bowls: {c}")
+            player.observe("bat", p, c)
+            cpu.observe("bowl", c, p)
+            log_event("ball", batting=batting, player=p, cpu=c,
+                      runs=0 if p == c else p, score=score + (0 if p == c else p))
             if p == c:
-                print("You're OUT!")
+                log_event("wicket", batting=batting, score=score)
+                out(2, "You're OUT!")
+                flush("ball")
                 break
             # scoring rule per your mod: only player's number counts (you changed earlier)
             score += p
-            print(f"Runs this ball: {p} | Total: {score}")
+            out(2, f"Runs this ball: {p} | Total: {score}")
             if target is not None:
                 runs_left = target + 1 - score
                 if runs_left <= 0:
-                    print("Target achieved! 🎯")
+                    out(2, "Target achieved! 🎯")
+                    flush("ball")
                     break
                 else:
-                    print(f"Runs required: {runs_left}")
+                    out(2, f"Runs required: {runs_left}")
+            flush("ball")
         else:
-            # Computer is batting
-            # CPU selects own bat number (tries to avoid being out using predictor)
-            c = cpu_choose_when_batting(prev_player_move)
-            # player bowls
-            p = input_int_in_set("Enter your bowl number (0–6): ", set(VALID_NUMS))
-            print(f"Computer bats: {c}")
-            # update predictor with player's bowl (player's action)
-            predictor.update(prev_player_move, p)
-            prev_player_move = p
+            # Computer is batting: it commits to its number before the player bowls
+            c = cpu.play("bat", runs_left)
+            p = player.play("bowl", runs_left)
+            out(2, f"Computer bats: {c}")
+            cpu.observe("bat", c, p)
+            player.observe("bowl", p, c)
+            log_event("ball", batting=batting, player=p, cpu=c,
+                      runs=0 if c == p else c, score=score + (0 if c == p else c))
             if c == p:
-                print("Computer is OUT!")
+                log_event("wicket", batting=batting, score=score)
+                out(2, "Computer is OUT!")
+                flush("ball")
                 break
             # scoring rule: only CPU's number counts when CPU batting
             score += c
-            print(f"Computer runs this ball: {c} | Total: {score}")
+            out(2, f"Computer runs this ball: {c} | Total: {score}")
             if target is not None:
                 runs_left = target + 1 - score
                 if runs_left <= 0:
-                    print("Computer reached the target! 🏏")
+                    out(2, "Computer reached the target! 🏏")
+                    flush("ball")
                     break
                 else:
-                    print(f"Computer needs {runs_left} runs more.")
-    print(f"--- {batting.upper()} INNINGS END: Score = {score} ---\n")
+                    out(2, f"Computer needs {runs_left} runs more.")
+            flush("ball")
+    save_player_model()
+    log_event("innings_end", batting=batting, score=score, target=target)
+    out(1, f"--- {batting.upper()} INNINGS END: Score = {score} ---\n")
+    flush("innings")
     return score
 
 # -----------------------------
@@ -214,98 +466,112 @@ def play_innings(batting, target=None):
 # -----------------------------
 
 def display_scorecard(player_score, computer_score, player_batted_first):
-    print("\n" + "="*36)
+    out(0, "\n" + "="*36)
     if player_batted_first:
-        print("Innings order: Player batted first  →  Computer chased")
+        out(0, "Innings order: Player batted first  →  Computer chased")
     else:
-        print("Innings order: Computer batted first  →  Player chased")
-    print("-"*36)
-    print(f"Player score    : {player_score}")
-    print(f"Computer score  : {computer_score}")
-    print("-"*36)
+        out(0, "Innings order: Computer batted first  →  Player chased")
+    out(0, "-"*36)
+    out(0, f"Player score    : {player_score}")
+    out(0, f"Computer score  : {computer_score}")
+    out(0, "-"*36)
     if player_score > computer_score:
-        print(f"Result: Player wins by {player_score - computer_score} runs.")
+        out(0, f"Result: Player wins by {player_score - computer_score} runs.")
     elif computer_score > player_score:
-        print(f"Result: Computer wins by {computer_score - player_score} runs.")
+        out(0, f"Result: Computer wins by {computer_score - player_score} runs.")
     else:
-        print("Result: Match tied!")
-    print("="*36 + "\n")
+        out(0, "Result: Match tied!")
+    out(0, "="*36 + "\n")
 
 def bat_or_ball_choice_for_player():
     return input_choice("You won toss. Choose to bat or bowl? (bat/bowl): ", ("bat", "bowl"))
 
-def single_match():
+def single_match(player=None, cpu=None):
+    player = player or HUMAN
+    cpu = cpu or CPU
     # Toss
-    player_parity = choose_odd_or_even()
-    toss_winner = toss(player_parity)
+    player_parity = player.call_toss()
+    toss_winner, choice = toss(player_parity, player, cpu)
 
     if toss_winner == "player":
-        choice = bat_or_ball_choice_for_player()
         player_bats_first = (choice == "bat")
     else:
-        comp_choice = random.choice(("bat", "bowl"))
-        print(f"Computer chooses to {comp_choice}.")
-        player_bats_first = (comp_choice != "bat")
+        player_bats_first = (choice != "bat")
 
     if player_bats_first:
-        print("You bat first.")
-        player_first_score = play_innings("player")
-        print(f"Computer needs {player_first_score + 1} to win.")
-        computer_second_score = play_innings("computer", target=player_first_score)
+        out(1, "You bat first.")
+        player_first_score = play_innings("player", None, player, cpu)
+        out(1, f"Computer needs {player_first_score + 1} to win.")
+        computer_second_score = play_innings("computer", player_first_score, player, cpu)
         player_score = player_first_score
         computer_score = computer_second_score
     else:
-        print("Computer bats first.")
-        computer_first_score = play_innings("computer")
-        print(f"You need {computer_first_score + 1} to win.")
-        player_second_score = play_innings("player", target=computer_first_score)
+        out(1, "Computer bats first.")
+        computer_first_score = play_innings("computer", None, player, cpu)
+        out(1, f"You need {computer_first_score + 1} to win.")
+        player_second_score = play_innings("player", computer_first_score, player, cpu)
         computer_score = computer_first_score
         player_score = player_second_score
 
     display_scorecard(player_score, computer_score, player_bats_first)
+    flush("match")
+    log_event("match_end", player=player_score, cpu=computer_score,
+              player_batted_first=player_bats_first)
     return player_score, computer_score, player_bats_first
 
-def best_of_three():
+def best_of_three(player=None, cpu=None):
     player_wins = 0
     comp_wins = 0
     match_no = 0
 
     while match_no < 3 and player_wins < 2 and comp_wins < 2:
         match_no += 1
-        print(f"\n=== SERIES: Match {match_no}/3 ===")
-        p_score, c_score, p_batted_first = single_match()
+        out(1, f"\n=== SERIES: Match {match_no}/3 ===")
+        p_score, c_score, p_batted_first = single_match(player, cpu)
         if p_score > c_score:
             player_wins += 1
-            print(f"Match {match_no} Winner: Player")
+            out(1, f"Match {match_no} Winner: Player")
         elif c_score > p_score:
             comp_wins += 1
-            print(f"Match {match_no} Winner: Computer")
+            out(1, f"Match {match_no} Winner: Computer")
         else:
-            print(f"Match {match_no}: Tie (no points)")
-        print(f"Series so far: Player {player_wins} - Computer {comp_wins}")
+            out(1, f"Match {match_no}: Tie (no points)")
+        out(1, f"Series so far: Player {player_wins} - Computer {comp_wins}")
 
-    print("\n=== SERIES COMPLETE ===")
+    log_event("series_end", player_wins=player_wins, cpu_wins=comp_wins, matches=match_no)
+    out(0, "\n=== SERIES COMPLETE ===")
     if player_wins > comp_wins:
-        print(f"You win the series {player_wins} - {comp_wins}! 🏆")
+        out(0, f"You win the series {player_wins} - {comp_wins}! 🏆")
     elif comp_wins > player_wins:
-        print(f"Computer wins the series {comp_wins} - {player_wins}! 🤖")
+        out(0, f"Computer wins the series {comp_wins} - {player_wins}! 🤖")
     else:
-        print("Series tied overall.")
-    print("========================\n")
+        out(0, "Series tied overall.")
+    out(0, "========================\n")
+    flush()
 
 # -----------------------------
 # CLI helper to manage predictor
 # -----------------------------
 
 def predictor_menu():
-    global USE_PREDICTOR, PREDICTOR_EPSILON, predictor
+    global USE_PREDICTOR, PREDICTOR_EPSILON, predictor, PLAYER_STORE, PLAYER_NAME
+    global BATTING_SCHEME, CPU_POLICY, POLICY_BLEND, VERBOSITY, FLUSH_EVERY
+    global LOG_EVENTS, EVENT_LOG, TRACK_STATS
     while True:
         print("\n-- Predictor Menu --")
         print(f"(1) Toggle predictor (currently {'ON' if USE_PREDICTOR else 'OFF'})")
         print(f"(2) Epsilon (randomness) = {PREDICTOR_EPSILON:.2f}")
         print("(3) Reset predictor memory")
         print("(4) Show top frequencies")
-        print("(5) Back")
+        print(f"(5) Model (currently {type(getattr(predictor, 'inner', predictor)).__name__})")
+        print(f"(6) Player profile (currently {PLAYER_NAME or 'none'})")
+        print(f"(7) CPU batting style (currently {BATTING_SCHEME})")
+        print(f"(8) Stats (currently {'ON' if METRICS is not None else 'OFF'})")
+        print(f"(9) CPU policy (currently {CPU_POLICY})")
+        print(f"(10) Output (verbosity {VERBOSITY}, written per {FLUSH_EVERY})")
+        print(f"(11) Event log (currently {'ON' if LOG_EVENTS else 'OFF'})")
+        print(f"(12) Career stats (currently {'ON' if TRACK_STATS else 'OFF'})")
+        print("(13) Back")
         ch = input("Choose: ").strip()
         if ch == "1":
             USE_PREDICTOR = not USE_PREDICTOR
@@ -328,6 +594,117 @@ def predictor_menu():
                 print("Markov row for last seen (", predictor.last_player_move, "):", predictor.markov[predictor.last_player_move])
             else:
                 print("No last move yet.")
+        elif ch == "5":
+            if oddti_predictors is None:
+                print("Extra models need oddti_predictors.py next to this file.")
+                continue
+            model = input_choice("Model (markov/ngram/decay/ensemble): ",
+                                 ("markov", "ngram", "decay", "ensemble"))
+            if model == "ngram":
+                k = input_int_in_set("Context length k (1-6): ", set(range(1, 7)))
+                predictor = oddti_predictors.NGramPredictor(order=k)
+            elif model == "decay":
+                h = input_int_in_set("Half-life in balls (1-500): ", set(range(1, 501)))
+                predictor = oddti_predictors.DecayingPredictor(half_life=h)
+            elif model == "ensemble":
+                predictor = oddti_predictors.EnsemblePredictor()
+            else:
+                predictor = ActivePredictor()
+            PLAYER_NAME = None
+            print("Predictor model:", type(predictor).__name__)
+        elif ch == "6":
+            if oddti_store is None:
+                print("Profiles need oddti_store.py next to this file.")
+                continue
+            name = input("Player name: ").strip()
+            if not name:
+                continue
+            if PLAYER_STORE is None:
+                PLAYER_STORE = oddti_store.ModelStore()
+            predictor = ActivePredictor()
+            try:
+                known = PLAYER_STORE.load_into(name, predictor)
+            except ValueError as e:
+                print(f"{e}. Pick a shorter name.")
+                continue
+            if known:
+                print(f"Welcome back, {name}! Model loaded.")
+            else:
+                print(f"New player {name}. Starting a fresh model.")
+            PLAYER_NAME = name
+        elif ch == "7":
+            if oddti_sampling is None:
+                print("Batting styles need oddti_sampling.py next to this file.")
+                continue
+            names = tuple(oddti_sampling.SCHEMES)
+            BATTING_SCHEME = input_choice(f"Style ({'/'.join(names)}): ", names)
+            print("CPU batting style:", BATTING_SCHEME)
+        elif ch == "8":
+            if oddti_metrics is None:
+                print("Stats need oddti_metrics.py next to this file.")
+                continue
+            game = sys.modules[__name__]
+            act = input_choice("Stats (on/off/show/dump/clear): ",
+                               ("on", "off", "show", "dump", "clear"))
+            if act == "on":
+                oddti_metrics.install(game)
+                print("Stats ON.")
+            elif act == "off":
+                oddti_metrics.uninstall(game)
+                print("Stats OFF.")
+            elif METRICS is None:
+                print("Stats are OFF. Choose 'on' first.")
+            elif act == "show":
+                print(oddti_metrics.report(METRICS))
+            elif act == "dump":
+                oddti_metrics.dump(METRICS, "oddti_metrics.json")
+                print("Stats written to oddti_metrics.json")
+            else:
+                METRICS.reset()
+                print("Stats cleared.")
+        elif ch == "9":
+            if oddti_policy is None:
+                print("Policies need oddti_policy.py next to this file.")
+                continue
+            CPU_POLICY = input_choice("Policy (predictor/table/blend): ",
+                                      ("predictor", "table", "blend"))
+            if CPU_POLICY == "blend":
+                v = input("Share of balls that follow the predictor (0.0 - 1.0): ").strip()
+                try:
+                    POLICY_BLEND = max(0.0, min(1.0, float(v)))
+                except ValueError:
+                    print("Invalid number, keeping", POLICY_BLEND)
+            if CPU_POLICY != "predictor" and POLICY is None:
+                print("Loading policy table...")
+                policy_table()
+            print("CPU policy:", CPU_POLICY)
+        elif ch == "10":
+            VERBOSITY = input_int_in_set("Verbosity (2 every ball, 1 innings, 0 summary only): ",
+                                         {0, 1, 2})
+            FLUSH_EVERY = input_choice("Write output per (line/ball/innings/match): ",
+                                       tuple(_FLUSH_RANK))
+            print(f"Output: verbosity {VERBOSITY}, written per {FLUSH_EVERY}")
+        elif ch == "11":
+            if oddti_events is None:
+                print("The event log needs oddti_events.py next to this file.")
+                continue
+            LOG_EVENTS = not LOG_EVENTS
+            if LOG_EVENTS:
+                print(f"Event log ON, writing {oddti_events.DEFAULT_PATH}")
+            else:
+                if EVENT_LOG is not None:
+                    EVENT_LOG.close()
+                    EVENT_LOG = None
+                print("Event log OFF.")
+        elif ch == "12":
+            if oddti_stats is None:
+                print("Career stats need oddti_stats.py next to this file.")
+                continue
+            TRACK_STATS = not TRACK_STATS
+            if TRACK_STATS:
+                print(f"Career stats ON, saved to {oddti_stats.DEFAULT_PATH} after each match")
+            else:
+                print("Career stats OFF.")
         else:
             break
 
@@ -341,14 +718,27 @@ def main():
         print("\n(1) Single Match")
         print("(2) Best of 3 Series")
         print("(3) Predictor Menu")
-        print("(4) Quit")
-        choice = input("Choose (1/2/3/4): ").strip()
+        print("(4) Leaderboard")
+        print("(5) Quit")
+        choice = input("Choose (1/2/3/4/5): ").strip()
         if choice == "1":
             single_match()
         elif choice == "2":
             best_of_three()
         elif choice == "3":
             predictor_menu()
+        elif choice == "4":
+            if oddti_stats is None:
+                print("The leaderboard needs oddti_stats.py next to this file.")
+            elif STATS_FEED is not None:
+                oddti_stats.print_board(STATS_FEED.board)
+            else:
+                try:
+                    board = oddti_stats.Leaderboard.load()
+                except (OSError, ValueError) as e:
+                    print(f"Could not read the leaderboard ({e}).")
+                else:
+                    oddti_stats.print_board(board)
         else:
             print("Exiting. ⚡GPN⚡ out.")
             break